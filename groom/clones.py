@@ -0,0 +1,178 @@
+"""
+token-level clone detection
+
+Sources are lexed into TokenBuffers whose type ids are the normalised token
+stream: identifiers and literals only keep their type, so renamed copies
+still match. Every k-gram of the stream gets a rolling hash, and winnowing
+keeps the smallest hash of each window as the fingerprints of the source.
+An inverted index maps the fingerprints to where they are found, shared
+fingerprints lined up on the same diagonal are merged into clones.
+
+Run ``python -m groom.clones PATH...`` to report the clones of source trees.
+"""
+import argparse
+import os
+import sys
+from collections import defaultdict, deque, namedtuple
+
+from groom.lextree import lex_tree
+from groom.tokenbuffer import TokenBuffer
+
+# tokens per hashed k-gram
+K = 20
+# hashes per winnowing window: copies of at least K + WINDOW - 1 tokens are
+# always found
+WINDOW = 12
+MIN_TOKENS = 50
+# fingerprints found more often are boilerplate, not clones
+MAX_OCCURRENCES = 50
+
+_base = 257
+_modulus = (1 << 61) - 1
+
+Fragment = namedtuple("Fragment", "name start end lineno end_lineno")
+Clone = namedtuple("Clone", "length first second")
+
+
+def fingerprints(types, k=K, window=WINDOW):
+    """
+    the winnowed ``(hash, position)`` fingerprints of the token type ids
+    ``types``, ``position`` being where the hashed k-gram starts
+    """
+    if len(types) < k:
+        return []
+    drop = pow(_base, k - 1, _modulus)
+    h = 0
+    for type_id in types[:k]:
+        h = (h * _base + type_id) % _modulus
+    selected = []
+    queue = deque()
+    for pos in range(len(types) - k + 1):
+        if pos:
+            h = ((h - types[pos - 1] * drop) * _base +
+                 types[pos + k - 1]) % _modulus
+        # keep the rightmost minimum of the window
+        while queue and queue[-1][0] >= h:
+            queue.pop()
+        queue.append((h, pos))
+        if queue[0][1] <= pos - window:
+            queue.popleft()
+        if pos >= window - 1 or pos == len(types) - k:
+            if not selected or selected[-1][1] != queue[0][1]:
+                selected.append(queue[0])
+    return selected
+
+
+class CloneIndex(object):
+    def __init__(self, k=K, window=WINDOW):
+        self.k = k
+        self.window = window
+        self.names = []
+        self.buffers = []
+        self.index = defaultdict(list)
+
+    def add(self, name, source):
+        """lex and index str or bytes-like ``source``"""
+        self.add_buffer(name, TokenBuffer.lex(source, diagnostics=[]))
+
+    def add_buffer(self, name, buffer):
+        """index the tokens of TokenBuffer ``buffer``"""
+        doc = len(self.buffers)
+        self.names.append(name)
+        self.buffers.append(buffer)
+        for h, pos in fingerprints(buffer.types, self.k, self.window):
+            self.index[h].append((doc, pos))
+
+    def _fragment(self, doc, start, end):
+        linenos = self.buffers[doc].linenos
+        return Fragment(self.names[doc], start, end, linenos[start],
+                        linenos[end - 1])
+
+    def _extend(self, doc, other, delta, start, end):
+        # winnowing may miss up to a window of tokens at both ends
+        types = self.buffers[doc].types
+        other_types = self.buffers[other].types
+        while (start > 0 and start + delta > 0 and
+               types[start - 1] == other_types[start - 1 + delta]):
+            start -= 1
+        limit = min(len(types), len(other_types) - delta)
+        if doc == other:
+            limit = min(limit, start + delta)
+        while end < limit and types[end] == other_types[end + delta]:
+            end += 1
+        return start, end
+
+    def clones(self, min_tokens=MIN_TOKENS, max_occurrences=MAX_OCCURRENCES):
+        """the clones of at least ``min_tokens`` tokens, longest first"""
+        diagonals = defaultdict(list)
+        for places in self.index.values():
+            if len(places) < 2 or len(places) > max_occurrences:
+                continue
+            for i, (doc, pos) in enumerate(places):
+                for other, other_pos in places[i + 1:]:
+                    if doc == other and other_pos - pos < self.k:
+                        continue
+                    diagonals[doc, other, other_pos - pos].append(pos)
+        clones = []
+        for (doc, other, delta), starts in diagonals.items():
+            starts.sort()
+            first = last = starts[0]
+            end = -1
+            for pos in starts[1:] + [None]:
+                if pos is not None and pos - last <= self.window:
+                    last = pos
+                    continue
+                if first < end:
+                    # already in the previous clone, once extended
+                    first = last = pos
+                    continue
+                start, end = self._extend(doc, other, delta, first,
+                                          last + self.k)
+                if end - start >= min_tokens:
+                    clones.append(Clone(
+                        end - start, self._fragment(doc, start, end),
+                        self._fragment(other, start + delta, end + delta)))
+                first = last = pos
+        clones.sort(key=lambda clone: (-clone.length, clone.first))
+        return clones
+
+
+def find_clones(paths, min_tokens=MIN_TOKENS, k=K, window=WINDOW,
+                workers=None):
+    """
+    the clones in the .pony files under ``paths`` (files or trees), trees
+    being lexed by ``workers`` processes (see groom.lextree.lex_tree)
+    """
+    index = CloneIndex(k, window)
+    for path in paths:
+        if os.path.isdir(path):
+            for result in lex_tree(path, workers, buffers=True, recover=True):
+                if result.buffer is not None:
+                    index.add_buffer(result.path, result.buffer)
+        else:
+            with open(path, "rb") as src:
+                index.add(path, src.read())
+    return index.clones(min_tokens)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m groom.clones",
+        description="find copy-pasted code in .pony files")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("-m", "--min-tokens", type=int, default=MIN_TOKENS,
+                        help="minimal clone length in tokens")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of lexing processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    clones = find_clones(args.paths, args.min_tokens, workers=args.jobs)
+    for clone in clones:
+        print("{} tokens: {}:{}-{} {}:{}-{}".format(
+            clone.length,
+            clone.first.name, clone.first.lineno, clone.first.end_lineno,
+            clone.second.name, clone.second.lineno, clone.second.end_lineno))
+    return 1 if clones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # pragma: no cover
@@ -0,0 +1,141 @@
+"""
+syntax highlighting
+
+The tokens of a source are classified into spans ``(start, end, class)``,
+one per token, whitespace included: class is one of CLASSES, or None for
+plain text (whitespace, identifiers). Spans render to ANSI or HTML.
+
+A Highlighter follows the edits of a source: only the tokens relexed by an
+edit are classified again, and the edit tells which spans changed. The span
+offsets are the ones of the tokens of its IncrementalLexer, nothing is
+renumbered after an edit.
+"""
+from html import escape
+
+from groom.incremental import IncrementalLexer
+from groom.lexer import LEXERROR, iter_spans, literals, reserved
+
+CLASSES = ("keyword", "capability", "literal", "string", "comment", "type",
+           "operator", "error")
+
+classes = dict.fromkeys(reserved.values(), "keyword")
+classes.update(dict.fromkeys(literals, "operator"))
+classes.update({
+    "CAP": "capability",
+    "GENCAP": "capability",
+    "TRUE": "literal",
+    "FALSE": "literal",
+    "INT": "literal",
+    "FLOAT": "literal",
+    "STRING": "string",
+    "LINECOMMENT": "comment",
+    "NESTEDCOMMENT": "comment",
+    "BIG_ARROW": "operator",
+    "SMALL_ARROW": "operator",
+    "BACKSLASH": "operator",
+    "PLUS": "operator",
+    "IS_SUBTYPE": "operator",
+    "MINUS": "operator",
+    "MINUS_TILDE": "operator",
+    "LPAREN": "operator",
+    "LSQUARE": "operator",
+    LEXERROR: "error",
+})
+
+ANSI = {
+    "keyword": "\x1b[1;34m",
+    "capability": "\x1b[35m",
+    "literal": "\x1b[36m",
+    "string": "\x1b[32m",
+    "comment": "\x1b[2m",
+    "type": "\x1b[33m",
+    "operator": "\x1b[1m",
+    "error": "\x1b[41m",
+}
+ANSI_RESET = "\x1b[0m"
+
+
+def classify(spans, source):
+    """the highlighting spans of the ``(type, lineno, start, end)`` spans"""
+    get = classes.get
+    for type_, lineno, start, end in spans:
+        if type_ == "ID":
+            # types are capitalised, after the underscore of private ones
+            first = source[start]
+            if first == "_":
+                first = source[start + 1:start + 2]
+            yield start, end, "type" if first.isupper() else None
+        else:
+            yield start, end, get(type_)
+
+
+def highlight(source):
+    """the highlighting spans of str ``source``, lexing errors included"""
+    return list(classify(iter_spans(source, (), diagnostics=[]), source))
+
+
+def to_ansi(source, spans):
+    """``source`` with ANSI escape codes"""
+    parts = []
+    append = parts.append
+    for start, end, class_ in spans:
+        if class_ is None:
+            append(source[start:end])
+        else:
+            append(ANSI[class_])
+            append(source[start:end])
+            append(ANSI_RESET)
+    return "".join(parts)
+
+
+def to_html(source, spans, prefix="pony-"):
+    """``source`` as HTML, classified spans in ``<span class=...>``"""
+    parts = ['<pre class="{}source">'.format(prefix)]
+    append = parts.append
+    for start, end, class_ in spans:
+        text = escape(source[start:end], False)
+        if class_ is None:
+            append(text)
+        else:
+            append('<span class="{}{}">{}</span>'.format(prefix, class_, text))
+    append("</pre>")
+    return "".join(parts)
+
+
+class Highlighter(object):
+    def __init__(self, source):
+        self.lexer = IncrementalLexer(source, recover=True)
+        # the classes of the tokens, their offsets are kept by the lexer
+        self._classes = [class_ for start, end, class_
+                         in classify(self.lexer.spans(), source)]
+
+    @property
+    def source(self):
+        return self.lexer.lexdata
+
+    @property
+    def spans(self):
+        """the highlighting spans of the source"""
+        return [(start, end, class_) for (type_, lineno, start, end), class_
+                in zip(self.lexer.spans(), self._classes)]
+
+    def edit(self, offset, removed, inserted):
+        """
+        replace ``removed`` characters at ``offset`` with ``inserted``.
+        Return ``(index, old_count, spans)``: the ``old_count`` spans from
+        ``index`` were replaced by ``spans``. The spans after them keep
+        their class but their offsets moved with the edit.
+        """
+        index, old_count, new_count = self.lexer.edit(offset, removed,
+                                                      inserted)
+        spans = list(classify(self.lexer.spans(index, index + new_count),
+                              self.source))
+        self._classes[index:index + old_count] = [
+            class_ for start, end, class_ in spans]
+        return index, old_count, spans
+
+    def ansi(self):
+        return to_ansi(self.source, self.spans)
+
+    def html(self, prefix="pony-"):
+        return to_html(self.source, self.spans, prefix)
@@ -0,0 +1,125 @@
+"""
+incremental relexing
+
+An IncrementalLexer keeps the tokens of a source being edited. An edit only
+relexes the tokens around it, until the new tokens fall in step with the old
+ones again.
+
+The tokens are kept on both sides of a gap, like the text of a gap buffer:
+tokens before the gap hold their offset and line number, tokens after it
+hold them relative to the end of the source, in reverse order. As edits
+move the gap only across the tokens near them, nothing is renumbered after
+an edit.
+"""
+from groom.lexer import BufferToken, LEXERROR, LOOKAHEAD, TRIVIA, iter_spans
+
+
+class IncrementalLexer(object):
+    def __init__(self, data, recover=False):
+        self.lexdata = data
+        # on errors, LEXERROR tokens instead of exceptions
+        self.recover = recover
+        self._before = list(iter_spans(data, (), diagnostics=self._errors()))
+        self._after = []
+        self._errors_before = sum(span[0] == LEXERROR for span in self._before)
+        self._lines = data.count("\n")
+
+    def _errors(self):
+        return [] if self.recover else None
+
+    def __len__(self):
+        return len(self._before) + len(self._after)
+
+    def spans(self, first=0, last=None):
+        """
+        yield ``(type, lineno, start, end)`` for the tokens from index
+        ``first`` to ``last`` (excluded), all of them by default
+        """
+        before, after = self._before, self._after
+        count = len(before) + len(after)
+        last = count if last is None else min(last, count)
+        yield from before[first:last]
+        length = len(self.lexdata)
+        lines = self._lines
+        # after the gap, token i is after[count - 1 - i]
+        for i in range(count - 1 - max(first, len(before)), count - 1 - last,
+                       -1):
+            type_, lineno, start, end = after[i]
+            yield type_, lineno + lines, start + length, end + length
+
+    def iter_tokens(self, skip=TRIVIA, trivia=None):
+        """
+        yield the tokens, dropping the token types in ``skip`` or recording
+        them in ``trivia``
+        """
+        for type_, lineno, start, end in self.spans():
+            if type_ not in skip:
+                yield BufferToken(type_, lineno, start, end, self)
+            elif trivia is not None:
+                trivia.append(type_, start, end)
+
+    def __iter__(self):
+        return self.iter_tokens(())
+
+    def _move_gap(self, offset):
+        # Put in front of the gap the tokens that can't be changed by an
+        # edit at ``offset``: those ending far enough before it to be out of
+        # reach of the lexer lookahead.
+        before, after = self._before, self._after
+        length = len(self.lexdata)
+        lines = self._lines
+        # Where a string or a comment is unterminated, the text after the
+        # edit can end it: relex from the first error token.
+        errors = self._errors_before
+        while before and (errors or before[-1][3] + LOOKAHEAD > offset):
+            type_, lineno, start, end = before.pop()
+            errors -= type_ == LEXERROR
+            after.append((type_, lineno - lines, start - length, end - length))
+        while (after and after[-1][3] + length + LOOKAHEAD <= offset and
+               after[-1][0] != LEXERROR):
+            type_, lineno, start, end = after.pop()
+            before.append((type_, lineno + lines, start + length, end + length))
+        self._errors_before = errors
+
+    def edit(self, offset, removed, inserted):
+        """
+        replace ``removed`` characters at ``offset`` with ``inserted`` and
+        relex. Return ``(index, old_count, new_count)``: the ``old_count``
+        tokens from ``index`` were replaced by ``new_count`` tokens. On
+        lexing errors the lexer is left unchanged, unless it recovers.
+        """
+        self._move_gap(offset)
+        data = self.lexdata
+        new_data = data[:offset] + inserted + data[offset + removed:]
+        length = len(new_data)
+        lines = (self._lines + inserted.count("\n") -
+                 data.count("\n", offset, offset + removed))
+        after = self._after
+        if self._before:
+            type_, lineno, start, pos = self._before[-1]
+            lineno += data.count("\n", start, pos)
+        else:
+            lineno, pos = 1, 0
+        # the text after ``edited`` is the old text shifted, once a token
+        # starts there on an old token start, the rest is unchanged
+        edited = offset + len(inserted)
+        new = []
+        old = len(after)
+        for span in iter_spans(new_data, (), pos, lineno,
+                               diagnostics=self._errors()):
+            start = span[2]
+            while old and after[old - 1][2] + length < start:
+                old -= 1
+            if start >= edited and old and after[old - 1][2] + length == start:
+                break
+            new.append(span)
+        else:
+            old = 0
+        index = len(self._before)
+        old_count = len(after) - old
+        del after[old:]
+        self._before.extend(new)
+        self._errors_before += sum(span[0] == LEXERROR for span in new)
+        self.lexdata = new_data
+        self._lines = lines
+        return index, old_count, len(new)
@@ -6,16 +6,33 @@ WIP!!!
 This lexes the whole pony standard library... but the correctness is still
 to be proven
 
-TODO:
-    - nested commnents (/* /* */ */)
-      Did not search about recursive lexer rules...
-    - error handling (define t_error)
-
+The PLY lexer is only built on first use. Its tables are read from the
+generated ``groom.lextab`` module when it matches the rules below, run
+``python -m groom.lexer`` to regenerate it after changing them. The same
+rules also drive a native engine (NativeLexer, see lex_raw) which does not
+build the PLY lexer at all.
 
+Strings and comments are not lexed by regexes: their rules only match the
+opening delimiter and hand over to a linear scanner, which also handles real
+nested comments (/* /* */ */).
 """
-from io import IOBase
+import hashlib
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from io import IOBase, TextIOBase
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_constants
+    import sre_parse
 
-from ply.lex import TOKEN, LexError
+from ply.lex import TOKEN, LexError, LexToken, __tabversion__
+from ply.lex import Lexer as PlyLexer
 from ply.lex import lex as plylex
 
 
@@ -95,49 +112,78 @@ tokens = [
     "PLUS",
     "IS_SUBTYPE",
     "MINUS",
-    "MINUS_NEW",
     "LPAREN",
-    "LPAREN_NEW",
     "LSQUARE",
-    "LSQUARE_NEW",
     "MINUS_TILDE",
+    # not lexed: the parser types the tokens above *_NEW from their newline
+    # flag (see NEWLINE_TYPES)
+    "MINUS_NEW",
+    "LPAREN_NEW",
+    "LSQUARE_NEW",
     "MINUS_TILDE_NEW",
 ] + list(set(reserved.values()))
 
+# tokens that never reach the parser
+TRIVIA = frozenset(("WS", "LINECOMMENT", "NESTEDCOMMENT"))
+
+# tokens that may span several lines (a char literal can hold a newline)
+MULTILINE = frozenset(("STRING", "NESTEDCOMMENT", "WS", "INT"))
+
+# tokens with a ``newline`` flag, set when they are the first token of their
+# line: the parser tells apart a new expression from the continuation of
+# the previous one with it
+NEWLINE_TYPES = frozenset(("LPAREN", "LSQUARE", "MINUS", "MINUS_TILDE"))
+
 literals = ":()[]{}=.!@|,;^?<>~*/%#&"
+
+# type of the tokens covering the source skipped after an error, when
+# recovering from errors
+LEXERROR = "LEXERROR"
+
+# stable integer ids of the token types, type_names[id] is the type name
+type_names = tuple(sorted(set(tokens))) + tuple(literals) + (LEXERROR,)
+type_ids = {name: i for i, name in enumerate(type_names)}
+
+
+class SymbolTable(dict):
+    """
+    maps every word lexed so far to its token type and to a single shared
+    copy of its text, so classifying a word and interning it is one lookup.
+    """
+    def __init__(self):
+        super().__init__((word, (type_, word))
+                         for word, type_ in reserved.items())
+
+    def __missing__(self, word):
+        entry = self[word] = ("ID", word)
+        return entry
+
 HEX = r'[0-9a-zA-Z]'
 HEX_ESC = f"(\\\\x{HEX}{{2}})"
 UNICODE_ESC = f"(\\\\u{HEX}{{4}})"
 UNICODE2_ESC = f"(\\\\U{HEX}{{6}})"
 ESC = (r'((\\(a|b|e|f|n|r|t|v|\\|0))|(\\t) '
        + f'{HEX_ESC}|{UNICODE_ESC}|{UNICODE2_ESC})')
-SINGLE_STRING_CHARS = r'((\\")|' + ESC + '|[^"])*'
-TRIPLE_STRING_CHARS = r'(' + ESC + '|[^"]|("(?="""))|("(?!"")))*'
-TRIPLE_STRING = r'("""' + TRIPLE_STRING_CHARS + r'""")'
-SINGLE_STRING = r'("' + SINGLE_STRING_CHARS + '")'
-STRING = f"{TRIPLE_STRING} | {SINGLE_STRING}"
+# opening delimiters, the rest is found by scan_string/scan_nested_comment
+STRING = r'"'
 
 CHAR_CHAR = r"((\\')|[^\\']|" + ESC + ")"
 
 LETTER = r'[a-zA-Z]'
 DIGIT = r'[0-9]'
 
-ID = f"({LETTER}|_) ({LETTER}|{DIGIT}|_|')*"
+ID = "[a-zA-Z_][a-zA-Z0-9_']*"
 
-NEWLINE = r'(\n(\r|\s)*)'
+NEWLINE = r'(\n\s*)'
 WS = f"({ NEWLINE }) | \\s+"
 
-NESTEDCOMMENT = r'/\* ( [^*] | \*(?!/) )* \*/'
+NESTEDCOMMENT = r'/\*'
 t_LINECOMMENT = r'//[^\n]+'
 
-LPAREN_NEW = f'( {NEWLINE} \\( )'
 LPAREN = r'\('
-LSQUARE_NEW = f'( {NEWLINE} \\[ )'
 LSQUARE = r'\['
-MINUS_NEW = f' {NEWLINE} -'
 MINUS = '-'
 MINUS_TILDE = '-~'
-MINUS_TILDE_NEW = f' {NEWLINE} -~'
 
 t_BIG_ARROW = r'=>'
 SMALL_ARROW = r'->'
@@ -145,10 +191,11 @@ t_BACKSLASH = r'\\'
 t_PLUS = r'\+'
 t_IS_SUBTYPE = '<:'
 
-EXP = f'(e|E)(\\+|-)?({DIGIT}|_)+'
-FLOAT = f'{DIGIT}({DIGIT}|_)*(\.{DIGIT}({DIGIT}|_)*)?({EXP})?'
+EXP = '[eE][+-]?[0-9_]+'
+FLOAT = f'{DIGIT}[0-9_]*(\\.{DIGIT}[0-9_]*)?({EXP})?'
 
-DEC_INT = f"({DIGIT}({DIGIT}|_)*(?![.eE]))"
+# a decimal int is not the start of a float
+DEC_INT = f"({DIGIT}[0-9_]*(?![0-9_.eE]))"
 HEX_INT = f"(0x[0-9a-fA-F_]+)"
 BIN_INT = f"(0b[01_]+)"
 CHAR_INT = f"('{CHAR_CHAR}')"
@@ -157,20 +204,259 @@ INT = f"{CHAR_INT}|{BIN_INT}|{HEX_INT}|{DEC_INT}"
 t_GENCAP = "(\\#{})".format(")|(\\#".join(["read", "send", "share", "alias", "any"]))
 
 
-@TOKEN(STRING)
-def t_STRING(t):
+# the characters matched by \s in str patterns
+_unicode_spaces = ("\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+                   "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007"
+                   "\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000")
+
+# the fragments of the rules matching a single character, and what matches
+# the same characters encoded in UTF-8
+_binary_fragments = {
+    r"\s": "(?:[{}]|{})".format(
+        "".join("\\x{:02x}".format(ord(c)) for c in _unicode_spaces
+                if c < "\x80"),
+        "|".join("".join("\\x{:02x}".format(b) for b in c.encode())
+                 for c in _unicode_spaces if c >= "\x80")),
+    r"[^\\']": r"(?:[^\\'\x80-\xff]|[\xc0-\xff][\x80-\xbf]+)",
+}
+
+
+def _binary_pattern(pattern):
+    """
+    the bytes pattern matching the UTF-8 encoding of what the str
+    ``pattern`` matches
+    """
+    return re.sub(r"\[\^\\\\'\]|\\.",
+                  lambda m: _binary_fragments.get(m.group(), m.group()),
+                  pattern).encode()
+
+
+def _compile(pattern):
+    """compile ``pattern`` for str data and for bytes-like data"""
+    return (re.compile(pattern, re.S),
+            re.compile(_binary_pattern(pattern), re.S))
+
+
+# a triple quoted string ends on the first run of 3 or more quotes (the
+# extra quotes belong to the string), escapes only matter in single quoted
+# strings. Neither pattern can backtrack more than once per character.
+_string = _compile(r'"""(?:.*?)""""*|"(?!"")(?:[^"\\]|\\.)*"')
+_comment_delimiter = _compile(r'(/\*)|\*/')
+_newline = _compile("\n")
+
+
+def scan_string(data, pos):
+    """
+    return the end offset of the string literal starting at ``pos``, or -1
+    if it is not terminated.
+    """
+    m = _string[not isinstance(data, str)].match(data, pos)
+    return -1 if m is None else m.end()
+
+
+def scan_nested_comment(data, pos):
+    """
+    return the end offset of the (possibly nested) comment starting at
+    ``pos``, or -1 if it is not terminated.
+    """
+    depth = 0
+    search = _comment_delimiter[not isinstance(data, str)].search
+    m = search(data, pos)
+    while m is not None:
+        depth += 1 if m.lastindex else -1
+        if depth == 0:
+            return m.end()
+        m = search(data, m.end())
+    return -1
+
+
+scanners = {
+    "STRING": scan_string,
+    "NESTEDCOMMENT": scan_nested_comment,
+}
+
+
+def _unterminated_from(data, pos):
+    """
+    the offset after which no string is terminated, as the string at
+    ``pos`` is not: a single quoted string only fails when no unescaped
+    quote follows it. None for a triple quoted string, after which a single
+    quoted string can still end. The strings after that offset are not
+    scanned to the end of the data again when recovering.
+    """
+    triple = '"""' if isinstance(data, str) else b'"""'
+    return None if data[pos:pos + 3] == triple else pos
+
+
+def _known_unterminated(type_, pos, unterminated):
+    """whether the token at ``pos`` follows an unterminated string"""
+    return (type_ == "STRING" and unterminated is not None and
+            pos > unterminated)
+
+
+def _scan_lexer(lexer, type_, pos):
+    """
+    the end offset of the string or comment at ``pos`` of the data of the
+    PLY ``lexer``, -1 if it is not terminated
+    """
+    data, unterminated = getattr(lexer, "_unterminated", (None, None))
+    if data is not lexer.lexdata:
+        data, unterminated = lexer.lexdata, None
+    if _known_unterminated(type_, pos, unterminated):
+        return -1
+    end = scanners[type_](data, pos)
+    if end < 0 and type_ == "STRING" and unterminated is None:
+        lexer._unterminated = (data, _unterminated_from(data, pos))
+    return end
+
+
+def starts_line(data, pos):
+    """
+    whether the token at ``pos`` of str or bytes-like ``data`` is the first
+    of its line: only whitespace, with a newline, comes before it since the
+    previous token.
+    """
+    binary = not isinstance(data, str)
+    pos -= 1
+    while pos >= 0:
+        char = data[pos]
+        if binary:
+            end = pos + 1
+            # back to the first byte of the UTF-8 encoded character
+            while char & 0xc0 == 0x80 and pos > 0:
+                pos -= 1
+                char = data[pos]
+            char = bytes(data[pos:end]).decode(errors="replace")
+        if char == "\n":
+            return True
+        if not char.isspace():
+            return False
+        pos -= 1
+    return False
+
+
+class LineIndex(object):
+    """
+    the offsets where the lines of str or bytes-like ``data`` start, to turn
+    offsets into line numbers and columns (both 1-based).
+    """
+    def __init__(self, data):
+        newline = _newline[not isinstance(data, str)]
+        self.starts = array("L", [0])
+        self.starts.extend(m.end() for m in newline.finditer(data))
+
+    def lineno(self, offset):
+        return bisect_right(self.starts, offset)
+
+    def column(self, offset):
+        return offset - self.starts[bisect_right(self.starts, offset) - 1] + 1
+
+    def position(self, offset):
+        lineno = bisect_right(self.starts, offset)
+        return lineno, offset - self.starts[lineno - 1] + 1
+
+
+def line_index(lexer):
+    """the LineIndex of the data of ``lexer``, built on first use"""
+    data, index = getattr(lexer, "_line_index", (None, None))
+    if data is not lexer.lexdata:
+        data = lexer.lexdata
+        index = LineIndex(data)
+        lexer._line_index = (data, index)
+    return index
+
+
+class PonyLexError(LexError):
+    """LexError telling the position of the error"""
+    def __init__(self, message, text, lineno, column, lexpos=None):
+        super().__init__("Error at line {}, column {}: {}".format(
+            lineno, column, message), text)
+        self.message = message
+        self.lineno = lineno
+        self.column = column
+        self.lexpos = lexpos
+
+    def __reduce__(self):
+        return (type(self), (self.message, self.text, self.lineno,
+                             self.column, self.lexpos))
+
+
+def _unterminated(lineno, column, type_, data, pos):
+    return PonyLexError("unterminated {}".format(type_), data[pos:pos + 20],
+                        lineno, column, pos)
+
+
+def _illegal(lineno, column, data, pos):
+    char = data[pos:pos + 1]
+    if not isinstance(char, str):
+        # the whole UTF-8 encoded character, the byte if it is not valid
+        decoded = bytes(data[pos:pos + 4]).decode(errors="replace")[0]
+        char = bytes(char) if decoded == "\ufffd" else decoded
+    return PonyLexError(repr(char), "", lineno, column, pos)
+
+
+def _report(error, diagnostics):
+    """raise ``error``, or collect it in ``diagnostics`` when recovering"""
+    if diagnostics is None:
+        raise error
+    diagnostics.append(error)
+
+
+def _resync(data, pos, type_):
+    """
+    where lexing resumes after an error at ``pos``: the end of the line of
+    an unterminated string, the end of the data for an unterminated
+    comment, after the illegal characters otherwise.
+    """
+    binary = not isinstance(data, str)
+    if type_ == "STRING":
+        m = _newline[binary].search(data, pos)
+        return len(data) if m is None else m.start()
+    if type_ is not None:
+        return len(data)
+    master = _get_master(binary)
+    end = pos + 1
+    while end < len(data) and _match(master, data, end)[0] is None:
+        end += 1
+    return end
+
+
+def _recover(t, end):
+    t.type = LEXERROR
+    t.value = t.lexer.lexdata[t.lexpos:end]
     t.lexer.lineno += t.value.count("\n")
+    t.lexer.lexpos = end
     return t
 
 
-@TOKEN(NESTEDCOMMENT)
-def t_NESTEDCOMMENT(t):
+def _scan(t):
+    end = _scan_lexer(t.lexer, t.type, t.lexpos)
+    if end < 0:
+        t.lexer.lexpos = t.lexpos
+        _report(_unterminated(t.lexer.lineno,
+                              line_index(t.lexer).column(t.lexpos), t.type,
+                              t.lexer.lexdata, t.lexpos),
+                t.lexer.diagnostics)
+        return _recover(t, _resync(t.lexer.lexdata, t.lexpos, t.type))
+    t.value = t.lexer.lexdata[t.lexpos:end]
     t.lexer.lineno += t.value.count("\n")
+    t.lexer.lexpos = end
     return t
 
 
+@TOKEN(STRING)
+def t_STRING(t):
+    return _scan(t)
+
+
+@TOKEN(NESTEDCOMMENT)
+def t_NESTEDCOMMENT(t):
+    return _scan(t)
+
+
 @TOKEN(INT)
 def t_INT(t):
+    t.lexer.lineno += t.value.count("\n")
     return t
 
 
@@ -179,25 +465,15 @@ def t_FLOAT(t):
     return t
 
 
-@TOKEN(LPAREN_NEW)
-def t_LPAREN_NEW(t):
-    t.lexer.lineno += t.value.count("\n")
-    return t
-
-
 @TOKEN(LPAREN)
 def t_LPAREN(t):
-    return t
-
-
-@TOKEN(LSQUARE_NEW)
-def t_LSQUARE_NEW(t):
-    t.lexer.lineno += t.value.count("\n")
+    t.newline = starts_line(t.lexer.lexdata, t.lexpos)
     return t
 
 
 @TOKEN(LSQUARE)
 def t_LSQUARE(t):
+    t.newline = starts_line(t.lexer.lexdata, t.lexpos)
     return t
 
 
@@ -206,25 +482,15 @@ def t_SMALL_ARROW(t):
     return t
 
 
-@TOKEN(MINUS_TILDE_NEW)
-def t_MINUS_TILDE_NEW(t):
-    t.lexer.lineno += t.value.count("\n")
-    return t
-
-
 @TOKEN(MINUS_TILDE)
 def t_MINUS_TILDE(t):
-    return t
-
-
-@TOKEN(MINUS_NEW)
-def t_MINUS_NEW(t):
-    t.lexer.lineno += t.value.count("\n")
+    t.newline = starts_line(t.lexer.lexdata, t.lexpos)
     return t
 
 
 @TOKEN(MINUS)
 def t_MINUS(t):
+    t.newline = starts_line(t.lexer.lexdata, t.lexpos)
     return t
 
 
@@ -236,39 +502,803 @@ def t_WS(t):
 
 @TOKEN(ID)
 def t_ID(t):
-    t.type = reserved.get(t.value, "ID")
+    t.type, t.value = t.lexer.symbols[t.value]
     return t
 
 
 def t_error(t):
-    raise LexError("Error at line {}: {}".format(
-        t.lexer.lineno, repr(t.lexer.lexdata[t.lexer.lexpos])), "")
+    lexer = t.lexer
+    _report(_illegal(lexer.lineno, line_index(lexer).column(lexer.lexpos),
+                     lexer.lexdata, lexer.lexpos),
+            lexer.diagnostics)
+    t.lexpos = lexer.lexpos
+    return _recover(t, _resync(lexer.lexdata, lexer.lexpos, None))
 
 
-raw_lexer = plylex()
+def rules_signature():
+    """hash of everything the lexer tables are built from"""
+    rules = sorted(
+        (name, value if isinstance(value, str) else getattr(value, "regex", None))
+        for name, value in globals().items() if name.startswith("t_"))
+    source = repr((__tabversion__, sorted(tokens), literals, rules))
+    return hashlib.sha1(source.encode()).hexdigest()
 
 
-def lex_raw(input):
-    """return a raw lexer, loaded with data"""
-    if isinstance(input, IOBase):
-        data = input.read()
+def lexer_version():
+    """hash of everything the token streams depend on, to key token caches"""
+    source = repr((rules_signature(), _string[0].pattern,
+                   _comment_delimiter[0].pattern, type_names,
+                   sorted(MULTILINE), sorted(reserved.items())))
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+def write_lextab(outputdir=os.path.dirname(os.path.abspath(__file__))):
+    """(re)generate the groom.lextab module"""
+    lexer = plylex()
+    lexer.writetab("lextab", outputdir)
+    with open(os.path.join(outputdir, "lextab.py"), "a") as lextab:
+        lextab.write("_signature = {!r}\n".format(rules_signature()))
+
+
+def _build_lexer():
+    try:
+        from groom import lextab
+    except ImportError:
+        lextab = None
+    if getattr(lextab, "_signature", None) == rules_signature():
+        lexer = plylex(optimize=True, lextab=lextab)
     else:
-        data = input
-    clone = raw_lexer.clone()
-    clone.input(data)
+        lexer = plylex()
+    # recovering rules return LEXERROR tokens, which the lexer built without
+    # the lextab checks against the token types
+    lexer.lextokens_all = lexer.lextokens_all | {LEXERROR}
+    lexer.__class__ = RawLexer
+    lexer.symbols = SymbolTable()
+    lexer.diagnostics = None
+    return lexer
+
+
+_raw_lexer = None
+
+
+def get_raw_lexer():
+    """return the shared raw lexer, built on first call"""
+    global _raw_lexer
+    if _raw_lexer is None:
+        _raw_lexer = _build_lexer()
+    return _raw_lexer
+
+
+def __getattr__(name):
+    # raw_lexer used to be built at import time
+    if name == "raw_lexer":
+        return get_raw_lexer()
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+def _map(file):
+    try:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # not backed by a file descriptor, or empty
+        return file.read()
+    pos = file.tell()
+    return memoryview(data)[pos:] if pos else data
+
+
+# the engines lexing str data: the PLY lexer, or NativeLexer
+ENGINES = ("ply", "native")
+default_engine = os.environ.get("GROOM_LEXER_ENGINE", "ply")
+
+
+def lex_raw(input, symbols=None, cache=None, diagnostics=None, engine=None):
+    """
+    return a raw lexer, loaded with data.
+
+    str data is lexed by ``engine``, one of ENGINES, ``default_engine`` if
+    not given (set by the GROOM_LEXER_ENGINE environment variable).
+    bytes-like data (bytes, bytearray, memoryview, mmap) and binary files
+    get a BufferLexer. Binary files are memory-mapped when possible.
+    Identifiers are interned in ``symbols`` (a SymbolTable), a new table
+    for this lexer if not given: pass the same table to the lexers of a run
+    to share it.
+    With a ``cache`` (a groom.tokencache.TokenCache) the tokens are
+    replayed from a TokenBuffer.
+
+    Lexing errors raise a PonyLexError, unless a ``diagnostics`` list is
+    given: errors are then appended to it, and the source skipped up to a
+    safe point is emitted as a LEXERROR token (see _resync).
+    """
+    if isinstance(input, TextIOBase):
+        input = input.read()
+    elif isinstance(input, IOBase):
+        input = _map(input)
+    engine = default_engine if engine is None else engine
+    if engine not in ENGINES:
+        raise ValueError("unknown lexer engine {!r}".format(engine))
+    if cache is not None:
+        return cache.lex(input, diagnostics)
+    if not isinstance(input, str):
+        return BufferLexer(input, symbols, diagnostics)
+    if engine == "native":
+        return NativeLexer(input, symbols, diagnostics)
+    clone = get_raw_lexer().clone()
+    clone.symbols = SymbolTable() if symbols is None else symbols
+    clone.diagnostics = diagnostics
+    clone.input(input)
     return clone
 
 
+class Token(LexToken):
+    """LexToken of the groom drivers, it also knows its column"""
+    @property
+    def column(self):
+        return line_index(self.lexer).column(self.lexpos)
+
+
+class RawLexer(PlyLexer):
+    """the PLY lexer, handing out Tokens"""
+    def token(self):
+        tok = PlyLexer.token(self)
+        if tok is not None:
+            # PLY only sets the lexer of the tokens of function rules
+            tok.__class__ = Token
+            tok.lexer = self
+        return tok
+
+
+class BufferToken(object):
+    """
+    token of a BufferLexer or a TokenBuffer. ``lexpos`` and ``lexend`` are
+    offsets in the ``lexdata`` of its lexer (bytes for bytes-like data), the
+    value is only sliced out and decoded when it is read.
+    """
+    __slots__ = ("type", "lineno", "lexpos", "lexend", "lexer")
+
+    def __init__(self, type, lineno, lexpos, lexend, lexer):
+        self.type = type
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexend = lexend
+        self.lexer = lexer
+
+    @property
+    def value(self):
+        value = self.lexer.lexdata[self.lexpos:self.lexend]
+        return value if isinstance(value, str) else bytes(value).decode()
+
+    @property
+    def column(self):
+        return line_index(self.lexer).column(self.lexpos)
+
+    @property
+    def newline(self):
+        return starts_line(self.lexer.lexdata, self.lexpos)
+
+    def __repr__(self):
+        return "LexToken({},{!r},{},{})".format(
+            self.type, self.value, self.lineno, self.lexpos)
+
+
+class BufferWord(BufferToken):
+    """BufferToken of a word, its value is interned in its lexer symbols"""
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return self.lexer.symbols[BufferToken.value.fget(self)][1]
+
+
+class Trivia(object):
+    """
+    side-table of the tokens skipped from a token stream (whitespace and
+    comments), kept as ``(offset, length, type)`` ranges of ``source``.
+    """
+    def __init__(self, source=None):
+        self.source = source
+        self.types = array("B")
+        self.starts = array("L")
+        self.lengths = array("L")
+
+    def append(self, type_, start, end):
+        self.types.append(type_ids[type_])
+        self.starts.append(start)
+        self.lengths.append(end - start)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        return (self.starts[index], self.lengths[index],
+                type_names[self.types[index]])
+
+    def __iter__(self):
+        for start, length, type_id in zip(self.starts, self.lengths,
+                                          self.types):
+            yield start, length, type_names[type_id]
+
+    def text(self, index):
+        start = self.starts[index]
+        text = self.source[start:start + self.lengths[index]]
+        return text if isinstance(text, str) else bytes(text).decode()
+
+    def comments(self):
+        """yield ``(offset, text)`` for the comments"""
+        comment_ids = (type_ids["LINECOMMENT"], type_ids["NESTEDCOMMENT"])
+        for i, type_id in enumerate(self.types):
+            if type_id in comment_ids:
+                yield self.starts[i], self.text(i)
+
+    def leading(self, offset):
+        """the indexes of the trivia right before ``offset``, in order"""
+        indexes = []
+        i = bisect_left(self.starts, offset) - 1
+        while i >= 0 and self.starts[i] + self.lengths[i] == offset:
+            indexes.append(i)
+            offset = self.starts[i]
+            i -= 1
+        return indexes[::-1]
+
+
+def restore_source(tokens, trivia):
+    """the source of ``tokens``, with the skipped ``trivia`` put back"""
+    return "".join(text for offset, text in merge(
+        ((t.lexpos, t.value) for t in tokens),
+        ((start, trivia.text(i)) for i, start in enumerate(trivia.starts))))
+
+
+# the split master regexes by binary flag, and the rules under None
+_masters = {}
+# keyed by str for text and by bytes and byte values for bytes-like data
+_keywords = dict(reserved)
+_keywords.update((word.encode(), type_) for word, type_ in reserved.items())
+_literal_types = {char: char for char in literals}
+_literal_types.update((ord(char), char) for char in literals)
+
+
+def _first_chars(items):
+    """
+    the ASCII characters a match of the parsed regex ``items`` can start
+    with (None if they are not known) and whether it can be empty
+    """
+    chars = set()
+    for op, av in items:
+        if op in (sre_constants.AT, sre_constants.ASSERT,
+                  sre_constants.ASSERT_NOT):
+            continue
+        if op is sre_constants.LITERAL:
+            first, empty = {chr(av)}, False
+        elif op is sre_constants.IN:
+            first, empty = _set_chars(av), False
+        elif op is sre_constants.SUBPATTERN:
+            first, empty = _first_chars(av[-1])
+        elif op is sre_constants.BRANCH:
+            first, empty = set(), False
+            for branch in av[1]:
+                branch_first, branch_empty = _first_chars(branch)
+                if branch_first is None:
+                    return None, True
+                first |= branch_first
+                empty = empty or branch_empty
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            first, empty = _first_chars(av[2])
+            empty = empty or av[0] == 0
+        else:
+            return None, True
+        if first is None:
+            return None, True
+        chars |= first
+        if not empty:
+            return chars, False
+    return chars, True
+
+
+def _set_chars(items):
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE:
+            chars.update(chr(c) for c in range(av[0], min(av[1] + 1, 128)))
+        elif op is sre_constants.CATEGORY and av in _categories:
+            chars.update(c for c in _ascii if _categories[av].match(c))
+        else:
+            return None
+    return chars
+
+
+_ascii = [chr(c) for c in range(128)]
+_categories = {
+    sre_constants.CATEGORY_SPACE: re.compile(r"\s"),
+    sre_constants.CATEGORY_DIGIT: re.compile(r"\d"),
+    sre_constants.CATEGORY_WORD: re.compile(r"\w"),
+}
+
+
+# flags of the master regex, as PLY compiles it
+_FLAGS = re.VERBOSE | re.UNICODE
+
+
+def _rules():
+    """
+    the ``(name, regex, first characters)`` of the t_* rules, in the order
+    of the master regex of PLY: functions in definition order, then strings
+    by decreasing length. The first characters are the ASCII characters a
+    match can start with, None if they are not known. The PLY lexer is not
+    built.
+    """
+    if None not in _masters:
+        functions, strings = [], []
+        for name, rule in globals().items():
+            if not name.startswith("t_") or name == "t_error":
+                continue
+            if isinstance(rule, str):
+                strings.append((name, rule))
+            else:
+                functions.append((rule.__code__.co_firstlineno, name,
+                                  rule.regex))
+        rules = [(name, pattern)
+                 for lineno, name, pattern in sorted(functions)]
+        rules += sorted(strings, key=lambda item: len(item[1]), reverse=True)
+        _masters[None] = [
+            (name, re.compile(pattern, _FLAGS),
+             _first_chars(sre_parse.parse(pattern, _FLAGS))[0])
+            for name, pattern in rules]
+    return _masters[None]
+
+
+def _get_master(binary):
+    """
+    the master regex of the raw lexer, split by the first character of the
+    data: a map of ASCII characters (str or byte values) to a regex of the
+    only rules that can match from that character and the types of its
+    groups, the whole regex being mapped to None.
+    """
+    if binary not in _masters:
+        rules = _rules()
+        compiled = {}
+
+        def compile_rules(rules):
+            names = tuple(name for name, regex, first in rules)
+            if names not in compiled:
+                pattern = "|".join("(?P<{}>{})".format(name, regex.pattern)
+                                   for name, regex, first in rules)
+                flags = rules[0][1].flags
+                if binary:
+                    pattern = _binary_pattern(pattern)
+                    flags &= ~re.UNICODE
+                sub = re.compile(pattern, flags)
+                types = [None] * (sub.groups + 1)
+                for name, index in sub.groupindex.items():
+                    types[index] = name[2:]
+                compiled[names] = sub, types
+            return compiled[names]
+
+        master = {None: compile_rules(rules)}
+        for char in _ascii:
+            candidates = [rule for rule in rules
+                          if rule[2] is None or char in rule[2]]
+            master[ord(char) if binary else char] = (
+                compile_rules(candidates) if candidates else (None, None))
+        _masters[binary] = master
+    return _masters[binary]
+
+
+def _match(master, data, pos, unterminated=None):
+    """
+    return the type and the end offset of the token at ``pos``, without
+    calling the t_* functions. The type is None if nothing matches, the
+    end is -1 for unterminated strings and comments, and for the strings
+    after the ``unterminated`` offset (see _unterminated_from).
+    """
+    char = data[pos]
+    regex, types = master.get(char) or master[None]
+    m = None if regex is None else regex.match(data, pos)
+    if m is None:
+        return _literal_types.get(char), pos + 1
+    type_ = types[m.lastindex]
+    if type_ in scanners:
+        if _known_unterminated(type_, pos, unterminated):
+            return type_, -1
+        return type_, scanners[type_](data, pos)
+    if type_ == "ID":
+        return _keywords.get(m.group(), "ID"), m.end()
+    return type_, m.end()
+
+
+def iter_spans(data, skip=TRIVIA, pos=0, lineno=1, diagnostics=None,
+               trivia=None):
+    """
+    yield ``(type, lineno, start, end)`` for the tokens of str or bytes-like
+    data, dropping the token types in ``skip``, or recording them in the
+    ``trivia`` table if given. No token object is built and the t_*
+    functions are not called. Errors are collected in ``diagnostics`` if
+    given (see lex_raw).
+    """
+    binary = not isinstance(data, str)
+    master = _get_master(binary)
+    newlines = _newline[binary].findall
+    length = len(data)
+    index = None
+    unterminated = None
+    while pos < length:
+        type_, end = _match(master, data, pos, unterminated)
+        if type_ is None or end < 0:
+            index = index or LineIndex(data)
+            if type_ is None:
+                error = _illegal(lineno, index.column(pos), data, pos)
+            else:
+                error = _unterminated(lineno, index.column(pos), type_, data,
+                                      pos)
+                if type_ == "STRING" and unterminated is None:
+                    unterminated = _unterminated_from(data, pos)
+            _report(error, diagnostics)
+            end = _resync(data, pos, type_)
+            if LEXERROR not in skip:
+                yield LEXERROR, lineno, pos, end
+            elif trivia is not None:
+                trivia.append(LEXERROR, pos, end)
+            lineno += len(newlines(data, pos, end))
+            pos = end
+            continue
+        if type_ not in skip:
+            yield type_, lineno, pos, end
+        elif trivia is not None:
+            trivia.append(type_, pos, end)
+        if type_ in MULTILINE:
+            lineno += len(newlines(data, pos, end))
+        pos = end
+
+
+# types of the tokens matched by the ID rule, typed by the symbol table
+_word_types = frozenset(reserved.values()) | {"ID"}
+
+
+class BufferLexer(object):
+    """
+    raw lexer over bytes-like data, lexed in place without decoding it.
+
+    It follows the rules of the PLY lexer, but as the t_* functions work on
+    str their effects are applied here: reserved words, line counting and
+    the string and comment scanners. The values of words are interned in
+    ``symbols`` when they are read.
+    """
+    def __init__(self, data, symbols=None, diagnostics=None):
+        self.lexdata = data
+        self.lexlen = len(data)
+        self.lexpos = 0
+        self.lineno = 1
+        self.symbols = SymbolTable() if symbols is None else symbols
+        self.diagnostics = diagnostics
+        self._tokens = self.iter_tokens(())
+
+    def token(self):
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def iter_tokens(self, skip=TRIVIA, trivia=None):
+        """
+        yield the tokens, dropping the token types in ``skip`` or recording
+        them in ``trivia``
+        """
+        data = self.lexdata
+        spans = iter_spans(data, skip, self.lexpos, self.lineno,
+                           self.diagnostics, trivia)
+        for type_, lineno, start, end in spans:
+            self.lexpos = end
+            self.lineno = lineno
+            yield (BufferWord if type_ in _word_types else BufferToken)(
+                type_, lineno, start, end, self)
+
+
+class NativeLexer(object):
+    """
+    raw lexer over str data, with the tokens of the PLY lexer but without
+    PLY: the master regex split by first character is matched in a single
+    loop, literals come from a table, and the effects of the t_* functions
+    are applied here (see iter_spans). Identifiers are interned in
+    ``symbols`` like the PLY lexer does.
+    """
+    def __init__(self, data, symbols=None, diagnostics=None):
+        self.lexdata = data
+        self.lexlen = len(data)
+        self.lexpos = 0
+        self.lineno = 1
+        self.symbols = SymbolTable() if symbols is None else symbols
+        self.diagnostics = diagnostics
+        self._tokens = self.iter_tokens(())
+
+    def token(self):
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def iter_tokens(self, skip=TRIVIA, trivia=None):
+        """
+        yield the tokens, dropping the token types in ``skip`` or recording
+        them in ``trivia``
+        """
+        data = self.lexdata
+        symbols = self.symbols
+        spans = iter_spans(data, skip, self.lexpos, self.lineno,
+                           self.diagnostics, trivia)
+        for type_, lineno, start, end in spans:
+            value = data[start:end]
+            if type_ in _word_types:
+                type_, value = symbols[value]
+            tok = Token()
+            tok.type = type_
+            tok.value = value
+            tok.lineno = lineno
+            tok.lexpos = start
+            tok.lexer = self
+            if type_ in NEWLINE_TYPES:
+                tok.newline = starts_line(data, start)
+            self.lexpos = end
+            self.lineno = lineno
+            yield tok
+
+
+# the stream lexer only emits a token once that many characters follow it,
+# which is more than any rule looks past the end of its match
+LOOKAHEAD = 16
+CHUNK_SIZE = 64 * 1024
+
+
+class StreamLexer(object):
+    """
+    raw lexer reading a text or binary stream in chunks.
+
+    Only the unread part of the current chunk and the token being lexed are
+    held in memory. Tokens spanning chunks (strings, comments,
+    whitespace...) are completed by reading on, at least as much as is
+    already buffered each time so long tokens stay linear.
+    ``lexpos`` is counted in characters for text streams and in bytes for
+    binary ones.
+    """
+    def __init__(self, stream, chunk_size=CHUNK_SIZE, symbols=None,
+                 diagnostics=None):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.symbols = SymbolTable() if symbols is None else symbols
+        self.diagnostics = diagnostics
+        self.lexdata = stream.read(chunk_size)
+        self.binary = not isinstance(self.lexdata, str)
+        self.eof = not self.lexdata
+        self.lexpos = 0
+        self.lineno = 1
+        self.line_start = 0
+        self._tokens = self.iter_tokens(())
+
+    def token(self):
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def _fill(self, pos):
+        """drop the lexed data before ``pos`` and read more"""
+        data = self.lexdata[pos:]
+        chunk = self.stream.read(max(self.chunk_size, len(data)))
+        self.eof = not chunk
+        self.lexdata = data + chunk
+
+    def iter_tokens(self, skip=TRIVIA, trivia=None):
+        """
+        yield the tokens, dropping the token types in ``skip`` or recording
+        them in ``trivia`` (a Trivia without source, as the stream data is
+        not kept)
+        """
+        master = _get_master(self.binary)
+        newlines = _newline[self.binary].findall
+        newline = b"\n" if self.binary else "\n"
+        # the previous token is whitespace with a newline
+        after_newline = False
+        # the lexpos after which no string is terminated, once at the end
+        # of the stream (see _unterminated_from)
+        unterminated = None
+        pos = 0
+        while pos < len(self.lexdata) or not self.eof:
+            data = self.lexdata
+            if pos < len(data):
+                type_, end = _match(
+                    master, data, pos,
+                    None if unterminated is None
+                    else unterminated - self.lexpos + pos)
+            else:
+                type_, end = None, pos
+            if not self.eof and (end < 0 or end + LOOKAHEAD > len(data)):
+                self._fill(pos)
+                pos = 0
+                continue
+            column = self.lexpos - self.line_start + 1
+            if type_ is None or end < 0:
+                if type_ is None:
+                    error = _illegal(self.lineno, column, data, pos)
+                else:
+                    error = _unterminated(self.lineno, column, type_, data,
+                                          pos)
+                    if type_ == "STRING" and unterminated is None:
+                        unterminated = _unterminated_from(data, pos)
+                        if unterminated is not None:
+                            unterminated += self.lexpos - pos
+                error.lexpos = self.lexpos
+                _report(error, self.diagnostics)
+                end = _resync(data, pos, type_)
+                type_ = LEXERROR
+            lineno = self.lineno
+            if type_ in MULTILINE or type_ == LEXERROR:
+                count = len(newlines(data, pos, end))
+                if count:
+                    self.lineno += count
+                    self.line_start = (self.lexpos + 1 +
+                                       data.rfind(newline, pos, end) - pos)
+            value = data[pos:end]
+            if self.binary:
+                value = value.decode()
+            if type_ == "ID":
+                value = self.symbols[value][1]
+            tok = LexToken()
+            tok.type = type_
+            tok.value = value
+            tok.lineno = lineno
+            tok.lexpos = self.lexpos
+            tok.column = column
+            if type_ in NEWLINE_TYPES:
+                tok.newline = after_newline
+            after_newline = type_ == "WS" and "\n" in value
+            self.lexpos += end - pos
+            pos = end
+            if type_ not in skip:
+                yield tok
+            elif trivia is not None:
+                trivia.append(type_, tok.lexpos, self.lexpos)
+
+
+def lex_stream(stream, chunk_size=CHUNK_SIZE, symbols=None,
+               diagnostics=None):
+    """return a raw lexer reading ``stream`` in chunks"""
+    return StreamLexer(stream, chunk_size, symbols, diagnostics)
+
+
+def iter_tokens(lexer, skip=TRIVIA, trivia=None):
+    """
+    yield the tokens of a loaded raw lexer, dropping the token types in
+    ``skip``, or recording them in the ``trivia`` table if given.
+    """
+    if isinstance(lexer, PlyLexer):
+        return _iter_ply_tokens(lexer, skip, trivia)
+    return lexer.iter_tokens(skip, trivia)
+
+
+def _iter_ply_tokens(lexer, skip, trivia):
+    # This drives the master regex of the PLY lexer directly: skipped tokens
+    # only move the position and the line counter, no LexToken is built for
+    # them and the rule function is not called.
+    data = lexer.lexdata
+    length = lexer.lexlen
+    master = lexer.lexre
+    literals = lexer.lexliterals
+    while lexer.lexpos < length:
+        pos = lexer.lexpos
+        for regex, index in master:
+            m = regex.match(data, pos)
+            if m is not None:
+                break
+        else:
+            char = data[pos]
+            tok = Token()
+            tok.lineno = lexer.lineno
+            tok.lexpos = pos
+            tok.lexer = lexer
+            if char in literals:
+                tok.type = tok.value = char
+                lexer.lexpos = pos + 1
+                yield tok
+                continue
+            tok.type = "error"
+            tok.value = data[pos:]
+            tok = lexer.lexerrorf(tok)
+            if tok.type not in skip:
+                yield tok
+            elif trivia is not None:
+                trivia.append(tok.type, pos, lexer.lexpos)
+            continue
+        func, type_ = index[m.lastindex]
+        end = m.end()
+        if type_ in skip:
+            if type_ in scanners:
+                end = _scan_lexer(lexer, type_, pos)
+                if end < 0:
+                    lexer.lexpos = pos
+                    _report(_unterminated(lexer.lineno,
+                                          line_index(lexer).column(pos),
+                                          type_, data, pos),
+                            lexer.diagnostics)
+                    tok = Token()
+                    tok.lineno = lexer.lineno
+                    tok.lexpos = pos
+                    tok.lexer = lexer
+                    tok = _recover(tok, _resync(data, pos, type_))
+                    if LEXERROR not in skip:
+                        yield tok
+                    elif trivia is not None:
+                        trivia.append(LEXERROR, pos, lexer.lexpos)
+                    continue
+            if trivia is not None:
+                trivia.append(type_, pos, end)
+            lexer.lineno += data.count("\n", pos, end)
+            lexer.lexpos = end
+            continue
+        tok = Token()
+        tok.type = type_
+        tok.value = m.group()
+        tok.lineno = lexer.lineno
+        tok.lexpos = pos
+        tok.lexer = lexer
+        lexer.lexpos = end
+        if func is not None:
+            lexer.lexmatch = m
+            tok = func(tok)
+            if tok is None:
+                continue
+            if tok.type in skip:
+                if trivia is not None:
+                    trivia.append(tok.type, pos, lexer.lexpos)
+                continue
+        yield tok
+
+
+def _with_type_ids(tokens):
+    for tok in tokens:
+        tok.type = type_ids[tok.type]
+        yield tok
+
+
 class Lexer():
-    def __init__(self):
+    """
+    the lexer fed to the parser. With ``int_types`` the token types are
+    ids from ``type_ids`` instead of names, identifiers are interned in
+    ``symbols`` (a new table for each input if not given), tokens are
+    replayed from ``cache`` and errors are collected in ``diagnostics``, by
+    the lexer ``engine`` (see lex_raw). With ``keep_trivia``, whitespace and
+    comments are recorded in the ``trivia`` table of the input.
+    """
+    def __init__(self, int_types=False, symbols=None, cache=None,
+                 diagnostics=None, keep_trivia=False, engine=None):
         self._lexer = None
+        self._tokens = iter(())
+        self._symbols = symbols
+        self.int_types = int_types
+        self.symbols = SymbolTable() if symbols is None else symbols
+        self.cache = cache
+        self.diagnostics = diagnostics
+        self.keep_trivia = keep_trivia
+        self.engine = engine
+        self.trivia = None
 
     def input(self, input):
-        self._lexer = lex_raw(input)
+        if self._symbols is None:
+            # a long-lived lexer does not keep the words of past inputs
+            self.symbols = SymbolTable()
+        self._lexer = lex_raw(input, self.symbols, self.cache,
+                              self.diagnostics, self.engine)
+        if self.keep_trivia:
+            self.trivia = Trivia(self._lexer.lexdata)
+        self._tokens = iter_tokens(self._lexer, TRIVIA, self.trivia)
+        if self.int_types:
+            self._tokens = _with_type_ids(self._tokens)
 
     def token(self):
-        t = self._lexer.token()
-        if t is not None and t.type in (
-                "WS", "NEWLINE", "LINECOMMENT", "NESTEDCOMMENT"):
-            return self.token()
-        return t
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+
+if __name__ == "__main__":
+    write_lextab()  # pragma: no cover
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.10). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('MINUS', 'BACKSLASH', 'ELSEIF', 'IF', 'USE', 'LINECOMMENT', 'CLASS_DECL', 'XOR', 'VAR', 'ADDRESSOF', 'COMPILE_INTRINSIC', 'ERROR', 'CONTINUE', 'IN', 'SMALL_ARROW', 'NOT', 'FALSE', 'EMBED', 'NESTEDCOMMENT', 'PLUS', 'OR', 'END', 'CAP', 'METH_DECL', 'WS', 'OBJECT', 'RECOVER', 'TRY', 'TRUE', 'MINUS_NEW', 'FLOAT', 'ID', 'THEN', 'WITH', 'LSQUARE', 'IFDEF', 'ELSE', 'AS', 'THIS', 'LPAREN', 'IFTYPE', 'BREAK', 'LET', 'REPEAT', 'INT', 'MINUS_TILDE', 'IS_SUBTYPE', 'LSQUARE_NEW', 'MATCH', 'IS', 'AND', 'UNTIL', 'DIGESTOF', 'GENCAP', 'STRING', 'LPAREN_NEW', 'RETURN', 'COMPILE_ERROR', 'MINUS_TILDE_NEW', 'WHERE', 'CONSUME', 'BIG_ARROW', 'ISNT', 'DO', 'FOR', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ':()[]{}=.!@|,;^?<>~*/%#&'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_STRING>")|(?P<t_NESTEDCOMMENT>/\\*)|(?P<t_INT>(\'((\\\\\')|[^\\\\\']|((\\\\(a|b|e|f|n|r|t|v|\\\\|0))|(\\\\t) (\\\\x[0-9a-zA-Z]{2})|(\\\\u[0-9a-zA-Z]{4})|(\\\\U[0-9a-zA-Z]{6})))\')|(0b[01_]+)|(0x[0-9a-fA-F_]+)|([0-9][0-9_]*(?![0-9_.eE])))|(?P<t_FLOAT>[0-9][0-9_]*(\\.[0-9][0-9_]*)?([eE][+-]?[0-9_]+)?)|(?P<t_LPAREN>\\()|(?P<t_LSQUARE>\\[)|(?P<t_SMALL_ARROW>->)|(?P<t_MINUS_TILDE>-~)|(?P<t_MINUS>-)|(?P<t_WS>((\\n\\s*)) | \\s+)|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_\']*)|(?P<t_GENCAP>(\\#read)|(\\#send)|(\\#share)|(\\#alias)|(\\#any))|(?P<t_LINECOMMENT>//[^\\n]+)|(?P<t_BIG_ARROW>=>)|(?P<t_BACKSLASH>\\\\)|(?P<t_PLUS>\\+)|(?P<t_IS_SUBTYPE><:)', [None, ('t_STRING', 'STRING'), ('t_NESTEDCOMMENT', 'NESTEDCOMMENT'), ('t_INT', 'INT'), None, None, None, None, None, None, None, None, None, None, None, None, None, ('t_FLOAT', 'FLOAT'), None, None, ('t_LPAREN', 'LPAREN'), ('t_LSQUARE', 'LSQUARE'), ('t_SMALL_ARROW', 'SMALL_ARROW'), ('t_MINUS_TILDE', 'MINUS_TILDE'), ('t_MINUS', 'MINUS'), ('t_WS', 'WS'), None, None, ('t_ID', 'ID'), (None, 'GENCAP'), None, None, None, None, None, (None, 'LINECOMMENT'), (None, 'BIG_ARROW'), (None, 'BACKSLASH'), (None, 'PLUS'), (None, 'IS_SUBTYPE')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature = '5dafb423e2911604856f2611eca32a62a94ef34d'
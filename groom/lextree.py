@@ -0,0 +1,114 @@
+"""
+parallel lexing of a source tree
+
+lex_tree lexes all the .pony files under a directory across a pool of
+processes and tells for each file its token count, or its lexing error.
+The TokenBuffers of the files can be sent back too. When recovering from
+errors, all the lexing errors of each file are collected in one pass.
+
+Run ``python -m groom.lextree PATH`` to lex a tree from the command line.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from ply.lex import LexError
+
+from groom.lexer import TRIVIA, iter_spans
+from groom.tokenbuffer import TokenBuffer
+
+FileResult = namedtuple("FileResult", "path count error buffer diagnostics")
+
+
+def pony_files(path):
+    """the .pony files under ``path``, sorted"""
+    found = []
+    for root, dirs, files in os.walk(path):
+        found.extend(os.path.join(root, name)
+                     for name in files if name.endswith(".pony"))
+    return sorted(found)
+
+
+def lex_file(path, buffers=False, recover=False):
+    """
+    the FileResult of ``path``: the count of its tokens (trivia excluded)
+    and its TokenBuffer if ``buffers``, or the lexing error. With
+    ``recover``, lexing goes on after errors and ``diagnostics`` lists
+    them all (see groom.lexer.lex_raw).
+    """
+    diagnostics = [] if recover else None
+    try:
+        with open(path, "rb") as src:
+            data = src.read()
+        if buffers:
+            buffer = TokenBuffer.lex(data, diagnostics=diagnostics)
+            count = len(buffer)
+        else:
+            buffer = None
+            count = sum(1 for span in iter_spans(
+                data, TRIVIA, diagnostics=diagnostics))
+    except (LexError, OSError) as error:
+        return FileResult(path, None, str(error), None, diagnostics)
+    return FileResult(path, count, None, buffer, diagnostics)
+
+
+def _lex_files(paths, buffers, recover):
+    return [lex_file(path, buffers, recover) for path in paths]
+
+
+def lex_tree(path, workers=None, buffers=False, recover=False):
+    """
+    lex the .pony files under ``path`` with ``workers`` processes (as many
+    as CPUs by default, 1 lexes in this process) and return their
+    FileResults, sorted by path.
+    """
+    paths = pony_files(path)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        return _lex_files(paths, buffers, recover)
+    # send files by batches: one task per file costs more in inter-process
+    # traffic than lexing small files
+    size = max(1, len(paths) // (workers * 8))
+    batches = [paths[i:i + size] for i in range(0, len(paths), size)]
+    with ProcessPoolExecutor(workers) as pool:
+        results = pool.map(_lex_files, batches, [buffers] * len(batches),
+                           [recover] * len(batches))
+        return [result for batch in results for result in batch]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m groom.lextree",
+        description="lex the .pony files of a tree in parallel")
+    parser.add_argument("path")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of processes (default: CPU count)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="only print errors and the summary")
+    parser.add_argument("-k", "--keep-going", action="store_true",
+                        help="report all the errors of each file")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    results = lex_tree(args.path, args.jobs, recover=args.keep_going)
+    elapsed = time.perf_counter() - start
+    errors = 0
+    for result in results:
+        for error in result.diagnostics or ():
+            errors += 1
+            print("{}: {}".format(result.path, error))
+        if result.error is not None:
+            errors += 1
+            print("{}: {}".format(result.path, result.error))
+        elif not args.quiet:
+            print("{}: {} tokens".format(result.path, result.count))
+    print("{} files, {} tokens, {} errors in {:.2f}s".format(
+        len(results), sum(result.count or 0 for result in results), errors,
+        elapsed))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # pragma: no cover
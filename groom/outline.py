@@ -0,0 +1,171 @@
+"""
+source outlines from the tokens
+
+The classes and methods of a source are found in its token stream alone,
+method bodies are not parsed: a class runs up to the next class
+declaration and a method up to the next method or class declaration, the
+declarations of object literals (``object ... end``) being skipped by
+counting the keywords closed by ``end``. The ``if`` guards of match cases
+(``| pattern if condition =>``) have no ``end``: they are told apart by
+the ``|`` starting the cases, as union types are always in parentheses.
+
+Run ``python -m groom.outline FILE...`` to print the outline of sources.
+"""
+import argparse
+import sys
+from collections import namedtuple
+
+from groom.lexer import iter_spans
+
+Class = namedtuple("Class",
+                   "kind name cap type_params lineno end_lineno methods")
+Method = namedtuple("Method", "kind name cap type_params lineno end_lineno")
+
+# keywords of the expressions closed by ``end``
+BLOCKS = frozenset(("IF", "IFDEF", "IFTYPE", "WHILE", "FOR", "REPEAT",
+                    "MATCH", "TRY", "WITH", "RECOVER", "OBJECT"))
+OPENING = frozenset(("LPAREN", "LSQUARE", "{"))
+CLOSING = frozenset((")", "]", "}"))
+STRUCTURE = BLOCKS | OPENING | CLOSING | frozenset((
+    "CLASS_DECL", "METH_DECL", "END", "|", "BIG_ARROW"))
+
+
+class _Outliner(object):
+    def __init__(self, source):
+        self.source = source
+        self.spans = list(iter_spans(source, diagnostics=[]))
+
+    def text(self, span):
+        text = self.source[span[2]:span[3]]
+        return text if isinstance(text, str) else bytes(text).decode()
+
+    def end_lineno(self, i):
+        """the last line of the token ``i``"""
+        type_, lineno, start, end = self.spans[i]
+        newline = "\n" if isinstance(self.source, str) else b"\n"
+        return lineno + self.source.count(newline, start, end)
+
+    def header(self, i):
+        """
+        read the declaration starting at token ``i``. Return the
+        ``(kind, name, cap, type_params, lineno)`` and the index of the
+        token after the name and its type parameters.
+        """
+        spans = self.spans
+        kind, lineno = self.text(spans[i]), spans[i][1]
+        i += 1
+        if i < len(spans) and spans[i][0] == "BACKSLASH":
+            # annotations
+            i += 1
+            while i < len(spans) and spans[i][0] != "BACKSLASH":
+                i += 1
+            i += 1
+        cap = name = type_params = None
+        if i < len(spans) and spans[i][0] in ("CAP", "@"):
+            cap = self.text(spans[i])
+            i += 1
+        if i < len(spans) and spans[i][0] == "ID":
+            name = self.text(spans[i])
+            i += 1
+        if i < len(spans) and spans[i][0] == "LSQUARE":
+            start, depth = i, 0
+            while i < len(spans):
+                if spans[i][0] == "LSQUARE":
+                    depth += 1
+                elif spans[i][0] == "]":
+                    depth -= 1
+                    if not depth:
+                        break
+                i += 1
+            type_params = self.source[spans[start][2]:spans[i][3]]
+            if not isinstance(type_params, str):
+                type_params = bytes(type_params).decode()
+            i += 1
+        return (kind, name, cap, type_params, lineno), i
+
+    def outline(self):
+        spans = self.spans
+        classes = []
+        cls = method = None
+        # the open blocks, with the bracket nesting where they start
+        blocks = []
+        brackets = 0
+        case = False
+        i = 0
+        while i < len(spans):
+            type_ = spans[i][0]
+            if type_ not in STRUCTURE:
+                i += 1
+                continue
+            if type_ == "CLASS_DECL" or (type_ == "METH_DECL" and not blocks
+                                         and cls is not None):
+                if method is not None:
+                    cls.methods.append(Method(*method, self.end_lineno(i - 1)))
+                    method = None
+                if type_ == "CLASS_DECL":
+                    if cls is not None:
+                        classes.append(cls._replace(
+                            end_lineno=self.end_lineno(i - 1)))
+                    header, i = self.header(i)
+                    cls = Class(*header, None, [])
+                else:
+                    method, i = self.header(i)
+                blocks = []
+                brackets = 0
+                case = False
+                continue
+            i += 1
+            if cls is None:
+                continue
+            if type_ in OPENING:
+                brackets += 1
+            elif type_ in CLOSING:
+                brackets -= 1
+            elif type_ == "|" and blocks and blocks[-1] == ("MATCH", brackets):
+                # a match case, its guard is an ``if`` without ``end``
+                case = True
+            elif type_ == "BIG_ARROW":
+                case = False
+            elif type_ in BLOCKS and not (type_ == "IF" and case):
+                blocks.append((type_, brackets))
+            elif type_ == "END" and blocks:
+                blocks.pop()
+        if method is not None:
+            cls.methods.append(Method(*method, self.end_lineno(i - 1)))
+        if cls is not None:
+            classes.append(cls._replace(end_lineno=self.end_lineno(i - 1)))
+        return classes
+
+
+def outline(source):
+    """
+    the Class outlines of str or bytes-like ``source``, with their Method
+    outlines. Kinds are the declaration keywords, and line ranges end on
+    the last token of the declaration, trivia excluded. Lexing errors are
+    skipped.
+    """
+    return _Outliner(source).outline()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m groom.outline",
+        description="print the classes and methods of .pony files")
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+    for path in args.paths:
+        with open(path, "rb") as src:
+            classes = outline(src.read())
+        print(path)
+        for cls in classes:
+            print("  {} {} {}-{}".format(cls.kind, cls.name, cls.lineno,
+                                         cls.end_lineno))
+            for method in cls.methods:
+                print("    {} {} {}-{}".format(
+                    method.kind, method.name, method.lineno,
+                    method.end_lineno))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # pragma: no cover
@@ -1,11 +1,57 @@
+"""
+pony parser
+
+The parse tables are shared by all the Parser instances built with the same
+yacc options. The default ones are read from the generated
+``groom.parsetab`` module, on first use, when it matches the grammar below:
+run ``python -m groom.parser`` to regenerate it after changing the grammar.
+Otherwise the tables are built in memory, they are never written at
+runtime.
+
+The same tables parse snippets as well as modules: parsing from one of the
+ENTRY_POINTS starts with a sentinel token (``START_TYPE`` for ``type``...)
+which the ``entry`` rule expects before the snippet.
+"""
+import copy
+import hashlib
+import mmap
+import os
+from functools import partial
+from io import IOBase
+from itertools import chain
+
 import ply.yacc as yacc
-from groom.lexer import tokens  # noqa needed by yacc.yacc
+from ply.lex import LexToken
+from groom.lexer import tokens as lexer_tokens
+from groom.lexer import NEWLINE_TYPES, Lexer, PlyLexer, type_ids
+from groom.lexer import iter_tokens
 from groom.ast import nodes
 
 
 # Known missing constructs and bugs
 #    - # postfix (???)
 
+# the rules a parse can start from, besides module
+ENTRY_POINTS = ("use", "use_ffi", "class_def", "fields", "method", "type",
+                "lambdatype", "rawseq", "infix", "term", "pattern", "idseq",
+                "if", "ifdef", "iftype", "match", "while", "repeat", "for",
+                "with", "try", "recover", "consume", "object", "lambda",
+                "barelambda", "array", "tuple")
+start_tokens = {name: "START_" + name.upper() for name in ENTRY_POINTS}
+# needed by yacc.yacc
+tokens = lexer_tokens + list(start_tokens.values())
+start = "entry"
+
+
+def p_entry(p):
+    p[0] = p[len(p) - 1]
+
+
+p_entry.__doc__ = "entry : module\n" + "".join(
+    "      | {} {}\n".format(start_tokens[name], name)
+    for name in ENTRY_POINTS)
+
+
 def p_module(p):
     """
     module : docstring uses class_defs
@@ -48,14 +94,12 @@ def p_id(p):
 
 def p_uses(p):
     """
-    uses : use uses
-         | use
+    uses : uses use
          |
     """
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -127,9 +171,13 @@ def p_maybe_typeargs(p):
 def p_typearglist(p):
     """
     typearglist : typearg
-                | typearg ',' typearglist
+                | typearglist ',' typearg
     """
-    p[0] = [p[1]] if len(p) == 2 else [p[1]] + p[3]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_id_or_string(p):
@@ -142,14 +190,12 @@ def p_id_or_string(p):
 
 def p_class_defs(p):
     """
-    class_defs : class_def class_defs
-               | class_def
+    class_defs : class_defs class_def
                |
     """
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -171,13 +217,14 @@ def p_typeparams(p):
 
 def p_typeparams_list(p):
     """
-    typeparams_list : typeparam ',' typeparams_list
-                    | typeparam
+    typeparams_list : typeparam
+                    | typeparams_list ',' typeparam
     """
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_typeparam(p):
@@ -375,8 +422,8 @@ def p_typeargs_id(p):
 
 def p_combined_types(p):
     """
-    combined_types : anylparen infixtype tupletype ')'
-                   | anylparen infixtype ')'
+    combined_types : LPAREN infixtype tupletype ')'
+                   | LPAREN infixtype ')'
     """
     if len(p) == 5:
         p[0] = nodes.TupleTypeNode(members=[p[2]] + p[3])
@@ -386,11 +433,12 @@ def p_combined_types(p):
 
 def p_tupletype(p):
     """
-    tupletype : ',' infixtype tupletype
+    tupletype : tupletype ',' infixtype
               | ',' infixtype
     """
     if len(p) == 4:
-        p[0] = [p[2]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[2]]
 
@@ -491,13 +539,14 @@ def p_annotations(p):
 
 def p_id_list(p):
     """
-    id_list : id ',' id_list
-            | id
+    id_list : id
+            | id_list ',' id
     """
-    if len(p) == 4:
-        p[0] = [p[1]] + p[3]
-    else:
+    if len(p) == 2:
         p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_members(p):
@@ -513,13 +562,14 @@ def p_members(p):
 
 def p_fields(p):
     """
-    fields : field fields
+    fields : fields field
            | field
     """
     if len(p) == 2:
         p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+    else:
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 field_classes = {
@@ -552,66 +602,42 @@ def p_varkw(p):
 
 def p_infix(p):
     """
-    infix : term op_list
-          | term
+    infix : term
+          | infix binop_op term
+          | infix binop_op '?' term
+          | infix '=' infix
+          | infix AS type
+          | infix IS term
+          | infix ISNT term
     """
-    if len(p) == 3:
-        result = p[1]
-        for op in p[2]:
-            result = op(result)
-        p[0] = result
-    else:
+    # left-recursive: the operators fold left as they are reduced
+    if len(p) == 2:
         p[0] = p[1]
+    elif len(p) == 5:
+        p[0] = nodes.BinOpNode(operator=p[2], first=p[1], second=p[4],
+                               is_partial=True)
+    elif p[2] == "=":
+        p[0] = nodes.AssignNode(first=p[1], second=p[3])
+    elif p[2] == "as":
+        p[0] = nodes.AsNode(term=p[1], type=p[3])
+    else:
+        p[0] = nodes.BinOpNode(operator=p[2], first=p[1], second=p[3],
+                               is_partial=False)
 
 
 def p_nextinfix(p):
     """
-    nextinfix : nextterm op_list
-              | nextterm
+    nextinfix : nextterm
+              | nextinfix binop_op term
+              | nextinfix binop_op '?' term
+              | nextinfix '=' infix
+              | nextinfix AS type
+              | nextinfix IS term
+              | nextinfix ISNT term
     """
     p_infix(p)
 
 
-def p_op_list(p):
-    """
-    op_list : op op_list
-            | op
-    """
-    if len(p) == 2:
-        p[0] = [p[1]]
-    else:
-        p[0] = [p[1]] + p[2]
-
-
-class OperatorFactory(object):
-    def __init__(self, operator, term, partial=False):
-        self.operator = operator
-        self.term = term
-        self.partial = partial
-
-    def __call__(self, first):
-        if self.operator == "as":
-            return nodes.AsNode(term=first, type=self.term)
-        elif self.operator == "=":
-            return nodes.AssignNode(first=first, second=self.term)
-        else:
-            return nodes.BinOpNode(operator=self.operator, first=first,
-                                   second=self.term, is_partial=self.partial)
-
-
-def p_op(p):
-    """
-    op : AS type
-       | binop
-       | isop
-    """
-    # TODO
-    if len(p) == 3:
-        p[0] = OperatorFactory("as", p[2])
-    else:
-        p[0] = p[1]
-
-
 def p_mabe_typed(p):
     """
     maybe_typed : ':' type
@@ -811,14 +837,12 @@ def p_match(p):
 
 def p_caseexpr_list(p):
     """
-    caseexpr_list : caseexpr caseexpr_list
-                  | caseexpr
+    caseexpr_list : caseexpr_list caseexpr
                   |
     """
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
-    elif len(p) == 2:
-        p[0] = [p[1]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -914,7 +938,7 @@ def _flatten_idseq(seq):
 def p_idseq(p):
     """
     idseq : id
-          | anylparen idseq_list ')'
+          | LPAREN idseq_list ')'
     """
     idseq = [nodes.LetNode(id=p[1])] if len(p) == 2 else p[2]
     p[0] = _flatten_idseq(idseq)
@@ -923,9 +947,13 @@ def p_idseq(p):
 def p_idseq_list(p):
     """
     idseq_list : idseq
-               | idseq ',' idseq_list
+               | idseq_list ',' idseq
     """
-    p[0] = [p[1]] if len(p) == 2 else [p[1]] + p[3]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_with(p):
@@ -943,10 +971,14 @@ def p_with(p):
 
 def p_withelem_list(p):
     """
-    withelem_list : withelem ',' withelem_list
-                  | withelem
+    withelem_list : withelem
+                  | withelem_list ',' withelem
     """
-    p[0] = [p[1]] if len(p) == 2 else [p[1]] + p[3]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_withelem(p):
@@ -1006,26 +1038,6 @@ def p_consume(p):
     p[0] = nodes.ConsumeNode(cap=p[2], term=p[3])
 
 
-def p_isop(p):
-    """
-    isop : IS term
-         | ISNT term
-    """
-    p[0] = OperatorFactory(p[1], p[2])
-
-
-def p_binop(p):
-    """
-    binop : binop_op term
-          | binop_op '?' term
-          | '=' infix
-    """
-    if len(p) == 3:
-        p[0] = OperatorFactory(p[1], p[2], False)
-    else:
-        p[0] = OperatorFactory(p[1], p[3], True)
-
-
 def p_binop_op(p):
     """
     binop_op : AND
@@ -1068,14 +1080,12 @@ def p_binop_op(p):
 
 def p_methods(p):
     """
-    methods : method methods
-            | method
+    methods : methods method
             |
     """
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -1216,12 +1226,12 @@ def p_parampatternprefix(p):
     parampatternprefix : NOT
                        | ADDRESSOF
                        | MINUS
-                       | MINUS_TILDE
                        | MINUS_NEW
+                       | MINUS_TILDE
                        | MINUS_TILDE_NEW
                        | DIGESTOF
     """
-    p[0] = pattern_prefix_node_constructor[p[1].strip()]
+    p[0] = pattern_prefix_node_constructor[p[1]]
 
 
 def p_nextparampatternprefix(p):
@@ -1232,7 +1242,7 @@ def p_nextparampatternprefix(p):
                            | MINUS_TILDE_NEW
                            | DIGESTOF
     """
-    p[0] = pattern_prefix_node_constructor[p[1].strip()]
+    p[0] = pattern_prefix_node_constructor[p[1]]
 
 
 atomsuffix_classes = {
@@ -1268,16 +1278,14 @@ def p_nextpostfix(p):
 
 def p_atomsuffix_list(p):
     """
-    atomsuffix_list : atomsuffix
-                    | atomsuffix atomsuffix_list
+    atomsuffix_list : atomsuffix_list atomsuffix
                     |
     """
-    if len(p) == 1:
-        p[0] = []
-    elif len(p) == 2:
-        p[0] = [p[1]]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
-        p[0] = [p[1]] + p[2]
+        p[0] = []
 
 
 def p_atomsuffix(p):
@@ -1352,9 +1360,13 @@ def p_named(p):
 def p_namedarglist(p):
     """
     namedarglist : namedarg
-                 | namedarg ',' namedarglist
+                 | namedarglist ',' namedarg
     """
-    p[0] = [p[1]] if len(p) == 2 else [p[1]] + p[3]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_namedarg(p):
@@ -1461,9 +1473,13 @@ def p_lambdacaptures(p):
 def p_lambdacapture_list(p):
     """
     lambdacapture_list : lambdacapture
-                       | lambdacapture ',' lambdacapture_list
+                       | lambdacapture_list ',' lambdacapture
     """
-    p[0] = [p[1]] if len(p) == 2 else [p[1]] + p[3]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_lambdacapture(p):
@@ -1552,21 +1568,26 @@ def p_nexttuple(p):
 
 def p_tupletail(p):
     """
-    tupletail : empty
-              | ',' rawseq tupletail
+    tupletail : tupletail ',' rawseq
+              | empty
     """
     if len(p) == 2:
         p[0] = []
     else:
-        p[0] = [p[2]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_param_list(p):
     """
-    param_list : param ',' param_list
-               | param
+    param_list : param
+               | param_list ',' param
     """
-    p[0] = [p[1]] + p[3] if len(p) == 4 else [p[1]]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_rawseq(p):
@@ -1589,39 +1610,26 @@ def p_annotatedrawseq(p):
 
 def p_exprseq(p):
     """
-    exprseq : infix
-            | infix semiexpr
-            | infix nosemi
-    """
-    next_ = [] if len(p) == 2 else p[2]
-    if not isinstance(next_, list):
-        next_ = [next_]
-    p[0] = [p[1]] + next_
-
-
-def p_nextexprseq(p):
-    """
-    nextexprseq : nextinfix
-                | nextinfix semiexpr
-                | nextinfix nosemi
-    """
-    p_exprseq(p)
-
-
-def p_semiexpr(p):
+    exprseq : infixseq
+            | infixseq ';' jump
+            | infixseq jump
     """
-    semiexpr : ';' exprseq
-             | ';' jump
-    """
-    p[0] = p[2]
+    if len(p) > 2:
+        p[1].append(p[len(p) - 1])
+    p[0] = p[1]
 
 
-def p_nosemi(p):
+def p_infixseq(p):
     """
-    nosemi : nextexprseq
-           | jump
+    infixseq : infix
+             | infixseq ';' infix
+             | infixseq nextinfix
     """
-    p[0] = p[1]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[len(p) - 1])
+        p[0] = p[1]
 
 
 def p_jump(p):
@@ -1689,13 +1697,164 @@ def p_compile_error(p):
 # _parser = yacc.yacc()
 
 
+def grammar_signature():
+    """hash of everything the parse tables are built from"""
+    rules = sorted((func.__code__.co_firstlineno, name, func.__doc__)
+                   for name, func in globals().items()
+                   if name.startswith("p_"))
+    source = repr((yacc.__tabversion__, sorted(tokens),
+                   globals().get("precedence"), globals().get("start"),
+                   [(name, doc) for _, name, doc in rules]))
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+def write_parsetab(outputdir=os.path.dirname(os.path.abspath(__file__))):
+    """(re)generate the groom.parsetab module"""
+    path = os.path.join(outputdir, "parsetab.py")
+    if os.path.exists(path):
+        # yacc would keep the tables it can read
+        os.remove(path)
+    yacc.yacc(tabmodule="parsetab", outputdir=outputdir, debug=False)
+    with open(path, "a") as parsetab:
+        parsetab.write("_signature = {!r}\n".format(grammar_signature()))
+
+
+def _index_type_ids(parser):
+    """let the action tables be looked up by token type ids too"""
+    for actions in parser.action.values():
+        actions.update([(type_ids[name], action)
+                        for name, action in actions.items()
+                        if name in type_ids])
+
+
+def _read_parsetab():
+    try:
+        from groom import parsetab
+    except ImportError:
+        return None
+    if getattr(parsetab, "_signature", None) != grammar_signature():
+        return None
+    tables = yacc.LRTable()
+    tables.read_table(parsetab)
+    tables.bind_callables(globals())
+    return yacc.LRParser(tables, None)
+
+
+# the LR parsers by yacc options
+_parsers = {}
+
+
+def _lr_parser(*args, **kwargs):
+    key = (args, tuple(sorted(kwargs.items())))
+    parser = _parsers.get(key)
+    if parser is None:
+        if not args and not kwargs:
+            parser = _read_parsetab()
+        if parser is None:
+            kwargs.setdefault("debug", False)
+            kwargs.setdefault("write_tables", False)
+            parser = yacc.yacc(*args, **kwargs)
+        _index_type_ids(parser)
+        _parsers[key] = parser
+    return parser
+
+
+# the tokens the lexer flags when they start a line, typed *_NEW by the
+# parser when they follow a complete expression: they start the next one
+# (see infixseq) instead of continuing it. Elsewhere the newline does
+# not matter and they keep their type.
+_new_types = {type_: type_ + "_NEW" for type_ in NEWLINE_TYPES}
+_new_types.update([(type_ids[type_], type_ids[new])
+                   for type_, new in _new_types.items()])
+# the tokens an expression can end with
+_expression_ends = frozenset(("ID", "INT", "FLOAT", "STRING", "TRUE", "FALSE",
+                              "THIS", "END", "CAP", "GENCAP", ")", "]", "}",
+                              "?", "^", "!"))
+_expression_ends |= frozenset(type_ids[type_] for type_ in _expression_ends)
+
+
+def _newline_tokens(token):
+    """the tokens returned by ``token``, typed after their newline flag"""
+    previous = None
+    for tok in iter(token, None):
+        type_ = tok.type
+        if (type_ in _new_types and previous in _expression_ends and
+                getattr(tok, "newline", False)):
+            tok.type = _new_types[type_]
+        previous = type_
+        yield tok
+
+
+# the inputs of the parser that are lexed, the others are lexed tokens
+_source_types = (str, bytes, bytearray, memoryview, mmap.mmap, IOBase)
+
+
+def _start_token(name):
+    tok = LexToken()
+    tok.type, tok.value, tok.lineno, tok.lexpos = start_tokens[name], None, 1, 0
+    return tok
+
+
 class Parser(object):
+    """
+    Accepts tokens typed by name or by id (see ``groom.lexer.type_ids``).
+    The arguments are the options of ``yacc.yacc``, the tables they build
+    are shared (see the module docstring). A ``start`` among the
+    ENTRY_POINTS only sets the default entry point of the shared tables.
+    """
     def __init__(self, *args, **kwargs):
-        self._parser = yacc.yacc(*args, **kwargs)
+        self.start = None
+        if (not args and kwargs.keys() == {"start"} and
+                kwargs["start"] in ENTRY_POINTS + ("module",)):
+            self.start = kwargs.pop("start")
+        # the tables are shared, not the parsing state
+        self._parser = copy.copy(_lr_parser(*args, **kwargs))
+
+    def parse(self, input=None, lexer=None, *args, start=None, **kwargs):
+        """
+        parse ``input`` with ``lexer``, a new groom.lexer.Lexer by default.
+        ``input`` can also be lexed: a TokenBuffer or a raw lexer (see
+        ``groom.lexer.iter_tokens``), trivia skipped, or any iterable of
+        tokens such as a list or a loaded Lexer. The tokens are fed to the
+        parser as they are. A ``tokenfunc`` returning the tokens replaces
+        ``input`` and ``lexer``. ``start`` is one of the ENTRY_POINTS, or
+        module.
+        """
+        start = start or self.start
+        if start not in (None, "module") and start not in start_tokens:
+            raise ValueError("unknown entry point {!r}".format(start))
+        token = kwargs.pop("tokenfunc", None)
+        if token is not None:
+            if input is not None or lexer is not None:
+                raise TypeError("tokenfunc is given with input or lexer")
+        elif hasattr(input, "iter_tokens") or isinstance(input, PlyLexer):
+            token = partial(next, iter_tokens(input), None)
+            input, lexer = None, input
+        elif input is None or isinstance(input, _source_types):
+            if lexer is None:
+                lexer = Lexer()
+            token = lexer.token
+        else:
+            token = partial(next, iter(input), None)
+            input = None
+        stream = _newline_tokens(token)
+        if start not in (None, "module"):
+            stream = chain((_start_token(start),), stream)
+        kwargs["tokenfunc"] = partial(next, stream, None)
+        return self._parser.parse(input, lexer, *args, **kwargs)
+
+    def parse_expression(self, input=None, lexer=None, *args, **kwargs):
+        """parse a sequence of expressions, see parse"""
+        return self.parse(input, lexer, *args, start="rawseq", **kwargs)
+
+    def parse_type(self, input=None, lexer=None, *args, **kwargs):
+        """parse a type, see parse"""
+        return self.parse(input, lexer, *args, start="type", **kwargs)
 
-    def parse(self, *args, **kwargs):
-        return self._parser.parse(*args, **kwargs)
+    def parse_class(self, input=None, lexer=None, *args, **kwargs):
+        """parse a class, actor, trait... definition, see parse"""
+        return self.parse(input, lexer, *args, start="class_def", **kwargs)
 
 
 if __name__ == "__main__":
-    yacc.yacc()  # pragma: no cover
+    write_parsetab()  # pragma: no cover
@@ -0,0 +1,406 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "entrySTRING WS GENCAP ID LINECOMMENT NESTEDCOMMENT BIG_ARROW SMALL_ARROW INT FLOAT BACKSLASH PLUS IS_SUBTYPE MINUS LPAREN LSQUARE MINUS_TILDE MINUS_NEW LPAREN_NEW LSQUARE_NEW MINUS_TILDE_NEW MATCH IS WHILE ADDRESSOF AS CONSUME USE FALSE CONTINUE WHERE FOR ELSE TRY OBJECT IFDEF XOR IFTYPE DIGESTOF VAR THIS IF REPEAT END OR TRUE DO AND IN COMPILE_INTRINSIC ELSEIF LET ERROR NOT ISNT COMPILE_ERROR METH_DECL EMBED BREAK UNTIL RETURN CAP THEN RECOVER CLASS_DECL WITH START_USE START_USE_FFI START_CLASS_DEF START_FIELDS START_METHOD START_TYPE START_LAMBDATYPE START_RAWSEQ START_INFIX START_TERM START_PATTERN START_IDSEQ START_IF START_IFDEF START_IFTYPE START_MATCH START_WHILE START_REPEAT START_FOR START_WITH START_TRY START_RECOVER START_CONSUME START_OBJECT START_LAMBDA START_BARELAMBDA START_ARRAY START_TUPLEentry : module\n      | START_USE use\n      | START_USE_FFI use_ffi\n      | START_CLASS_DEF class_def\n      | START_FIELDS fields\n      | START_METHOD method\n      | START_TYPE type\n      | START_LAMBDATYPE lambdatype\n      | START_RAWSEQ rawseq\n      | START_INFIX infix\n      | START_TERM term\n      | START_PATTERN pattern\n      | START_IDSEQ idseq\n      | START_IF if\n      | START_IFDEF ifdef\n      | START_IFTYPE iftype\n      | START_MATCH match\n      | START_WHILE while\n      | START_REPEAT repeat\n      | START_FOR for\n      | START_WITH with\n      | START_TRY try\n      | START_RECOVER recover\n      | START_CONSUME consume\n      | START_OBJECT object\n      | START_LAMBDA lambda\n      | START_BARELAMBDA barelambda\n      | START_ARRAY array\n      | START_TUPLE tuple\n\n    module : docstring uses class_defs\n    \n    anylparen : LPAREN\n              | LPAREN_NEW\n    \n    anysquare : LSQUARE\n              | LSQUARE_NEW\n    \n    empty :\n    \n    id : ID\n    \n    uses : uses use\n         |\n    \n    use : USE used useif\n    \n    useif : IF infix\n          | empty\n    \n    used : used_id STRING\n         | used_id use_ffi\n    \n    used_id : id '='\n            | empty\n    \n    use_ffi : '@' id_or_string typeargs params maybe_partial\n    \n    typeargs : LSQUARE typearglist ']'\n    \n    maybe_typeargs : typeargs\n                   | empty\n    \n    typearglist : typearg\n                | typearglist ',' typearg\n    \n    id_or_string : id\n                 | string\n    \n    class_defs : class_defs class_def\n               |\n    \n    cap : CAP\n        | empty\n    \n    typeparams : LSQUARE typeparams_list ']'\n    \n    typeparams_list : typeparam\n                    | typeparams_list ',' typeparam\n    \n    typeparam : id maybe_typed\n              | id maybe_typed '=' typearg\n    \n    typearg : type\n            | literal\n            | '#' postfix\n    \n    true : TRUE\n    \n    false : FALSE\n    \n    int : INT\n    \n    float : FLOAT\n    \n    string : STRING\n    \n    literal : true\n            | false\n            | int\n            | float\n            | string\n    \n    type : atomtype\n         | atomtype SMALL_ARROW type\n    \n    atomtype : THIS\n             | CAP\n             | combined_types\n             | nominal\n             | lambdatype\n             | barelambdatype\n    \n    barelambdatype : '@' lambdatype\n    \n    lambdatype : '{' cap maybe_id maybe_typeparams anylparen type_list ')' maybe_typed maybe_partial '}' typecap\n    \n    type_list : type\n              | type ',' type_list\n              |\n    \n    nominal : namespaced typecap\n    \n    typecap : CAP cap_modifier\n            | GENCAP cap_modifier\n            | empty cap_modifier\n            | CAP\n            | GENCAP\n            | empty\n    \n    cap_modifier : '^'\n                 | '!'\n    \n    namespaced : id '.' typeargs_id\n               | typeargs_id\n    \n    typeargs_id : id typeargs\n                | id\n    \n    combined_types : LPAREN infixtype tupletype ')'\n                   | LPAREN infixtype ')'\n    \n    tupletype : tupletype ',' infixtype\n              | ',' infixtype\n    \n    infixtype : type\n              | intersectiontype\n              | uniontype\n    \n    intersectiontype : type '&' infixtype\n    \n    uniontype : type '|' infixtype\n    \n    parametrised_id : id typeparams\n                    | id\n    \n    provides : IS type\n             |\n    \n    class_decl : CLASS_DECL annotations cap parametrised_id provides\n    \n    docstring : string\n              | empty\n    \n    class_def : class_decl docstring members\n              | class_decl docstring\n    \n    annotations : BACKSLASH id_list BACKSLASH\n                |\n    \n    id_list : id\n            | id_list ',' id\n    \n    members : fields methods\n            | methods\n    \n    fields : fields field\n           | field\n    \n    field : varkw id ':' type '=' infix\n          | varkw id ':' type\n    \n    varkw : LET\n          | VAR\n          | EMBED\n    \n    infix : term\n          | infix binop_op term\n          | infix binop_op '?' term\n          | infix '=' infix\n          | infix AS type\n          | infix IS term\n          | infix ISNT term\n    \n    nextinfix : nextterm\n              | nextinfix binop_op term\n              | nextinfix binop_op '?' term\n              | nextinfix '=' infix\n              | nextinfix AS type\n              | nextinfix IS term\n              | nextinfix ISNT term\n    \n    maybe_typed : ':' type\n                |\n    \n    vardecl : varkw id maybe_typed\n    \n    pattern : vardecl\n            | parampattern\n    \n    nextpattern : vardecl\n                | nextparampattern\n    \n    term : if\n         | ifdef\n         | iftype\n         | match\n         | while\n         | repeat\n         | for\n         | with\n         | try\n         | recover\n         | consume\n         | pattern\n    \n    nextterm : if\n             | ifdef\n             | iftype\n             | match\n             | while\n             | repeat\n             | for\n             | with\n             | try\n             | recover\n             | consume\n             | nextpattern\n    \n    if : IF annotatedrawseq THEN rawseq if_else END\n    \n    if_else : elseif\n            | else\n    \n    elseif : ELSEIF annotatedrawseq THEN rawseq if_else\n    \n    ifdef : IFDEF annotations infix THEN rawseq ifdef_else END\n    \n    ifdef_else : else\n               | elseifdef\n    \n    elseifdef : ELSEIF annotations infix THEN rawseq ifdef_else\n    \n    type_assertion : type IS_SUBTYPE type\n    \n    iftype : IFTYPE annotations type_assertion THEN rawseq iftype_else END\n    \n    iftype_else : else\n                | elseiftype\n    \n    elseiftype : ELSEIF annotations type_assertion THEN rawseq iftype_else\n    \n    match : MATCH annotations rawseq caseexpr_list else END\n    \n    caseexpr_list : caseexpr_list caseexpr\n                  |\n    \n    maybe_pattern : pattern\n                  |\n    \n    match_action : BIG_ARROW rawseq\n                 |\n    \n    caseexpr : '|' annotations maybe_pattern guard match_action\n    \n    while : WHILE annotatedrawseq DO rawseq else END\n    \n    repeat : REPEAT rawseq UNTIL annotatedrawseq else END\n    \n    then : THEN annotatedrawseq\n         |\n    \n    for : FOR annotations idseq IN rawseq DO rawseq else END\n    \n    idseq : id\n          | LPAREN idseq_list ')'\n    \n    idseq_list : idseq\n               | idseq_list ',' idseq\n    \n    with : WITH annotations withelem_list DO rawseq else END\n    \n    withelem_list : withelem\n                  | withelem_list ',' withelem\n    \n    withelem : idseq '=' rawseq\n    \n    else_then : else then\n    \n    try : TRY annotations rawseq else_then END\n    \n    recover : RECOVER annotations cap rawseq END\n    \n    else : ELSE annotatedrawseq\n         |\n    \n    consume : CONSUME cap term\n    \n    binop_op : AND\n             | OR\n             | XOR\n             | PLUS\n             | MINUS\n             | '*'\n             | '/'\n             | '%'\n             | PLUS '~'\n             | MINUS_TILDE\n             | '*' '~'\n             | '/' '~'\n             | '%' '~'\n             | '<' '<'\n             | '>' '>'\n             | '<' '<' '~'\n             | '>' '>' '~'\n             | '=' '='\n             | '!' '='\n             | '<'\n             | '<' '='\n             | '>' '='\n             | '>'\n             | '=' '=' '~'\n             | '!' '=' '~'\n             | '<' '~'\n             | '<' '=' '~'\n             | '>' '=' '~'\n             | '>' '~'\n    \n    methods : methods method\n            |\n    \n    meth_cap : '@'\n             | CAP\n             |\n    \n    meth_decl : METH_DECL annotations\n    \n    method : meth_decl meth_cap parametrised_id params meth_type  maybe_partial docstring guard body\n    \n    body : BIG_ARROW rawseq\n         |\n    \n    guard : IF rawseq\n          |\n    \n    maybe_partial : '?'\n                  | empty\n    \n    meth_type : ':' type\n              |\n    \n    params : anylparen param_list ')'\n           | anylparen ')'\n    \n    param : param_1\n          | param_1 '=' infix\n          | '.' '.' '.'\n    \n    param_1 : parampattern\n            | parampattern ':' type\n    \n    parampattern : parampatternprefix parampattern\n                 | postfix\n    \n    nextparampattern : nextparampatternprefix parampattern\n                     | nextpostfix\n    \n    parampatternprefix : NOT\n                       | ADDRESSOF\n                       | MINUS\n                       | MINUS_NEW\n                       | MINUS_TILDE\n                       | MINUS_TILDE_NEW\n                       | DIGESTOF\n    \n    nextparampatternprefix : NOT\n                           | ADDRESSOF\n                           | MINUS_NEW\n                           | MINUS_TILDE_NEW\n                           | DIGESTOF\n    \n    postfix : atom atomsuffix_list\n    \n    nextpostfix : nextatom atomsuffix_list\n    \n    atomsuffix_list : atomsuffix_list atomsuffix\n                    |\n    \n    atomsuffix : dot\n               | tilde\n               | chain\n               | atom_typeargs\n               | call\n    \n    atom_typeargs : typeargs\n    \n    dot : '.' id\n    \n    tilde : '~' id\n    \n    chain : '.' '>' id\n    \n    call : LPAREN  positional named ')' maybe_partial\n    \n    positional : rawseq\n               | rawseq ',' positional\n               |\n    \n    named : WHERE namedarglist\n          |\n    \n    namedarglist : namedarg\n                 | namedarglist ',' namedarg\n    \n    namedarg : id '=' rawseq\n    \n    this : THIS\n    \n    object : OBJECT annotations cap provides members END\n    \n    atom : id\n         | this\n         | literal\n         | tuple\n         | array\n         | object\n         | lambda\n         | barelambda\n         | fficall\n    \n    nextatom : id\n             | this\n             | literal\n             | nexttuple\n             | nextarray\n             | object\n             | lambda\n             | barelambda\n             | fficall\n    \n    barelambda : '@' lambda\n    \n    lambda : '{' annotations cap maybe_id maybe_typeparams params maybe_lambdacaptures maybe_typed maybe_partial BIG_ARROW rawseq '}' cap\n    \n    maybe_lambdacaptures : lambdacaptures\n                         | empty\n    \n    lambdacaptures : anylparen lambdacapture_list ')'\n    \n    lambdacapture_list : lambdacapture\n                       | lambdacapture_list ',' lambdacapture\n    \n    lambdacapture : this\n                  | id maybe_typed\n                  | id maybe_typed '=' infix\n    \n    maybe_typeparams : typeparams\n                     | empty\n    \n    maybe_id : id\n             | empty\n    \n    maybe_rawseq : rawseq\n                 | empty\n    \n    array : anysquare arraytype maybe_rawseq ']'\n    \n    nextarray : LSQUARE_NEW arraytype rawseq ']'\n    \n    arraytype : AS type ':'\n              | empty\n    \n    fficall : '@' id_or_string maybe_typeargs anylparen positional named ')' maybe_partial\n    \n    tuple : anylparen rawseq tupletail ')'\n    \n    nexttuple : LPAREN_NEW rawseq tupletail ')'\n    \n    tupletail : tupletail ',' rawseq\n              | empty\n    \n    param_list : param\n               | param_list ',' param\n    \n    rawseq : exprseq\n           | jump\n    \n    annotatedrawseq : annotations rawseq\n    \n    exprseq : infixseq\n            | infixseq ';' jump\n            | infixseq jump\n    \n    infixseq : infix\n             | infixseq ';' infix\n             | infixseq nextinfix\n    \n    jump : jump_statement empty\n         | jump_statement rawseq\n    \n    jump_statement : return\n                   | break\n                   | continue\n                   | pony_error\n                   | compile_intrinsic\n                   | compile_error\n    \n    return : RETURN\n    \n    break : BREAK\n    \n    continue : CONTINUE\n    \n    pony_error : ERROR\n    \n    compile_intrinsic : COMPILE_INTRINSIC\n    \n    compile_error : COMPILE_ERROR\n    "
+    
+_lr_action_items = {'START_USE':([0,],[3,]),'START_USE_FFI':([0,],[4,]),'START_CLASS_DEF':([0,],[5,]),'START_FIELDS':([0,],[6,]),'START_METHOD':([0,],[7,]),'START_TYPE':([0,],[8,]),'START_LAMBDATYPE':([0,],[9,]),'START_RAWSEQ':([0,],[10,]),'START_INFIX':([0,],[11,]),'START_TERM':([0,],[12,]),'START_PATTERN':([0,],[13,]),'START_IDSEQ':([0,],[14,]),'START_IF':([0,],[15,]),'START_IFDEF':([0,],[16,]),'START_IFTYPE':([0,],[17,]),'START_MATCH':([0,],[18,]),'START_WHILE':([0,],[19,]),'START_REPEAT':([0,],[20,]),'START_FOR':([0,],[21,]),'START_WITH':([0,],[22,]),'START_TRY':([0,],[23,]),'START_RECOVER':([0,],[24,]),'START_CONSUME':([0,],[25,]),'START_OBJECT':([0,],[26,]),'START_LAMBDA':([0,],[27,]),'START_BARELAMBDA':([0,],[28,]),'START_ARRAY':([0,],[29,]),'START_TUPLE':([0,],[30,]),'STRING':([0,10,11,12,13,34,36,38,40,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,141,142,143,144,145,146,147,148,149,175,177,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,294,304,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,401,402,405,406,408,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,468,473,475,476,484,485,486,490,496,503,505,507,508,511,514,517,518,519,523,524,525,530,535,540,541,542,543,544,547,552,561,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[34,34,34,34,34,-70,-35,34,34,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,34,34,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,34,-121,-121,-35,-150,-151,-309,34,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,34,-35,34,-66,-67,-68,-69,-31,-32,-33,-34,292,-45,-89,-93,-94,-95,-56,-57,-84,-100,34,34,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,34,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,34,-35,34,34,34,34,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,34,34,34,34,-35,34,-148,-269,-285,34,-346,-327,34,-44,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,34,-361,34,34,34,34,-271,-286,34,-134,34,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,34,34,-121,34,-217,-149,-287,-289,-290,-291,-292,-293,-294,34,34,-114,-120,-261,-111,-102,-47,34,-141,34,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,34,34,34,34,34,-121,-147,-295,-296,-348,34,-343,-345,34,-258,-259,-263,-115,34,-35,-142,-349,-344,-121,-121,-213,-121,-214,-297,34,-113,-262,34,34,34,-260,-58,-178,-121,-191,34,-199,-200,34,-35,-308,34,34,-182,34,-187,-208,-298,34,-35,34,-347,34,34,34,34,-203,-35,34,34,-85,-35,-328,]),'USE':([0,3,31,32,33,34,52,53,54,55,56,57,58,60,63,64,65,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,173,174,195,196,197,198,200,201,202,204,274,275,276,283,288,289,291,292,293,305,307,311,312,313,314,315,319,320,337,339,341,342,343,369,370,372,373,374,375,376,377,380,396,397,408,416,427,449,450,452,455,457,464,465,466,468,503,507,508,517,530,540,542,543,547,552,565,567,572,573,580,598,608,614,621,626,627,],[-35,36,-38,-116,-117,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,36,-35,-89,-93,-94,-95,-56,-57,-84,-100,-148,-269,-285,-327,-37,-39,-41,-42,-43,-77,-103,-90,-96,-97,-91,-92,-101,-98,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-40,-35,-102,-47,-135,-147,-295,-296,-348,-343,-46,-258,-259,-263,-213,-214,-297,-262,-178,-191,-199,-200,-35,-308,-182,-187,-208,-298,-35,-347,-203,-35,-85,-35,-328,]),'CLASS_DECL':([0,5,31,32,33,34,40,43,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,173,174,181,184,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,287,288,289,291,292,293,296,297,298,304,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,395,396,397,399,400,401,404,405,406,408,416,419,421,422,423,424,427,449,450,452,455,457,464,465,466,468,473,476,484,485,486,503,507,508,514,517,522,523,524,525,530,540,542,543,547,552,559,565,567,572,573,580,581,598,599,601,608,613,614,621,626,627,],[-35,41,-38,-116,-117,-70,-35,-127,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-55,-35,-119,-126,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,41,-37,-39,-41,-42,-43,-118,-248,-125,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-54,-40,-35,-124,-247,-114,-129,-261,-111,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-46,-258,-259,-263,-115,-35,-142,-349,-344,-213,-214,-297,-113,-262,-128,-35,-260,-58,-178,-191,-199,-200,-35,-308,-257,-182,-187,-208,-298,-35,-255,-347,-253,-256,-203,-254,-35,-85,-35,-328,]),'$end':([0,1,2,31,32,33,34,35,37,39,40,42,43,48,51,52,53,54,55,56,57,58,60,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,151,152,153,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,171,172,173,174,181,184,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,287,288,289,291,292,293,296,297,298,304,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,393,395,396,397,399,400,401,404,405,406,408,416,419,421,422,423,424,427,449,450,452,455,457,464,465,466,468,473,476,484,485,486,503,507,508,514,517,522,523,524,525,530,540,542,543,547,552,559,565,567,572,573,580,581,598,599,601,608,613,614,621,626,627,],[-35,0,-1,-38,-116,-117,-70,-2,-3,-4,-35,-5,-127,-6,-7,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-8,-9,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-10,-11,-12,-13,-204,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-55,-35,-119,-126,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-30,-37,-39,-41,-42,-43,-118,-248,-125,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-205,-54,-40,-35,-124,-247,-114,-129,-261,-111,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-46,-258,-259,-263,-115,-35,-142,-349,-344,-213,-214,-297,-113,-262,-128,-35,-260,-58,-178,-191,-199,-200,-35,-308,-257,-182,-187,-208,-298,-35,-255,-347,-253,-256,-203,-254,-35,-85,-35,-328,]),'@':([4,8,10,11,12,13,28,34,36,49,50,52,53,54,55,56,57,58,59,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,175,177,189,190,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,265,266,271,272,273,274,275,276,278,279,280,283,290,294,302,305,307,308,309,310,311,312,313,314,315,319,320,325,327,328,329,330,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,371,372,373,374,375,376,377,380,381,398,402,408,409,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,437,441,442,444,447,449,450,452,455,456,457,458,460,462,465,466,475,477,482,484,485,486,490,496,503,505,507,508,511,518,519,521,530,535,539,540,541,542,543,544,547,552,561,563,564,565,566,567,568,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[38,62,141,141,141,141,170,-70,-35,187,-121,-76,-78,-79,-80,-81,-82,-83,62,-35,-101,-99,-36,141,141,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,-121,141,-121,-121,-35,-150,-151,-309,141,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,141,-35,-66,-67,-68,-69,-31,-32,-33,-34,38,-45,-252,62,-89,-93,-94,-95,-56,-57,-84,-100,62,141,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,141,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,141,-35,141,141,62,141,141,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,141,141,62,141,141,-35,141,-148,-269,-285,141,62,-346,-327,141,-44,62,-77,-103,62,62,62,-90,-96,-97,-91,-92,-101,-98,141,-361,141,141,62,141,141,-271,-286,141,-134,141,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,141,141,-121,141,-217,-149,62,-287,-289,-290,-291,-292,-293,-294,141,141,-120,-102,62,-47,62,-141,141,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,141,141,62,141,141,141,-121,-147,-295,-296,-348,141,-343,-345,62,141,-258,-259,141,62,62,-142,-349,-344,-121,-121,-213,-121,-214,-297,141,141,141,62,-178,-121,-121,-191,141,-199,-200,141,-35,-308,62,62,141,-182,141,-187,62,-208,-298,141,-35,141,-347,141,141,141,141,-203,-35,141,141,-85,-35,-328,]),'LET':([6,10,11,12,13,32,33,34,40,42,43,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,142,143,144,145,146,147,148,149,181,184,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,281,283,290,297,304,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,388,401,402,404,406,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,459,462,465,466,473,475,484,485,486,490,496,503,505,507,508,511,514,519,522,525,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[45,45,45,45,45,-116,-117,-70,-35,45,-127,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,45,45,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,45,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,45,-35,-121,-66,-67,-68,-69,-31,-32,-33,-34,45,-126,-89,-93,-94,-95,-56,-57,-84,-100,45,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,45,-35,45,45,45,45,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,45,45,45,45,-35,45,-148,-269,-285,45,-346,-35,-327,45,45,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,45,45,45,45,-271,-286,45,-134,45,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,45,45,-121,45,-217,-149,-287,-289,-290,-291,-292,-293,-294,45,-114,-114,-120,-129,-111,-102,-47,-141,45,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,45,45,45,45,45,-121,-147,-295,-296,-348,45,-343,-345,45,45,-258,-259,-115,45,-142,-349,-344,-121,-121,-213,-121,-214,-297,45,-113,45,-128,-58,-178,-121,-191,45,-199,-200,45,-35,-308,45,-182,45,-187,-208,-298,45,-35,45,-347,45,45,45,45,-203,-35,45,45,-85,-35,-328,]),'VAR':([6,10,11,12,13,32,33,34,40,42,43,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,142,143,144,145,146,147,148,149,181,184,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,281,283,290,297,304,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,388,401,402,404,406,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,459,462,465,466,473,475,484,485,486,490,496,503,505,507,508,511,514,519,522,525,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[46,46,46,46,46,-116,-117,-70,-35,46,-127,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,46,46,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,46,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,46,-35,-121,-66,-67,-68,-69,-31,-32,-33,-34,46,-126,-89,-93,-94,-95,-56,-57,-84,-100,46,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,46,-35,46,46,46,46,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,46,46,46,46,-35,46,-148,-269,-285,46,-346,-35,-327,46,46,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,46,46,46,46,-271,-286,46,-134,46,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,46,46,-121,46,-217,-149,-287,-289,-290,-291,-292,-293,-294,46,-114,-114,-120,-129,-111,-102,-47,-141,46,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,46,46,46,46,46,-121,-147,-295,-296,-348,46,-343,-345,46,46,-258,-259,-115,46,-142,-349,-344,-121,-121,-213,-121,-214,-297,46,-113,46,-128,-58,-178,-121,-191,46,-199,-200,46,-35,-308,46,-182,46,-187,-208,-298,46,-35,46,-347,46,46,46,46,-203,-35,46,46,-85,-35,-328,]),'EMBED':([6,10,11,12,13,32,33,34,40,42,43,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,142,143,144,145,146,147,148,149,181,184,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,281,283,290,297,304,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,388,401,402,404,406,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,459,462,465,466,473,475,484,485,486,490,496,503,505,507,508,511,514,519,522,525,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[47,47,47,47,47,-116,-117,-70,-35,47,-127,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,47,47,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,47,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,47,-35,-121,-66,-67,-68,-69,-31,-32,-33,-34,47,-126,-89,-93,-94,-95,-56,-57,-84,-100,47,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,47,-35,47,47,47,47,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,47,47,47,47,-35,47,-148,-269,-285,47,-346,-35,-327,47,47,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,47,47,47,47,-271,-286,47,-134,47,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,47,47,-121,47,-217,-149,-287,-289,-290,-291,-292,-293,-294,47,-114,-114,-120,-129,-111,-102,-47,-141,47,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,47,47,47,47,47,-121,-147,-295,-296,-348,47,-343,-345,47,47,-258,-259,-115,47,-142,-349,-344,-121,-121,-213,-121,-214,-297,47,-113,47,-128,-58,-178,-121,-191,47,-199,-200,47,-35,-308,47,-182,47,-187,-208,-298,47,-35,47,-347,47,47,47,47,-203,-35,47,47,-85,-35,-328,]),'METH_DECL':([7,32,33,34,40,43,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,139,142,143,144,145,181,184,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,281,283,297,298,304,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,388,399,400,401,402,404,405,406,408,416,419,421,422,423,424,427,449,450,452,455,457,459,465,466,468,473,476,484,485,486,503,507,508,514,517,522,523,524,525,530,540,542,543,547,552,559,565,567,572,573,580,581,598,599,601,608,613,614,621,626,627,],[50,-116,-117,-70,-35,-127,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-121,-66,-67,-68,-69,-248,-126,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-35,-327,-248,50,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-114,50,-247,-114,-120,-129,-261,-111,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-248,-258,-259,-263,-115,-35,-142,-349,-344,-213,-214,-297,-113,-262,-128,-35,-260,-58,-178,-191,-199,-200,-35,-308,-257,-182,-187,-208,-298,-35,-255,-347,-253,-256,-203,-254,-35,-85,-35,-328,]),'THIS':([8,10,11,12,13,34,52,53,54,55,56,57,58,59,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,190,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,265,266,271,272,273,274,275,276,278,279,280,283,290,302,305,307,308,309,310,311,312,313,314,315,319,320,325,327,328,329,330,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,371,372,373,374,375,376,377,380,381,398,402,408,409,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,437,441,442,444,447,449,450,452,455,456,457,458,460,462,465,466,475,477,482,484,485,486,490,496,503,505,507,508,511,518,519,521,530,535,539,540,541,542,543,544,547,552,561,563,564,565,566,567,568,572,573,575,579,580,582,598,600,604,605,607,608,611,614,618,620,621,626,627,],[53,131,131,131,131,-70,-76,-78,-79,-80,-81,-82,-83,53,-35,-101,-99,-36,131,131,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,-121,131,-121,-121,-35,-150,-151,-309,131,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,131,-35,-66,-67,-68,-69,-31,-32,-33,-34,53,-89,-93,-94,-95,-56,-57,-84,-100,53,131,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,131,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,131,-35,131,131,53,131,131,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,131,131,53,131,131,-35,131,-148,-269,-285,131,53,-346,-327,131,53,-77,-103,53,53,53,-90,-96,-97,-91,-92,-101,-98,131,-361,131,131,53,131,131,-271,-286,131,-134,131,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,131,131,-121,131,-217,-149,53,-287,-289,-290,-291,-292,-293,-294,131,131,-120,-102,53,-47,53,-141,131,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,131,131,53,131,131,131,-121,-147,-295,-296,-348,131,-343,-345,53,131,-258,-259,131,53,53,-142,-349,-344,-121,-121,-213,-121,-214,-297,131,131,131,53,-178,-121,-121,-191,131,-199,-200,131,-35,-308,53,53,131,-182,131,-187,53,-208,-298,131,131,-35,131,-347,131,131,131,131,-203,131,-35,131,131,-85,-35,-328,]),'CAP':([8,41,49,50,59,60,61,63,64,65,100,107,108,139,140,146,147,182,189,190,204,205,247,265,272,279,281,282,302,308,309,310,319,320,330,371,402,409,416,417,437,460,477,482,521,539,561,563,568,614,626,],[54,-121,188,-121,54,196,200,-101,-99,-36,-121,-121,200,-121,-121,-31,-32,200,-252,54,-100,54,54,54,200,54,200,200,54,54,54,54,-101,-98,54,54,-120,54,-47,54,54,54,54,54,54,-121,54,54,54,196,200,]),'LPAREN':([8,10,11,12,13,14,30,34,59,61,65,71,73,74,75,76,77,78,80,81,82,83,84,85,98,99,100,101,102,103,104,105,106,107,108,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,142,143,144,145,146,147,148,149,155,179,180,190,199,200,201,205,206,224,225,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,265,266,269,270,271,272,273,276,278,279,280,282,283,284,290,295,302,303,304,308,309,310,316,317,318,325,328,329,330,331,332,334,336,338,340,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,371,372,373,374,375,376,377,380,381,389,390,391,392,394,398,402,406,409,413,414,415,416,417,420,428,429,430,431,432,433,435,436,437,441,442,443,444,447,450,452,455,456,457,458,460,461,462,465,466,468,475,477,482,485,486,490,496,505,508,511,515,517,518,519,521,525,535,539,541,544,547,552,553,561,563,564,566,568,573,575,580,582,598,600,604,605,607,618,620,626,627,],[59,146,146,146,146,155,146,-70,59,-35,-36,146,-365,-366,-367,-368,-369,-370,-371,-372,-373,-374,-375,-376,-121,-121,-121,-121,-121,146,-121,-121,-121,-121,-35,-309,146,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,146,-35,-121,-66,-67,-68,-69,-31,-32,-33,-34,155,-52,-53,59,-35,-56,-57,59,146,-318,146,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,146,-35,146,146,59,146,146,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,146,146,59,146,155,155,146,-35,146,381,146,59,-346,-35,-327,-35,146,146,59,146,-112,59,59,59,-35,-339,-340,146,146,146,59,146,146,381,146,146,-235,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,146,146,-121,146,59,-287,-289,-290,-291,-292,-293,-294,146,-35,146,-48,-49,155,146,-120,-111,59,146,-337,-338,-47,59,146,-241,-233,-244,-234,-245,-242,146,146,59,146,146,155,146,-121,-295,-296,-348,146,-343,-345,59,-35,146,-258,-259,-263,146,59,59,-349,-344,-121,-121,-121,-297,146,146,-262,146,146,59,-58,-121,-121,146,146,-35,-308,146,59,59,146,146,59,-298,146,-35,146,-347,146,146,146,146,146,146,-35,-328,]),'{':([8,9,10,11,12,13,27,34,52,53,54,55,56,57,58,59,60,62,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,141,142,143,144,145,146,147,148,149,170,190,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,265,266,271,272,273,274,275,276,278,279,280,283,290,302,305,307,308,309,310,311,312,313,314,315,319,320,325,327,328,329,330,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,371,372,373,374,375,376,377,380,381,398,402,408,409,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,437,441,442,444,447,449,450,452,455,456,457,458,460,462,465,466,475,477,482,484,485,486,490,496,503,505,507,508,511,518,519,521,530,535,539,540,541,542,543,544,547,552,561,563,564,565,566,567,568,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[61,61,140,140,140,140,140,-70,-76,-78,-79,-80,-81,-82,-83,61,-35,61,-101,-99,-36,140,140,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,-121,140,-121,-121,-35,-150,-151,-309,140,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,140,-35,140,-66,-67,-68,-69,-31,-32,-33,-34,140,61,-89,-93,-94,-95,-56,-57,-84,-100,61,140,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,140,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,140,-35,140,140,61,140,140,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,140,140,61,140,140,-35,140,-148,-269,-285,140,61,-346,-327,140,61,-77,-103,61,61,61,-90,-96,-97,-91,-92,-101,-98,140,-361,140,140,61,140,140,-271,-286,140,-134,140,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,140,140,-121,140,-217,-149,61,-287,-289,-290,-291,-292,-293,-294,140,140,-120,-102,61,-47,61,-141,140,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,140,140,61,140,140,140,-121,-147,-295,-296,-348,140,-343,-345,61,140,-258,-259,140,61,61,-142,-349,-344,-121,-121,-213,-121,-214,-297,140,140,140,61,-178,-121,-121,-191,140,-199,-200,140,-35,-308,61,61,140,-182,140,-187,61,-208,-298,140,-35,140,-347,140,140,140,140,-203,-35,140,140,-85,-35,-328,]),'ID':([8,10,11,12,13,14,34,36,38,41,44,45,46,47,49,50,52,53,54,55,56,57,58,59,60,61,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,141,142,143,144,145,146,147,148,149,155,182,183,186,187,188,189,190,195,196,197,198,199,200,201,202,203,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,265,266,269,270,271,272,273,274,275,276,278,279,280,282,283,290,299,302,305,307,308,309,310,311,312,313,314,315,319,320,325,327,328,329,330,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,371,372,373,374,375,376,377,378,379,380,381,389,394,398,402,403,407,408,409,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,437,441,442,443,444,447,449,450,451,452,455,456,457,458,460,462,465,466,475,477,482,484,485,486,490,496,503,505,507,508,510,511,518,519,521,526,530,535,539,540,541,542,543,544,547,552,561,563,564,565,566,567,568,572,573,574,575,579,580,582,598,600,604,605,607,608,611,614,618,620,621,626,627,],[65,65,65,65,65,65,-70,65,65,-121,65,-130,-131,-132,-251,-121,-76,-78,-79,-80,-81,-82,-83,65,-35,-35,-101,-99,-36,65,65,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,-121,65,-121,-121,-121,-121,-35,-150,-151,65,-309,65,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,65,-35,-121,65,-66,-67,-68,-69,-31,-32,-33,-34,65,-35,65,65,-249,-250,-252,65,-89,-93,-94,-95,65,-56,-57,-84,65,-100,65,65,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,65,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,65,-35,65,65,65,65,65,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,65,65,65,65,65,65,65,-35,65,-148,-269,-285,65,65,-346,-35,-327,65,65,65,-77,-103,65,65,65,-90,-96,-97,-91,-92,-101,-98,65,-361,65,65,65,65,65,-271,-286,65,-134,65,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,65,65,-121,65,-217,-149,65,-287,-289,-290,-291,-292,-293,65,65,-294,65,65,65,65,-120,65,65,-102,65,-47,65,-141,65,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,65,65,65,65,65,65,65,-121,-147,-295,65,-296,-348,65,-343,-345,65,65,-258,-259,65,65,65,-142,-349,-344,-121,-121,-213,-121,-214,-297,65,65,65,65,65,65,-178,-121,-121,-191,65,-199,-200,65,-35,-308,65,65,65,-182,65,-187,65,-208,-298,65,65,65,-35,65,-347,65,65,65,65,-203,65,-35,65,65,-85,-35,-328,]),'RETURN':([10,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,101,102,103,106,107,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,263,266,271,272,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,327,333,334,336,337,339,341,342,343,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,421,422,423,424,427,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,484,485,486,490,503,505,507,508,511,530,540,542,543,544,547,552,564,565,567,572,573,575,580,582,598,600,604,605,607,608,614,618,621,626,627,],[80,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,80,80,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,80,-121,-121,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,80,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,80,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,80,-35,80,80,80,-35,-148,-269,-285,80,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,80,-134,-136,-137,-138,-139,80,80,-121,80,-217,-149,-287,-289,-290,-291,-292,-293,-294,80,-120,-102,-47,-141,-143,-144,-145,-146,-135,80,80,80,80,80,-121,-147,-295,-296,-348,80,-343,-345,80,-258,-259,-142,-349,-344,-121,-213,-121,-214,-297,80,-178,-191,-199,-200,80,-35,-308,80,-182,-187,-208,-298,80,-35,80,-347,80,80,80,80,-203,-35,80,-85,-35,-328,]),'BREAK':([10,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,101,102,103,106,107,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,263,266,271,272,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,327,333,334,336,337,339,341,342,343,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,421,422,423,424,427,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,484,485,486,490,503,505,507,508,511,530,540,542,543,544,547,552,564,565,567,572,573,575,580,582,598,600,604,605,607,608,614,618,621,626,627,],[81,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,81,81,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,81,-121,-121,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,81,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,81,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,81,-35,81,81,81,-35,-148,-269,-285,81,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,81,-134,-136,-137,-138,-139,81,81,-121,81,-217,-149,-287,-289,-290,-291,-292,-293,-294,81,-120,-102,-47,-141,-143,-144,-145,-146,-135,81,81,81,81,81,-121,-147,-295,-296,-348,81,-343,-345,81,-258,-259,-142,-349,-344,-121,-213,-121,-214,-297,81,-178,-191,-199,-200,81,-35,-308,81,-182,-187,-208,-298,81,-35,81,-347,81,81,81,81,-203,-35,81,-85,-35,-328,]),'CONTINUE':([10,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,101,102,103,106,107,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,263,266,271,272,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,327,333,334,336,337,339,341,342,343,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,421,422,423,424,427,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,484,485,486,490,503,505,507,508,511,530,540,542,543,544,547,552,564,565,567,572,573,575,580,582,598,600,604,605,607,608,614,618,621,626,627,],[82,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,82,82,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,82,-121,-121,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,82,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,82,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,82,-35,82,82,82,-35,-148,-269,-285,82,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,82,-134,-136,-137,-138,-139,82,82,-121,82,-217,-149,-287,-289,-290,-291,-292,-293,-294,82,-120,-102,-47,-141,-143,-144,-145,-146,-135,82,82,82,82,82,-121,-147,-295,-296,-348,82,-343,-345,82,-258,-259,-142,-349,-344,-121,-213,-121,-214,-297,82,-178,-191,-199,-200,82,-35,-308,82,-182,-187,-208,-298,82,-35,82,-347,82,82,82,82,-203,-35,82,-85,-35,-328,]),'ERROR':([10,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,101,102,103,106,107,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,263,266,271,272,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,327,333,334,336,337,339,341,342,343,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,421,422,423,424,427,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,484,485,486,490,503,505,507,508,511,530,540,542,543,544,547,552,564,565,567,572,573,575,580,582,598,600,604,605,607,608,614,618,621,626,627,],[83,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,83,83,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,83,-121,-121,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,83,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,83,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,83,-35,83,83,83,-35,-148,-269,-285,83,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,83,-134,-136,-137,-138,-139,83,83,-121,83,-217,-149,-287,-289,-290,-291,-292,-293,-294,83,-120,-102,-47,-141,-143,-144,-145,-146,-135,83,83,83,83,83,-121,-147,-295,-296,-348,83,-343,-345,83,-258,-259,-142,-349,-344,-121,-213,-121,-214,-297,83,-178,-191,-199,-200,83,-35,-308,83,-182,-187,-208,-298,83,-35,83,-347,83,83,83,83,-203,-35,83,-85,-35,-328,]),'COMPILE_INTRINSIC':([10,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,101,102,103,106,107,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,263,266,271,272,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,327,333,334,336,337,339,341,342,343,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,421,422,423,424,427,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,484,485,486,490,503,505,507,508,511,530,540,542,543,544,547,552,564,565,567,572,573,575,580,582,598,600,604,605,607,608,614,618,621,626,627,],[84,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,84,84,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,84,-121,-121,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,84,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,84,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,84,-35,84,84,84,-35,-148,-269,-285,84,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,84,-134,-136,-137,-138,-139,84,84,-121,84,-217,-149,-287,-289,-290,-291,-292,-293,-294,84,-120,-102,-47,-141,-143,-144,-145,-146,-135,84,84,84,84,84,-121,-147,-295,-296,-348,84,-343,-345,84,-258,-259,-142,-349,-344,-121,-213,-121,-214,-297,84,-178,-191,-199,-200,84,-35,-308,84,-182,-187,-208,-298,84,-35,84,-347,84,84,84,84,-203,-35,84,-85,-35,-328,]),'COMPILE_ERROR':([10,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,101,102,103,106,107,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,263,266,271,272,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,327,333,334,336,337,339,341,342,343,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,421,422,423,424,427,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,484,485,486,490,503,505,507,508,511,530,540,542,543,544,547,552,564,565,567,572,573,575,580,582,598,600,604,605,607,608,614,618,621,626,627,],[85,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,85,85,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,85,-121,-121,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,85,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,85,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,85,-35,85,85,85,-35,-148,-269,-285,85,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,85,-134,-136,-137,-138,-139,85,85,-121,85,-217,-149,-287,-289,-290,-291,-292,-293,-294,85,-120,-102,-47,-141,-143,-144,-145,-146,-135,85,85,85,85,85,-121,-147,-295,-296,-348,85,-343,-345,85,-258,-259,-142,-349,-344,-121,-213,-121,-214,-297,85,-178,-191,-199,-200,85,-35,-308,85,-182,-187,-208,-298,85,-35,85,-347,85,85,85,85,-203,-35,85,-85,-35,-328,]),'IF':([10,11,12,15,32,33,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,174,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,292,293,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,397,402,405,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,464,465,466,468,475,476,484,485,486,490,496,503,505,507,508,511,517,519,523,524,530,535,540,541,542,543,544,547,552,559,564,565,566,567,569,570,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[98,98,98,98,-116,-117,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,98,98,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,98,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,98,-35,-66,-67,-68,-69,-31,-32,-33,-34,290,-89,-93,-94,-95,-56,-57,-84,-100,98,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,98,-35,98,98,98,98,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,98,98,98,98,-35,98,-148,-269,-285,98,-346,-327,98,-42,-43,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,98,98,98,98,-271,-286,98,-134,98,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,98,98,-121,98,-217,-149,-287,-289,-290,-291,-292,-293,-294,98,-35,-120,-261,-102,-47,-141,98,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,98,98,98,98,98,-121,-147,-295,-296,-348,98,-343,-345,98,-46,-258,-259,-263,98,-35,-142,-349,-344,-121,-121,-213,-121,-214,-297,98,-262,98,-35,-260,-178,-121,-191,-195,-199,-200,98,-35,-308,582,98,-182,98,-187,582,-194,-208,-298,98,-35,98,-347,98,98,98,98,-203,-35,98,98,-85,-35,-328,]),'IFDEF':([10,11,12,16,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[99,99,99,99,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,99,99,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,99,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,99,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,99,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,99,-35,99,99,99,99,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,99,99,99,99,-35,99,-148,-269,-285,99,-346,-327,99,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,99,99,99,99,-271,-286,99,-134,99,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,99,99,-121,99,-217,-149,-287,-289,-290,-291,-292,-293,-294,99,-120,-102,-47,-141,99,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,99,99,99,99,99,-121,-147,-295,-296,-348,99,-343,-345,99,-258,-259,99,-142,-349,-344,-121,-213,-121,-214,-297,99,99,-178,-121,-191,-199,-200,99,-35,-308,99,-182,99,-187,-208,-298,99,-35,99,-347,99,99,99,99,-203,-35,99,99,-85,-35,-328,]),'IFTYPE':([10,11,12,17,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[100,100,100,100,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,100,100,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,100,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,100,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,100,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,100,-35,100,100,100,100,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,100,100,100,100,-35,100,-148,-269,-285,100,-346,-327,100,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,100,100,100,100,-271,-286,100,-134,100,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,100,100,-121,100,-217,-149,-287,-289,-290,-291,-292,-293,-294,100,-120,-102,-47,-141,100,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,100,100,100,100,100,-121,-147,-295,-296,-348,100,-343,-345,100,-258,-259,100,-142,-349,-344,-121,-213,-121,-214,-297,100,100,-178,-121,-191,-199,-200,100,-35,-308,100,-182,100,-187,-208,-298,100,-35,100,-347,100,100,100,100,-203,-35,100,100,-85,-35,-328,]),'MATCH':([10,11,12,18,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[101,101,101,101,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,101,101,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,101,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,101,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,101,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,101,-35,101,101,101,101,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,101,101,101,101,-35,101,-148,-269,-285,101,-346,-327,101,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,101,101,101,101,-271,-286,101,-134,101,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,101,101,-121,101,-217,-149,-287,-289,-290,-291,-292,-293,-294,101,-120,-102,-47,-141,101,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,101,101,101,101,101,-121,-147,-295,-296,-348,101,-343,-345,101,-258,-259,101,-142,-349,-344,-121,-213,-121,-214,-297,101,101,-178,-121,-191,-199,-200,101,-35,-308,101,-182,101,-187,-208,-298,101,-35,101,-347,101,101,101,101,-203,-35,101,101,-85,-35,-328,]),'WHILE':([10,11,12,19,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[102,102,102,102,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,102,102,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,102,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,102,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,102,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,102,-35,102,102,102,102,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,102,102,102,102,-35,102,-148,-269,-285,102,-346,-327,102,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,102,102,102,102,-271,-286,102,-134,102,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,102,102,-121,102,-217,-149,-287,-289,-290,-291,-292,-293,-294,102,-120,-102,-47,-141,102,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,102,102,102,102,102,-121,-147,-295,-296,-348,102,-343,-345,102,-258,-259,102,-142,-349,-344,-121,-213,-121,-214,-297,102,102,-178,-121,-191,-199,-200,102,-35,-308,102,-182,102,-187,-208,-298,102,-35,102,-347,102,102,102,102,-203,-35,102,102,-85,-35,-328,]),'REPEAT':([10,11,12,20,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[103,103,103,103,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,103,103,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,103,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,103,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,103,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,103,-35,103,103,103,103,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,103,103,103,103,-35,103,-148,-269,-285,103,-346,-327,103,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,103,103,103,103,-271,-286,103,-134,103,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,103,103,-121,103,-217,-149,-287,-289,-290,-291,-292,-293,-294,103,-120,-102,-47,-141,103,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,103,103,103,103,103,-121,-147,-295,-296,-348,103,-343,-345,103,-258,-259,103,-142,-349,-344,-121,-213,-121,-214,-297,103,103,-178,-121,-191,-199,-200,103,-35,-308,103,-182,103,-187,-208,-298,103,-35,103,-347,103,103,103,103,-203,-35,103,103,-85,-35,-328,]),'FOR':([10,11,12,21,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[104,104,104,104,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,104,104,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,104,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,104,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,104,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,104,-35,104,104,104,104,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,104,104,104,104,-35,104,-148,-269,-285,104,-346,-327,104,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,104,104,104,104,-271,-286,104,-134,104,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,104,104,-121,104,-217,-149,-287,-289,-290,-291,-292,-293,-294,104,-120,-102,-47,-141,104,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,104,104,104,104,104,-121,-147,-295,-296,-348,104,-343,-345,104,-258,-259,104,-142,-349,-344,-121,-213,-121,-214,-297,104,104,-178,-121,-191,-199,-200,104,-35,-308,104,-182,104,-187,-208,-298,104,-35,104,-347,104,104,104,104,-203,-35,104,104,-85,-35,-328,]),'WITH':([10,11,12,22,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[105,105,105,105,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,105,105,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,105,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,105,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,105,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,105,-35,105,105,105,105,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,105,105,105,105,-35,105,-148,-269,-285,105,-346,-327,105,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,105,105,105,105,-271,-286,105,-134,105,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,105,105,-121,105,-217,-149,-287,-289,-290,-291,-292,-293,-294,105,-120,-102,-47,-141,105,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,105,105,105,105,105,-121,-147,-295,-296,-348,105,-343,-345,105,-258,-259,105,-142,-349,-344,-121,-213,-121,-214,-297,105,105,-178,-121,-191,-199,-200,105,-35,-308,105,-182,105,-187,-208,-298,105,-35,105,-347,105,105,105,105,-203,-35,105,105,-85,-35,-328,]),'TRY':([10,11,12,23,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[106,106,106,106,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,106,106,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,106,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,106,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,106,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,106,-35,106,106,106,106,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,106,106,106,106,-35,106,-148,-269,-285,106,-346,-327,106,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,106,106,106,106,-271,-286,106,-134,106,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,106,106,-121,106,-217,-149,-287,-289,-290,-291,-292,-293,-294,106,-120,-102,-47,-141,106,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,106,106,106,106,106,-121,-147,-295,-296,-348,106,-343,-345,106,-258,-259,106,-142,-349,-344,-121,-213,-121,-214,-297,106,106,-178,-121,-191,-199,-200,106,-35,-308,106,-182,106,-187,-208,-298,106,-35,106,-347,106,106,106,106,-203,-35,106,106,-85,-35,-328,]),'RECOVER':([10,11,12,24,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[107,107,107,107,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,107,107,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,107,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,107,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,107,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,107,-35,107,107,107,107,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,107,107,107,107,-35,107,-148,-269,-285,107,-346,-327,107,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,107,107,107,107,-271,-286,107,-134,107,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,107,107,-121,107,-217,-149,-287,-289,-290,-291,-292,-293,-294,107,-120,-102,-47,-141,107,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,107,107,107,107,107,-121,-147,-295,-296,-348,107,-343,-345,107,-258,-259,107,-142,-349,-344,-121,-213,-121,-214,-297,107,107,-178,-121,-191,-199,-200,107,-35,-308,107,-182,107,-187,-208,-298,107,-35,107,-347,107,107,107,107,-203,-35,107,107,-85,-35,-328,]),'CONSUME':([10,11,12,25,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,503,505,507,508,511,519,530,535,540,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[108,108,108,108,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,108,108,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,108,-121,-121,-35,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,108,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,108,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,108,-35,108,108,108,108,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,108,108,108,108,-35,108,-148,-269,-285,108,-346,-327,108,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,108,108,108,108,-271,-286,108,-134,108,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,108,108,-121,108,-217,-149,-287,-289,-290,-291,-292,-293,-294,108,-120,-102,-47,-141,108,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,108,108,108,108,108,-121,-147,-295,-296,-348,108,-343,-345,108,-258,-259,108,-142,-349,-344,-121,-213,-121,-214,-297,108,108,-178,-121,-191,-199,-200,108,-35,-308,108,-182,108,-187,-208,-298,108,-35,108,-347,108,108,108,108,-203,-35,108,108,-85,-35,-328,]),'NOT':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[115,115,115,115,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,227,115,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,115,-121,-121,-35,-150,-151,-309,115,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,115,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,115,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,115,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,115,-35,115,115,115,115,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,115,115,115,115,-35,115,-148,-269,-285,115,-346,-327,115,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,115,115,115,115,-271,-286,115,-134,115,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,115,115,-121,115,-217,-149,-287,-289,-290,-291,-292,-293,-294,115,115,-120,-102,-47,-141,115,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,115,115,115,115,115,-121,-147,-295,-296,-348,115,-343,-345,115,-258,-259,115,-142,-349,-344,-121,-121,-213,-121,-214,-297,115,115,115,-178,-121,-191,115,-199,-200,115,-35,-308,115,-182,115,-187,-208,-298,115,-35,115,-347,115,115,115,115,-203,-35,115,115,-85,-35,-328,]),'ADDRESSOF':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[116,116,116,116,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,228,116,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,116,-121,-121,-35,-150,-151,-309,116,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,116,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,116,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,116,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,116,-35,116,116,116,116,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,116,116,116,116,-35,116,-148,-269,-285,116,-346,-327,116,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,116,116,116,116,-271,-286,116,-134,116,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,116,116,-121,116,-217,-149,-287,-289,-290,-291,-292,-293,-294,116,116,-120,-102,-47,-141,116,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,116,116,116,116,116,-121,-147,-295,-296,-348,116,-343,-345,116,-258,-259,116,-142,-349,-344,-121,-121,-213,-121,-214,-297,116,116,116,-178,-121,-191,116,-199,-200,116,-35,-308,116,-182,116,-187,-208,-298,116,-35,116,-347,116,116,116,116,-203,-35,116,116,-85,-35,-328,]),'MINUS':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,150,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,357,361,362,368,369,370,372,373,374,375,376,377,380,381,396,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,522,530,535,540,541,542,543,544,547,552,556,564,565,566,567,572,573,575,580,582,587,598,600,604,605,607,608,614,618,620,621,625,626,627,],[117,117,117,117,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,117,254,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,117,-121,-121,-35,-150,-151,-309,117,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,117,-35,-66,-67,-68,-69,-31,-32,-33,-34,254,-89,-93,-94,-95,-56,-57,-84,-100,117,254,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,117,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,117,-35,117,117,117,117,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,117,117,117,117,-35,117,-148,-269,-285,117,-346,-327,117,-77,-103,-90,-96,-97,-91,-92,-101,-98,254,117,117,117,117,-271,-286,117,-134,117,254,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,117,254,117,-121,117,-217,-149,-287,-289,-290,-291,-292,-293,-294,117,254,117,-120,-102,-47,-141,117,254,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,117,117,117,117,117,-121,-147,-295,-296,-348,117,-343,-345,117,-258,-259,117,-142,-349,-344,-121,-121,-213,-121,-214,-297,117,117,117,254,-178,-121,-191,117,-199,-200,117,-35,-308,254,117,-182,117,-187,-208,-298,117,-35,117,254,-347,117,117,117,117,-203,-35,117,117,-85,254,-35,-328,]),'MINUS_NEW':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[118,118,118,118,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,229,118,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,118,-121,-121,-35,-150,-151,-309,118,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,118,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,118,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,118,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,118,-35,118,118,118,118,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,118,118,118,118,-35,118,-148,-269,-285,118,-346,-327,118,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,118,118,118,118,-271,-286,118,-134,118,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,118,118,-121,118,-217,-149,-287,-289,-290,-291,-292,-293,-294,118,118,-120,-102,-47,-141,118,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,118,118,118,118,118,-121,-147,-295,-296,-348,118,-343,-345,118,-258,-259,118,-142,-349,-344,-121,-121,-213,-121,-214,-297,118,118,118,-178,-121,-191,118,-199,-200,118,-35,-308,118,-182,118,-187,-208,-298,118,-35,118,-347,118,118,118,118,-203,-35,118,118,-85,-35,-328,]),'MINUS_TILDE':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,150,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,357,361,362,368,369,370,372,373,374,375,376,377,380,381,396,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,522,530,535,540,541,542,543,544,547,552,556,564,565,566,567,572,573,575,580,582,587,598,600,604,605,607,608,614,618,620,621,625,626,627,],[119,119,119,119,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,119,258,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,119,-121,-121,-35,-150,-151,-309,119,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,119,-35,-66,-67,-68,-69,-31,-32,-33,-34,258,-89,-93,-94,-95,-56,-57,-84,-100,119,258,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,119,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,119,-35,119,119,119,119,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,119,119,119,119,-35,119,-148,-269,-285,119,-346,-327,119,-77,-103,-90,-96,-97,-91,-92,-101,-98,258,119,119,119,119,-271,-286,119,-134,119,258,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,119,258,119,-121,119,-217,-149,-287,-289,-290,-291,-292,-293,-294,119,258,119,-120,-102,-47,-141,119,258,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,119,119,119,119,119,-121,-147,-295,-296,-348,119,-343,-345,119,-258,-259,119,-142,-349,-344,-121,-121,-213,-121,-214,-297,119,119,119,258,-178,-121,-191,119,-199,-200,119,-35,-308,258,119,-182,119,-187,-208,-298,119,-35,119,258,-347,119,119,119,119,-203,-35,119,119,-85,258,-35,-328,]),'MINUS_TILDE_NEW':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[120,120,120,120,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,230,120,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,120,-121,-121,-35,-150,-151,-309,120,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,120,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,120,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,120,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,120,-35,120,120,120,120,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,120,120,120,120,-35,120,-148,-269,-285,120,-346,-327,120,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,120,120,120,120,-271,-286,120,-134,120,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,120,120,-121,120,-217,-149,-287,-289,-290,-291,-292,-293,-294,120,120,-120,-102,-47,-141,120,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,120,120,120,120,120,-121,-147,-295,-296,-348,120,-343,-345,120,-258,-259,120,-142,-349,-344,-121,-121,-213,-121,-214,-297,120,120,120,-178,-121,-191,120,-199,-200,120,-35,-308,120,-182,120,-187,-208,-298,120,-35,120,-347,120,120,120,120,-203,-35,120,120,-85,-35,-328,]),'DIGESTOF':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[121,121,121,121,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,231,121,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,121,-121,-121,-35,-150,-151,-309,121,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,121,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,121,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,121,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,121,-35,121,121,121,121,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,121,121,121,121,-35,121,-148,-269,-285,121,-346,-327,121,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,121,121,121,121,-271,-286,121,-134,121,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,121,121,-121,121,-217,-149,-287,-289,-290,-291,-292,-293,-294,121,121,-120,-102,-47,-141,121,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,121,121,121,121,121,-121,-147,-295,-296,-348,121,-343,-345,121,-258,-259,121,-142,-349,-344,-121,-121,-213,-121,-214,-297,121,121,121,-178,-121,-191,121,-199,-200,121,-35,-308,121,-182,121,-187,-208,-298,121,-35,121,-347,121,121,121,121,-203,-35,121,121,-85,-35,-328,]),'OBJECT':([10,11,12,13,26,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[139,139,139,139,139,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,139,139,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,139,-121,-121,-35,-150,-151,-309,139,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,139,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,139,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,139,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,139,-35,139,139,139,139,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,139,139,139,139,-35,139,-148,-269,-285,139,-346,-327,139,-77,-103,-90,-96,-97,-91,-92,-101,-98,139,-361,139,139,139,139,-271,-286,139,-134,139,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,139,139,-121,139,-217,-149,-287,-289,-290,-291,-292,-293,-294,139,139,-120,-102,-47,-141,139,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,139,139,139,139,139,-121,-147,-295,-296,-348,139,-343,-345,139,-258,-259,139,-142,-349,-344,-121,-121,-213,-121,-214,-297,139,139,139,-178,-121,-191,139,-199,-200,139,-35,-308,139,-182,139,-187,-208,-298,139,-35,139,-347,139,139,139,139,-203,-35,139,139,-85,-35,-328,]),'TRUE':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,561,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[142,142,142,142,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,142,142,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,142,-121,-121,-35,-150,-151,-309,142,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,142,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,142,142,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,142,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,142,-35,142,142,142,142,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,142,142,142,142,-35,142,-148,-269,-285,142,-346,-327,142,-77,-103,-90,-96,-97,-91,-92,-101,-98,142,-361,142,142,142,142,-271,-286,142,-134,142,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,142,142,-121,142,-217,-149,-287,-289,-290,-291,-292,-293,-294,142,142,-120,-102,-47,142,-141,142,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,142,142,142,142,142,-121,-147,-295,-296,-348,142,-343,-345,142,-258,-259,142,-142,-349,-344,-121,-121,-213,-121,-214,-297,142,142,142,-178,-121,-191,142,-199,-200,142,-35,-308,142,142,-182,142,-187,-208,-298,142,-35,142,-347,142,142,142,142,-203,-35,142,142,-85,-35,-328,]),'FALSE':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,561,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[143,143,143,143,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,143,143,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,143,-121,-121,-35,-150,-151,-309,143,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,143,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,143,143,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,143,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,143,-35,143,143,143,143,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,143,143,143,143,-35,143,-148,-269,-285,143,-346,-327,143,-77,-103,-90,-96,-97,-91,-92,-101,-98,143,-361,143,143,143,143,-271,-286,143,-134,143,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,143,143,-121,143,-217,-149,-287,-289,-290,-291,-292,-293,-294,143,143,-120,-102,-47,143,-141,143,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,143,143,143,143,143,-121,-147,-295,-296,-348,143,-343,-345,143,-258,-259,143,-142,-349,-344,-121,-121,-213,-121,-214,-297,143,143,143,-178,-121,-191,143,-199,-200,143,-35,-308,143,143,-182,143,-187,-208,-298,143,-35,143,-347,143,143,143,143,-203,-35,143,143,-85,-35,-328,]),'INT':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,561,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[144,144,144,144,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,144,144,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,144,-121,-121,-35,-150,-151,-309,144,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,144,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,144,144,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,144,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,144,-35,144,144,144,144,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,144,144,144,144,-35,144,-148,-269,-285,144,-346,-327,144,-77,-103,-90,-96,-97,-91,-92,-101,-98,144,-361,144,144,144,144,-271,-286,144,-134,144,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,144,144,-121,144,-217,-149,-287,-289,-290,-291,-292,-293,-294,144,144,-120,-102,-47,144,-141,144,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,144,144,144,144,144,-121,-147,-295,-296,-348,144,-343,-345,144,-258,-259,144,-142,-349,-344,-121,-121,-213,-121,-214,-297,144,144,144,-178,-121,-191,144,-199,-200,144,-35,-308,144,144,-182,144,-187,-208,-298,144,-35,144,-347,144,144,144,144,-203,-35,144,144,-85,-35,-328,]),'FLOAT':([10,11,12,13,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,205,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,417,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,561,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[145,145,145,145,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,145,145,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,145,-121,-121,-35,-150,-151,-309,145,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,145,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,145,145,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,145,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,145,-35,145,145,145,145,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,145,145,145,145,-35,145,-148,-269,-285,145,-346,-327,145,-77,-103,-90,-96,-97,-91,-92,-101,-98,145,-361,145,145,145,145,-271,-286,145,-134,145,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,145,145,-121,145,-217,-149,-287,-289,-290,-291,-292,-293,-294,145,145,-120,-102,-47,145,-141,145,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,145,145,145,145,145,-121,-147,-295,-296,-348,145,-343,-345,145,-258,-259,145,-142,-349,-344,-121,-121,-213,-121,-214,-297,145,145,145,-178,-121,-191,145,-199,-200,145,-35,-308,145,145,-182,145,-187,-208,-298,145,-35,145,-347,145,145,145,145,-203,-35,145,145,-85,-35,-328,]),'LPAREN_NEW':([10,11,12,13,30,34,52,53,54,55,56,57,58,60,61,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,142,143,144,145,146,147,148,149,179,180,195,196,197,198,199,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,282,283,284,290,295,303,304,305,307,311,312,313,314,315,316,317,318,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,389,390,391,392,398,402,406,408,413,414,415,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,461,462,465,466,468,475,484,485,486,490,496,503,505,507,508,511,515,517,518,519,525,530,535,540,541,542,543,544,547,552,553,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[147,147,147,147,147,-70,-76,-78,-79,-80,-81,-82,-83,-35,-35,-101,-99,-36,241,147,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,147,-121,-121,-35,-150,-151,-309,147,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,147,-35,-121,-66,-67,-68,-69,-31,-32,-33,-34,-52,-53,-89,-93,-94,-95,-35,-56,-57,-84,-100,147,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,147,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,147,-35,147,147,147,147,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,147,147,147,147,-35,147,-148,-269,-285,147,-346,-35,-327,-35,147,147,147,-112,-77,-103,-90,-96,-97,-91,-92,-35,-339,-340,-101,-98,147,-361,147,147,147,147,-271,-286,147,-134,147,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,147,147,-121,147,-217,-149,-287,-289,-290,-291,-292,-293,-294,147,-35,147,-48,-49,147,-120,-111,-102,147,-337,-338,-47,-141,147,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,147,147,147,147,147,-121,-147,-295,-296,-348,147,-343,-345,-35,147,-258,-259,-263,147,-142,-349,-344,-121,-121,-213,-121,-214,-297,147,147,-262,147,147,-58,-178,-121,-191,147,-199,-200,147,-35,-308,147,147,-182,147,-187,-208,-298,147,-35,147,-347,147,147,147,147,-203,-35,147,147,-85,-35,-328,]),'LSQUARE':([10,11,12,13,29,34,61,63,65,71,73,74,75,76,77,78,80,81,82,83,84,85,98,99,101,102,103,106,107,108,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,142,143,144,145,146,147,148,149,178,179,180,199,200,201,206,224,225,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,276,278,280,282,283,284,290,304,316,317,318,319,325,328,329,331,332,334,336,338,340,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,372,373,374,375,376,377,380,381,389,398,402,416,420,428,429,430,431,432,433,435,436,441,442,444,447,450,452,455,456,457,458,461,462,465,466,475,485,486,490,496,505,508,511,518,519,535,541,544,547,552,564,566,573,575,580,582,598,600,604,605,607,618,620,626,627,],[148,148,148,148,148,-70,-35,205,-36,148,-365,-366,-367,-368,-369,-370,-371,-372,-373,-374,-375,-376,-121,-121,-121,-121,148,-121,-121,-35,-309,148,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,148,-35,-121,-66,-67,-68,-69,-31,-32,-33,-34,205,-52,-53,-35,-56,-57,148,-318,148,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,148,-35,148,148,148,148,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,148,148,148,148,-35,148,205,148,-346,-35,-327,205,148,407,407,-339,-340,205,148,148,148,148,148,205,148,148,-235,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,148,148,-121,148,-287,-289,-290,-291,-292,-293,-294,148,-35,148,-120,-47,148,-241,-233,-244,-234,-245,-242,148,148,148,148,148,-121,-295,-296,-348,148,-343,-345,407,148,-258,-259,148,-349,-344,-121,-121,-121,-297,148,148,148,-121,148,148,-35,-308,148,148,-298,148,-35,148,-347,148,148,148,148,148,148,-35,-328,]),'LSQUARE_NEW':([10,11,12,13,29,34,52,53,54,55,56,57,58,60,63,64,65,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,102,103,106,107,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,149,195,196,197,198,200,201,202,204,206,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,246,248,249,250,251,252,253,254,255,256,257,258,259,260,263,264,266,271,272,273,274,275,276,278,280,283,290,305,307,311,312,313,314,315,319,320,325,327,328,329,331,332,333,334,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,361,362,368,369,370,372,373,374,375,376,377,380,381,398,402,408,416,419,420,421,422,423,424,427,428,429,430,431,432,433,435,436,441,442,444,447,449,450,452,455,456,457,458,462,465,466,475,484,485,486,490,496,503,505,507,508,511,518,519,530,535,540,541,542,543,544,547,552,564,565,566,567,572,573,575,580,582,598,600,604,605,607,608,614,618,620,621,626,627,],[149,149,149,149,149,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,242,149,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-121,-121,-121,-121,149,-121,-121,-35,-150,-151,-309,149,-270,-273,-274,-275,-276,-277,-278,-279,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,149,-35,-66,-67,-68,-69,-31,-32,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,149,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,149,-272,-280,-281,-282,-283,-284,-288,-319,-320,-321,-322,-323,-324,-325,-326,149,-35,149,149,149,149,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,149,149,149,149,-35,149,-148,-269,-285,149,-346,-327,149,-77,-103,-90,-96,-97,-91,-92,-101,-98,149,-361,149,149,149,149,-271,-286,149,-134,149,-136,-235,-137,-138,-139,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,149,149,-121,149,-217,-149,-287,-289,-290,-291,-292,-293,-294,149,149,-120,-102,-47,-141,149,-143,-144,-145,-146,-135,-241,-233,-244,-234,-245,-242,149,149,149,149,149,-121,-147,-295,-296,-348,149,-343,-345,149,-258,-259,149,-142,-349,-344,-121,-121,-213,-121,-214,-297,149,149,149,-178,-121,-191,149,-199,-200,149,-35,-308,149,-182,149,-187,-208,-298,149,-35,149,-347,149,149,149,149,-203,-35,149,149,-85,-35,-328,]),'BIG_ARROW':([32,33,34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,402,405,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,468,476,484,485,486,496,503,507,508,517,523,524,530,540,541,542,543,547,552,553,559,565,567,569,570,572,573,576,577,578,580,581,589,593,598,601,608,609,610,614,621,626,627,],[-116,-117,-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-120,-261,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-263,-35,-142,-349,-344,-121,-213,-214,-297,-262,-35,-260,-178,-191,-195,-199,-200,-35,-308,-35,-257,-182,-187,-257,-194,-208,-298,-148,-329,-330,-35,600,607,-35,-347,-256,-203,618,-331,-35,-85,-35,-328,]),'END':([32,33,34,43,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,139,142,143,144,145,184,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,281,283,297,298,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,356,360,367,369,370,372,373,374,375,376,377,380,388,399,400,402,404,405,408,416,419,421,422,423,424,427,434,438,439,440,445,446,448,449,450,452,455,457,459,465,466,468,476,484,485,486,487,488,489,491,492,494,495,496,497,498,500,503,504,506,507,508,513,514,517,522,523,524,530,532,533,534,536,537,538,540,541,542,543,545,546,547,552,559,565,567,569,570,571,572,573,580,581,586,589,590,598,599,601,603,606,608,613,614,615,616,617,621,622,623,626,627,],[-116,-117,-70,-127,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-121,-66,-67,-68,-69,-126,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-35,-327,-248,-125,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-356,-193,-216,-217,-149,-287,-289,-290,-291,-292,-293,-294,-114,-124,-247,-120,-129,-261,-102,-47,-141,-143,-144,-145,-146,-135,-216,-216,-216,-216,503,-202,507,-147,-295,-296,-348,-343,-248,-258,-259,-263,-35,-142,-349,-344,530,-179,-180,-216,-216,540,-192,-121,542,543,-216,-213,-212,-215,-214,-297,552,-113,-262,-128,-35,-260,-178,565,-183,-184,567,-188,-189,-191,-195,-199,-200,572,-201,-35,-308,-257,-182,-187,-257,-194,-216,-208,-298,-35,-255,-216,-197,608,-347,-253,-256,-181,-198,-203,-254,-35,-216,-216,-196,-85,-185,-190,-35,-328,]),'.':([34,63,65,112,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,146,147,200,201,224,232,233,234,235,236,237,238,239,240,276,283,334,372,373,374,375,376,377,380,398,416,450,452,455,457,465,466,471,485,486,508,518,520,547,552,573,580,598,626,627,],[-70,203,-36,-309,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-31,-32,-56,-57,-318,-288,-319,-320,-321,-322,-323,-324,-325,-326,378,-327,378,-287,-289,-290,-291,-292,-293,-294,471,-47,-295,-296,-348,-343,-258,-259,520,-349,-344,-297,471,557,-35,-308,-298,-35,-347,-35,-328,]),'~':([34,65,112,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,200,201,224,232,233,234,235,236,237,238,239,240,253,255,256,257,259,260,276,283,334,340,348,350,351,353,354,372,373,374,375,376,377,380,416,450,452,455,457,465,466,485,486,508,547,552,573,580,598,626,627,],[-70,-36,-309,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-56,-57,-318,-288,-319,-320,-321,-322,-323,-324,-325,-326,344,345,346,347,349,352,379,-327,379,428,429,430,431,432,433,-287,-289,-290,-291,-292,-293,-294,-47,-295,-296,-348,-343,-258,-259,-349,-344,-297,-35,-308,-298,-35,-347,-35,-328,]),'=':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,154,176,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,246,259,260,261,274,275,276,283,305,307,311,312,313,314,315,319,320,327,329,333,334,337,339,341,342,343,357,366,369,370,372,373,374,375,376,377,380,393,396,404,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,470,472,480,484,485,486,503,507,508,522,527,530,540,542,543,547,550,552,556,558,565,567,572,573,580,587,597,598,608,612,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,246,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,246,-204,294,-89,-93,-94,-95,-56,-57,-84,-100,329,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,340,350,353,354,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,246,340,-271,-286,-134,246,-137,-138,-139,246,444,-217,-149,-287,-289,-290,-291,-292,-293,-294,-205,246,475,-102,-47,-141,246,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,519,-267,-148,-142,-349,-344,-213,-214,-297,246,561,-178,-191,-199,-200,-35,575,-308,246,-268,-182,-187,-208,-298,-35,246,-148,-347,-203,620,-35,-85,246,-35,-328,]),'AS':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,142,143,144,145,148,149,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,242,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,247,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,279,-66,-67,-68,-69,-33,-34,247,-89,-93,-94,-95,-56,-57,-84,-100,330,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,279,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,247,-271,-286,-134,247,-137,-138,-139,247,-217,-149,-287,-289,-290,-291,-292,-293,-294,247,-102,-47,-141,247,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,247,-178,-191,-199,-200,-35,-308,247,-182,-187,-208,-298,-35,247,-347,-203,-35,-85,247,-35,-328,]),'IS':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,139,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,281,283,304,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,388,396,401,402,406,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,525,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,248,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-121,-66,-67,-68,-69,248,-89,-93,-94,-95,-56,-57,-84,-100,331,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-35,-327,-112,-77,-103,-90,-96,-97,-91,-92,-101,-98,248,-271,-286,-134,248,-137,-138,-139,248,-217,-149,-287,-289,-290,-291,-292,-293,-294,460,248,460,-120,-111,-102,-47,-141,248,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,248,-58,-178,-191,-199,-200,-35,-308,248,-182,-187,-208,-298,-35,248,-347,-203,-35,-85,248,-35,-328,]),'ISNT':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,249,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,249,-89,-93,-94,-95,-56,-57,-84,-100,332,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,249,-271,-286,-134,249,-137,-138,-139,249,-217,-149,-287,-289,-290,-291,-292,-293,-294,249,-102,-47,-141,249,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,249,-178,-191,-199,-200,-35,-308,249,-182,-187,-208,-298,-35,249,-347,-203,-35,-85,249,-35,-328,]),'AND':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,250,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,250,-89,-93,-94,-95,-56,-57,-84,-100,250,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,250,-271,-286,-134,250,-137,-138,-139,250,-217,-149,-287,-289,-290,-291,-292,-293,-294,250,-102,-47,-141,250,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,250,-178,-191,-199,-200,-35,-308,250,-182,-187,-208,-298,-35,250,-347,-203,-35,-85,250,-35,-328,]),'OR':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,251,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,251,-89,-93,-94,-95,-56,-57,-84,-100,251,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,251,-271,-286,-134,251,-137,-138,-139,251,-217,-149,-287,-289,-290,-291,-292,-293,-294,251,-102,-47,-141,251,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,251,-178,-191,-199,-200,-35,-308,251,-182,-187,-208,-298,-35,251,-347,-203,-35,-85,251,-35,-328,]),'XOR':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,252,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,252,-89,-93,-94,-95,-56,-57,-84,-100,252,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,252,-271,-286,-134,252,-137,-138,-139,252,-217,-149,-287,-289,-290,-291,-292,-293,-294,252,-102,-47,-141,252,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,252,-178,-191,-199,-200,-35,-308,252,-182,-187,-208,-298,-35,252,-347,-203,-35,-85,252,-35,-328,]),'PLUS':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,253,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,253,-89,-93,-94,-95,-56,-57,-84,-100,253,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,253,-271,-286,-134,253,-137,-138,-139,253,-217,-149,-287,-289,-290,-291,-292,-293,-294,253,-102,-47,-141,253,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,253,-178,-191,-199,-200,-35,-308,253,-182,-187,-208,-298,-35,253,-347,-203,-35,-85,253,-35,-328,]),'*':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,255,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,255,-89,-93,-94,-95,-56,-57,-84,-100,255,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,255,-271,-286,-134,255,-137,-138,-139,255,-217,-149,-287,-289,-290,-291,-292,-293,-294,255,-102,-47,-141,255,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,255,-178,-191,-199,-200,-35,-308,255,-182,-187,-208,-298,-35,255,-347,-203,-35,-85,255,-35,-328,]),'/':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,256,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,256,-89,-93,-94,-95,-56,-57,-84,-100,256,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,256,-271,-286,-134,256,-137,-138,-139,256,-217,-149,-287,-289,-290,-291,-292,-293,-294,256,-102,-47,-141,256,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,256,-178,-191,-199,-200,-35,-308,256,-182,-187,-208,-298,-35,256,-347,-203,-35,-85,256,-35,-328,]),'%':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,257,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,257,-89,-93,-94,-95,-56,-57,-84,-100,257,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,257,-271,-286,-134,257,-137,-138,-139,257,-217,-149,-287,-289,-290,-291,-292,-293,-294,257,-102,-47,-141,257,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,257,-178,-191,-199,-200,-35,-308,257,-182,-187,-208,-298,-35,257,-347,-203,-35,-85,257,-35,-328,]),'<':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,259,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,259,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,259,-89,-93,-94,-95,-56,-57,-84,-100,259,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,348,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,259,-271,-286,-134,259,-137,-138,-139,259,-217,-149,-287,-289,-290,-291,-292,-293,-294,259,-102,-47,-141,259,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,259,-178,-191,-199,-200,-35,-308,259,-182,-187,-208,-298,-35,259,-347,-203,-35,-85,259,-35,-328,]),'>':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,260,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,378,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,260,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,260,-89,-93,-94,-95,-56,-57,-84,-100,260,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,351,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,260,-271,-286,-134,260,-137,-138,-139,260,-217,-149,-287,-289,-290,-291,-292,-293,451,-294,260,-102,-47,-141,260,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,260,-178,-191,-199,-200,-35,-308,260,-182,-187,-208,-298,-35,260,-347,-203,-35,-85,260,-35,-328,]),'!':([34,52,53,54,55,56,57,58,60,63,64,65,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,150,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,357,369,370,372,373,374,375,376,377,380,396,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,522,530,540,542,543,547,552,556,565,567,572,573,580,587,598,608,614,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,261,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,261,-89,313,313,313,-56,-57,-84,-100,261,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,261,-271,-286,-134,261,-137,-138,-139,261,-217,-149,-287,-289,-290,-291,-292,-293,-294,261,-102,-47,-141,261,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,261,-178,-191,-199,-200,-35,-308,261,-182,-187,-208,-298,-35,261,-347,-203,-35,-85,261,-35,-328,]),';':([34,52,53,54,55,56,57,58,60,63,64,65,70,72,79,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,274,275,276,283,305,307,311,312,313,314,315,319,320,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,530,540,542,543,547,552,565,567,572,573,580,598,608,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,206,-360,-133,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,-178,-191,-199,-200,-35,-308,-182,-187,-208,-298,-35,-347,-203,-35,-85,-35,-328,]),'UNTIL':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,268,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,530,540,542,543,547,552,565,567,572,573,580,598,608,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,362,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,-178,-191,-199,-200,-35,-308,-182,-187,-208,-298,-35,-347,-203,-35,-85,-35,-328,]),')':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,146,147,154,191,192,193,194,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,277,283,285,286,305,306,307,311,312,313,314,315,319,320,326,327,333,334,335,337,339,341,342,343,369,370,372,373,374,375,376,377,380,381,382,383,393,398,408,410,411,412,416,419,421,422,423,424,425,427,449,450,452,453,454,455,457,462,463,465,466,467,469,470,472,481,482,484,485,486,503,507,508,509,511,512,516,528,529,530,540,542,543,547,548,549,551,552,554,555,556,557,558,563,565,567,572,573,580,585,591,592,594,595,596,597,598,608,612,614,619,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-31,-32,-204,307,-106,-107,-108,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-35,-327,393,-206,-77,408,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-35,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-301,455,-351,-205,468,-102,-105,-109,-110,-47,-141,-143,-144,-145,-146,485,-135,-147,-295,-296,-303,-299,-348,-343,-301,-207,-258,-259,517,-352,-264,-267,-104,-88,-142,-349,-344,-213,-214,-297,547,-301,-350,-303,562,-86,-178,-191,-199,-200,-35,-302,-304,-300,-308,580,-353,-265,-266,-268,-88,-182,-187,-208,-298,-35,-87,-305,-306,610,-332,-334,-148,-347,-203,-335,-35,-333,-85,-336,-35,-328,]),',':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,154,191,192,193,194,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,277,283,285,286,300,301,305,306,307,311,312,313,314,315,319,320,321,322,323,324,326,327,333,334,335,337,339,341,342,343,364,365,369,370,372,373,374,375,376,377,380,382,383,393,408,410,411,412,416,418,419,421,422,423,424,425,427,449,450,452,454,455,457,463,465,466,467,469,470,472,474,478,479,480,481,483,484,485,486,501,502,503,507,508,512,527,529,530,540,542,543,547,548,549,552,555,556,557,558,560,565,567,572,573,580,583,591,592,594,595,596,597,598,608,612,614,619,621,625,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-204,308,-106,-107,-108,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-35,-327,394,-206,403,-122,-77,409,-103,-90,-96,-97,-91,-92,-101,-98,417,-50,-63,-64,-358,-361,-271,-286,-35,-134,-136,-137,-138,-139,443,-209,-217,-149,-287,-289,-290,-291,-292,-293,-294,456,-351,-205,-102,-105,-109,-110,-47,-65,-141,-143,-144,-145,-146,456,-135,-147,-295,-296,511,-348,-343,-207,-258,-259,518,-352,-264,-267,-123,526,-59,-148,-104,-51,-142,-349,-344,-210,-211,-213,-214,-297,-350,-61,563,-178,-191,-199,-200,-35,574,-304,-308,-353,-265,-266,-268,-60,-182,-187,-208,-298,-35,-62,-305,-306,611,-332,-334,-148,-347,-203,-335,-35,-333,-85,-336,-35,-328,]),'THEN':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,262,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,356,357,358,367,369,370,372,373,374,375,376,377,380,408,416,419,421,422,423,424,427,446,449,450,452,455,457,465,466,484,485,486,493,503,506,507,508,530,531,540,542,543,547,552,565,567,572,573,580,587,588,598,608,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,355,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-356,435,436,-216,-217,-149,-287,-289,-290,-291,-292,-293,-294,-102,-47,-141,-143,-144,-145,-146,-135,505,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-186,-213,-215,-214,-297,-178,564,-191,-199,-200,-35,-308,-182,-187,-208,-298,-35,604,605,-347,-203,-35,-85,-35,-328,]),'DO':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,267,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,356,364,365,369,370,372,373,374,375,376,377,380,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,499,501,502,503,507,508,530,540,542,543,547,552,565,567,572,573,580,598,608,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,361,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-356,442,-209,-217,-149,-287,-289,-290,-291,-292,-293,-294,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,544,-210,-211,-213,-214,-297,-178,-191,-199,-200,-35,-308,-182,-187,-208,-298,-35,-347,-203,-35,-85,-35,-328,]),'ELSE':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,356,360,367,369,370,372,373,374,375,376,377,380,402,408,416,419,421,422,423,424,427,434,438,439,440,449,450,452,455,457,465,466,484,485,486,491,492,495,496,500,503,507,508,530,540,541,542,543,547,552,565,567,569,570,571,572,573,580,586,589,598,601,606,608,614,615,616,617,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-356,-193,447,-217,-149,-287,-289,-290,-291,-292,-293,-294,-120,-102,-47,-141,-143,-144,-145,-146,-135,447,447,447,447,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,447,447,-192,-121,447,-213,-214,-297,-178,-191,-195,-199,-200,-35,-308,-182,-187,-257,-194,447,-208,-298,-35,447,-197,-347,-256,-198,-203,-35,447,447,-196,-85,-35,-328,]),'|':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,192,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,360,369,370,372,373,374,375,376,377,380,402,408,416,419,421,422,423,424,427,438,449,450,452,455,457,465,466,484,485,486,495,496,503,507,508,530,540,541,542,543,547,552,565,567,569,570,572,573,580,589,598,601,606,608,614,617,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,310,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-193,-217,-149,-287,-289,-290,-291,-292,-293,-294,-120,-102,-47,-141,-143,-144,-145,-146,-135,496,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-192,-121,-213,-214,-297,-178,-191,-195,-199,-200,-35,-308,-182,-187,-257,-194,-208,-298,-35,-197,-347,-256,-198,-203,-35,-196,-85,-35,-328,]),']':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,142,143,144,145,148,149,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,278,280,283,305,307,311,312,313,314,315,319,320,321,322,323,324,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,384,385,386,408,416,418,419,421,422,423,424,426,427,449,450,452,455,457,458,465,466,478,479,480,483,484,485,486,503,507,508,527,530,540,542,543,547,552,560,565,567,572,573,580,583,598,608,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-35,-66,-67,-68,-69,-33,-34,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-35,-346,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,416,-50,-63,-64,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,457,-341,-342,-102,-47,-65,-141,-143,-144,-145,-146,486,-135,-147,-295,-296,-348,-343,-345,-258,-259,525,-59,-148,-51,-142,-349,-344,-213,-214,-297,-61,-178,-191,-199,-200,-35,-308,-60,-182,-187,-208,-298,-35,-62,-347,-203,-35,-85,-35,-328,]),'ELSEIF':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,408,416,419,421,422,423,424,427,434,449,450,452,455,457,465,466,484,485,486,491,492,503,507,508,530,540,542,543,547,552,565,567,572,573,580,586,598,608,614,615,616,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-102,-47,-141,-143,-144,-145,-146,-135,490,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,535,539,-213,-214,-297,-178,-191,-199,-200,-35,-308,-182,-187,-208,-298,-35,490,-347,-203,-35,535,539,-85,-35,-328,]),'WHERE':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,146,147,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,381,408,416,419,421,422,423,424,427,449,450,452,453,454,455,457,462,465,466,484,485,486,503,507,508,511,516,530,540,542,543,547,551,552,565,567,572,573,580,598,608,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-31,-32,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-301,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,510,-299,-348,-343,-301,-258,-259,-142,-349,-344,-213,-214,-297,-301,510,-178,-191,-199,-200,-35,-300,-308,-182,-187,-208,-298,-35,-347,-203,-35,-85,-35,-328,]),'}':([34,52,53,54,55,56,57,58,60,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,109,110,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,195,196,197,198,200,201,202,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,226,232,233,234,235,236,237,238,239,240,243,244,274,275,276,283,305,307,311,312,313,314,315,319,320,326,327,333,334,337,339,341,342,343,369,370,372,373,374,375,376,377,380,408,416,419,421,422,423,424,427,449,450,452,455,457,465,466,484,485,486,503,507,508,530,540,542,543,547,552,562,565,567,572,573,580,584,598,602,608,614,621,624,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-354,-355,-357,-35,-360,-365,-366,-367,-368,-369,-370,-133,-371,-372,-373,-374,-375,-376,-154,-155,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-150,-151,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,-89,-93,-94,-95,-56,-57,-84,-100,-359,-362,-140,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-152,-153,-318,-272,-288,-319,-320,-321,-322,-323,-324,-325,-326,-363,-364,-148,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-358,-361,-271,-286,-134,-136,-137,-138,-139,-217,-149,-287,-289,-290,-291,-292,-293,-294,-102,-47,-141,-143,-144,-145,-146,-135,-147,-295,-296,-348,-343,-258,-259,-142,-349,-344,-213,-214,-297,-178,-191,-199,-200,-35,-308,-148,-182,-187,-208,-298,-35,-35,-347,614,-203,-35,-85,626,-35,-328,]),':':([34,52,53,54,55,56,57,58,60,63,64,65,112,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,142,143,144,145,185,195,196,197,198,200,201,202,204,274,275,276,283,305,307,311,312,313,314,315,319,320,372,373,374,375,376,377,380,387,405,408,416,450,452,455,457,465,466,468,472,480,508,517,547,552,553,562,573,576,577,578,580,597,598,610,614,621,626,627,],[-70,-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-309,-270,-288,-310,-311,-312,-313,-314,-315,-316,-317,-307,-71,-72,-73,-74,-75,-66,-67,-68,-69,302,-89,-93,-94,-95,-56,-57,-84,-100,371,-269,-285,-327,-77,-103,-90,-96,-97,-91,-92,-101,-98,-287,-289,-290,-291,-292,-293,-294,458,477,-102,-47,-295,-296,-348,-343,-258,-259,-263,521,371,-297,-262,-35,-308,-35,371,-298,371,-329,-330,-35,371,-347,-331,-35,-85,-35,-328,]),'BACKSLASH':([41,50,65,98,99,100,101,102,104,105,106,107,139,140,300,301,362,447,474,490,496,505,535,539,],[183,183,-36,183,183,183,183,183,183,183,183,183,183,183,402,-122,183,183,-123,183,183,183,183,183,]),'&':([52,53,54,55,56,57,58,60,63,64,65,192,195,196,197,198,202,204,305,307,311,312,313,314,315,319,320,408,416,614,621,],[-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,309,-89,-93,-94,-95,-84,-100,-77,-103,-90,-96,-97,-91,-92,-101,-98,-102,-47,-35,-85,]),'IS_SUBTYPE':([52,53,54,55,56,57,58,60,63,64,65,195,196,197,198,202,204,305,307,311,312,313,314,315,319,320,359,408,416,614,621,],[-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-89,-93,-94,-95,-84,-100,-77,-103,-90,-96,-97,-91,-92,-101,-98,437,-102,-47,-35,-85,]),'?':([52,53,54,55,56,57,58,60,63,64,65,195,196,197,198,202,204,245,250,251,252,253,254,255,256,257,258,259,260,305,307,311,312,313,314,315,319,320,328,340,344,345,346,347,348,349,350,351,352,353,354,397,405,408,416,428,429,430,431,432,433,449,468,476,517,524,547,553,562,576,577,578,580,584,593,610,614,621,],[-76,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-89,-93,-94,-95,-84,-100,338,-218,-219,-220,-221,-222,-223,-224,-225,-227,-237,-240,-77,-103,-90,-96,-97,-91,-92,-101,-98,420,-235,-226,-228,-229,-230,-231,-243,-238,-232,-246,-239,-236,465,-261,-102,-47,-241,-233,-244,-234,-245,-242,-147,-263,465,-262,-260,465,-35,-148,-148,-329,-330,465,465,465,-331,-35,-85,]),'SMALL_ARROW':([52,53,54,55,56,57,58,60,63,64,65,195,196,197,198,202,204,307,311,312,313,314,315,319,320,408,416,614,621,],[190,-78,-79,-80,-81,-82,-83,-35,-101,-99,-36,-89,-93,-94,-95,-84,-100,-103,-90,-96,-97,-91,-92,-101,-98,-102,-47,-35,-85,]),'GENCAP':([60,63,64,65,204,319,320,416,614,],[197,-101,-99,-36,-100,-101,-98,-47,197,]),'^':([60,63,64,65,196,197,198,204,319,320,416,614,],[-35,-101,-99,-36,312,312,312,-100,-101,-98,-47,-35,]),'IN':([65,154,363,393,],[-36,-204,441,-205,]),'#':([205,417,561,],[325,325,325,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'entry':([0,],[1,]),'module':([0,],[2,]),'docstring':([0,40,523,],[31,181,559,]),'string':([0,10,11,12,13,38,40,70,71,103,113,137,141,205,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,417,420,435,436,441,442,444,456,462,475,511,518,519,523,541,544,561,564,566,575,582,600,604,605,607,618,620,],[32,136,136,136,136,180,32,136,136,136,136,136,180,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,32,136,136,136,136,136,136,136,136,136,136,136,136,136,]),'empty':([0,36,40,60,61,71,108,138,174,182,199,242,272,277,278,281,282,284,316,335,389,397,461,476,523,547,553,580,584,593,614,626,],[33,177,33,198,201,243,201,280,291,201,318,280,201,383,386,201,201,392,415,383,318,466,415,466,33,466,578,466,466,466,198,201,]),'use':([3,173,],[35,288,]),'use_ffi':([4,175,],[37,293,]),'class_def':([5,287,],[39,395,]),'class_decl':([5,287,],[40,40,]),'fields':([6,181,459,],[42,297,297,]),'field':([6,42,181,297,459,],[43,184,43,184,43,]),'varkw':([6,10,11,12,13,42,70,71,103,137,181,206,241,245,246,248,249,263,264,266,271,273,278,290,297,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,459,462,475,511,519,541,544,564,566,575,582,600,604,605,607,618,620,],[44,111,111,111,111,44,111,111,111,111,44,111,111,111,111,111,111,111,111,111,111,111,111,111,44,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,44,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'method':([7,298,399,],[48,400,400,]),'meth_decl':([7,298,399,],[49,49,49,]),'type':([8,59,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[51,192,305,323,341,359,387,404,192,192,192,422,449,192,323,493,514,524,529,558,323,529,359,]),'atomtype':([8,59,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'combined_types':([8,59,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'nominal':([8,59,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'lambdatype':([8,9,59,62,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[57,66,57,202,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'barelambdatype':([8,59,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'namespaced':([8,59,190,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'id':([8,10,11,12,13,14,36,38,44,59,70,71,103,111,113,137,141,155,183,186,190,199,203,205,206,225,241,245,246,247,248,249,263,264,265,266,269,270,271,273,278,279,290,299,302,308,309,310,325,328,329,330,331,332,336,338,355,361,368,371,378,379,381,389,394,398,403,407,409,417,420,435,436,437,441,442,443,444,451,456,460,462,475,477,482,510,511,518,519,521,526,541,544,561,563,564,566,568,574,575,579,582,600,604,605,607,611,618,620,],[63,112,112,112,112,154,176,179,185,63,224,112,112,274,112,112,179,154,301,304,63,317,319,63,112,112,112,112,112,63,112,112,112,112,63,112,154,154,112,112,112,63,112,304,63,63,63,63,112,112,112,63,112,112,112,112,112,112,112,63,450,452,112,317,154,112,474,480,63,63,112,112,112,63,112,112,154,112,508,112,63,112,112,63,63,550,112,112,112,63,480,112,112,63,63,112,112,63,550,112,597,112,112,112,112,112,597,112,112,]),'typeargs_id':([8,59,190,203,205,247,265,279,302,308,309,310,330,371,409,417,437,460,477,482,521,561,563,568,],[64,64,64,320,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'rawseq':([10,71,103,137,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[67,244,268,277,335,356,360,367,385,426,434,439,448,454,491,492,499,500,502,512,454,454,571,586,592,601,613,615,616,617,624,]),'exprseq':([10,71,103,137,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'jump':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[69,207,69,69,69,326,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'infixseq':([10,71,103,137,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'jump_statement':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'infix':([10,11,71,103,137,206,241,246,263,264,266,271,278,290,329,336,355,361,368,381,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[72,150,72,72,72,327,72,339,72,357,72,72,72,396,421,72,72,72,72,72,72,72,72,72,72,72,72,522,72,556,72,72,587,72,72,72,72,72,72,72,625,]),'return':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'break':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'continue':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'pony_error':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'compile_intrinsic':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'compile_error':([10,70,71,103,137,206,241,263,266,271,278,336,355,361,368,381,435,436,441,442,444,456,462,511,544,564,575,582,600,604,605,607,618,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'term':([10,11,12,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[79,79,151,79,79,79,79,79,337,79,342,343,79,79,79,79,369,79,79,419,79,423,424,79,427,79,79,79,79,484,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'if':([10,11,12,15,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[86,86,86,156,210,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,]),'ifdef':([10,11,12,16,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[87,87,87,157,211,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'iftype':([10,11,12,17,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[88,88,88,158,212,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'match':([10,11,12,18,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[89,89,89,159,213,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'while':([10,11,12,19,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[90,90,90,160,214,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'repeat':([10,11,12,20,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[91,91,91,161,215,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'for':([10,11,12,21,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[92,92,92,162,216,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'with':([10,11,12,22,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[93,93,93,163,217,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'try':([10,11,12,23,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[94,94,94,164,218,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'recover':([10,11,12,24,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[95,95,95,165,219,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'consume':([10,11,12,25,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,544,564,566,575,582,600,604,605,607,618,620,],[96,96,96,166,220,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,]),'pattern':([10,11,12,13,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,541,544,564,566,575,582,600,604,605,607,618,620,],[97,97,97,152,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,570,97,97,97,97,97,97,97,97,97,97,97,]),'vardecl':([10,11,12,13,70,71,103,137,206,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,420,435,436,441,442,444,456,462,475,511,519,541,544,564,566,575,582,600,604,605,607,618,620,],[109,109,109,109,222,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'parampattern':([10,11,12,13,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[110,110,110,110,110,110,275,110,110,333,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,472,110,110,110,110,110,110,110,110,110,110,472,110,110,110,110,110,110,110,110,110,110,110,110,110,]),'parampatternprefix':([10,11,12,13,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'postfix':([10,11,12,13,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,418,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'atom':([10,11,12,13,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,]),'this':([10,11,12,13,70,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,579,582,600,604,605,607,611,618,620,],[123,123,123,123,233,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,596,123,123,123,123,123,596,123,123,]),'literal':([10,11,12,13,70,71,103,113,137,205,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,417,420,435,436,441,442,444,456,462,475,511,518,519,541,544,561,564,566,575,582,600,604,605,607,618,620,],[124,124,124,124,234,124,124,124,124,324,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,324,124,124,124,124,124,124,124,124,124,124,124,124,124,124,324,124,124,124,124,124,124,124,124,124,124,]),'tuple':([10,11,12,13,30,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[125,125,125,125,172,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,]),'array':([10,11,12,13,29,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[126,126,126,126,171,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'object':([10,11,12,13,26,70,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[127,127,127,127,167,237,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'lambda':([10,11,12,13,27,70,71,103,113,137,141,170,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[128,128,128,128,168,238,128,128,128,128,283,283,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'barelambda':([10,11,12,13,28,70,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[129,129,129,129,169,239,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'fficall':([10,11,12,13,70,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[130,130,130,130,240,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'true':([10,11,12,13,70,71,103,113,137,205,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,417,420,435,436,441,442,444,456,462,475,511,518,519,541,544,561,564,566,575,582,600,604,605,607,618,620,],[132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,]),'false':([10,11,12,13,70,71,103,113,137,205,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,417,420,435,436,441,442,444,456,462,475,511,518,519,541,544,561,564,566,575,582,600,604,605,607,618,620,],[133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,]),'int':([10,11,12,13,70,71,103,113,137,205,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,417,420,435,436,441,442,444,456,462,475,511,518,519,541,544,561,564,566,575,582,600,604,605,607,618,620,],[134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,]),'float':([10,11,12,13,70,71,103,113,137,205,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,417,420,435,436,441,442,444,456,462,475,511,518,519,541,544,561,564,566,575,582,600,604,605,607,618,620,],[135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,]),'anylparen':([10,11,12,13,30,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,295,303,325,328,329,331,332,336,338,355,361,368,381,390,398,413,420,435,436,441,442,444,456,462,475,511,515,518,519,541,544,553,564,566,575,582,600,604,605,607,618,620,],[137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,398,398,137,137,137,137,137,137,137,137,137,137,137,462,137,482,137,137,137,137,137,137,137,137,137,137,398,137,137,137,137,579,137,137,137,137,137,137,137,137,137,137,]),'anysquare':([10,11,12,13,29,71,103,113,137,206,225,241,245,246,248,249,263,264,266,271,273,278,290,325,328,329,331,332,336,338,355,361,368,381,398,420,435,436,441,442,444,456,462,475,511,518,519,541,544,564,566,575,582,600,604,605,607,618,620,],[138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'idseq':([14,155,269,270,394,443,],[153,286,363,366,463,366,]),'uses':([31,],[173,]),'used':([36,],[174,]),'used_id':([36,],[175,]),'id_or_string':([38,141,],[178,284,]),'annotations':([41,50,98,99,100,101,102,104,105,106,107,139,140,362,447,490,496,505,535,539,],[182,189,263,264,265,266,263,269,270,271,272,281,282,263,263,263,541,263,566,568,]),'meth_cap':([49,],[186,]),'infixtype':([59,308,309,310,409,],[191,410,411,412,481,]),'intersectiontype':([59,308,309,310,409,],[193,193,193,193,193,]),'uniontype':([59,308,309,310,409,],[194,194,194,194,194,]),'typecap':([60,614,],[195,621,]),'cap':([61,108,182,272,281,282,626,],[199,273,299,368,388,389,627,]),'typeargs':([63,178,276,284,319,334,],[204,295,380,391,204,380,]),'nextinfix':([70,],[208,]),'nextterm':([70,],[209,]),'nextpattern':([70,],[221,]),'nextparampattern':([70,],[223,]),'nextparampatternprefix':([70,],[225,]),'nextpostfix':([70,],[226,]),'nextatom':([70,],[232,]),'nexttuple':([70,],[235,]),'nextarray':([70,],[236,]),'binop_op':([72,150,208,327,339,357,396,421,522,556,587,625,],[245,245,328,245,245,245,245,245,245,245,245,245,]),'annotatedrawseq':([98,102,362,447,490,505,],[262,267,440,506,531,546,]),'atomsuffix_list':([122,232,],[276,334,]),'arraytype':([138,242,],[278,336,]),'idseq_list':([155,],[285,]),'class_defs':([173,],[287,]),'useif':([174,],[289,]),'members':([181,459,],[296,513,]),'methods':([181,297,459,],[298,399,298,]),'id_list':([183,],[300,]),'parametrised_id':([186,299,],[303,401,]),'tupletype':([191,],[306,]),'cap_modifier':([196,197,198,],[311,314,315,]),'maybe_id':([199,389,],[316,461,]),'typearglist':([205,],[321,]),'typearg':([205,417,561,],[322,483,583,]),'type_assertion':([265,568,],[358,588,]),'withelem_list':([270,],[364,]),'withelem':([270,443,],[365,501,]),'maybe_typed':([274,480,562,576,597,],[370,527,584,593,612,]),'atomsuffix':([276,334,],[372,372,]),'dot':([276,334,],[373,373,]),'tilde':([276,334,],[374,374,]),'chain':([276,334,],[375,375,]),'atom_typeargs':([276,334,],[376,376,]),'call':([276,334,],[377,377,]),'tupletail':([277,335,],[382,425,]),'maybe_rawseq':([278,],[384,]),'maybe_typeargs':([284,],[390,]),'params':([295,303,515,],[397,405,553,]),'typeparams':([304,316,461,],[406,414,414,]),'maybe_typeparams':([316,461,],[413,515,]),'caseexpr_list':([360,],[438,]),'else_then':([367,],[445,]),'else':([367,434,438,439,440,491,492,500,571,586,615,616,],[446,489,494,497,498,533,537,545,590,489,533,537,]),'positional':([381,462,511,],[453,516,551,]),'provides':([388,401,],[459,473,]),'maybe_partial':([397,476,547,580,584,593,],[464,523,573,598,602,609,]),'param_list':([398,],[467,]),'param':([398,518,],[469,555,]),'param_1':([398,518,],[470,470,]),'meth_type':([405,],[476,]),'typeparams_list':([407,],[478,]),'typeparam':([407,526,],[479,560,]),'if_else':([434,586,],[487,603,]),'elseif':([434,586,],[488,488,]),'caseexpr':([438,],[495,]),'then':([446,],[504,]),'named':([453,516,],[509,554,]),'type_list':([482,563,],[528,585,]),'ifdef_else':([491,615,],[532,622,]),'elseifdef':([491,615,],[534,534,]),'iftype_else':([492,616,],[536,623,]),'elseiftype':([492,616,],[538,538,]),'namedarglist':([510,],[548,]),'namedarg':([510,574,],[549,591,]),'maybe_pattern':([541,],[569,]),'maybe_lambdacaptures':([553,],[576,]),'lambdacaptures':([553,],[577,]),'guard':([559,569,],[581,589,]),'lambdacapture_list':([579,],[594,]),'lambdacapture':([579,611,],[595,619,]),'body':([581,],[599,]),'match_action':([589,],[606,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> entry","S'",1,None,None,None),
+  ('entry -> module','entry',1,'p_entry','parser.py',44),
+  ('entry -> START_USE use','entry',2,'p_entry','parser.py',45),
+  ('entry -> START_USE_FFI use_ffi','entry',2,'p_entry','parser.py',46),
+  ('entry -> START_CLASS_DEF class_def','entry',2,'p_entry','parser.py',47),
+  ('entry -> START_FIELDS fields','entry',2,'p_entry','parser.py',48),
+  ('entry -> START_METHOD method','entry',2,'p_entry','parser.py',49),
+  ('entry -> START_TYPE type','entry',2,'p_entry','parser.py',50),
+  ('entry -> START_LAMBDATYPE lambdatype','entry',2,'p_entry','parser.py',51),
+  ('entry -> START_RAWSEQ rawseq','entry',2,'p_entry','parser.py',52),
+  ('entry -> START_INFIX infix','entry',2,'p_entry','parser.py',53),
+  ('entry -> START_TERM term','entry',2,'p_entry','parser.py',54),
+  ('entry -> START_PATTERN pattern','entry',2,'p_entry','parser.py',55),
+  ('entry -> START_IDSEQ idseq','entry',2,'p_entry','parser.py',56),
+  ('entry -> START_IF if','entry',2,'p_entry','parser.py',57),
+  ('entry -> START_IFDEF ifdef','entry',2,'p_entry','parser.py',58),
+  ('entry -> START_IFTYPE iftype','entry',2,'p_entry','parser.py',59),
+  ('entry -> START_MATCH match','entry',2,'p_entry','parser.py',60),
+  ('entry -> START_WHILE while','entry',2,'p_entry','parser.py',61),
+  ('entry -> START_REPEAT repeat','entry',2,'p_entry','parser.py',62),
+  ('entry -> START_FOR for','entry',2,'p_entry','parser.py',63),
+  ('entry -> START_WITH with','entry',2,'p_entry','parser.py',64),
+  ('entry -> START_TRY try','entry',2,'p_entry','parser.py',65),
+  ('entry -> START_RECOVER recover','entry',2,'p_entry','parser.py',66),
+  ('entry -> START_CONSUME consume','entry',2,'p_entry','parser.py',67),
+  ('entry -> START_OBJECT object','entry',2,'p_entry','parser.py',68),
+  ('entry -> START_LAMBDA lambda','entry',2,'p_entry','parser.py',69),
+  ('entry -> START_BARELAMBDA barelambda','entry',2,'p_entry','parser.py',70),
+  ('entry -> START_ARRAY array','entry',2,'p_entry','parser.py',71),
+  ('entry -> START_TUPLE tuple','entry',2,'p_entry','parser.py',72),
+  ('module -> docstring uses class_defs','module',3,'p_module','parser.py',54),
+  ('anylparen -> LPAREN','anylparen',1,'p_anyparen','parser.py',66),
+  ('anylparen -> LPAREN_NEW','anylparen',1,'p_anyparen','parser.py',67),
+  ('anysquare -> LSQUARE','anysquare',1,'p_anysquare','parser.py',73),
+  ('anysquare -> LSQUARE_NEW','anysquare',1,'p_anysquare','parser.py',74),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',80),
+  ('id -> ID','id',1,'p_id','parser.py',87),
+  ('uses -> uses use','uses',2,'p_uses','parser.py',94),
+  ('uses -> <empty>','uses',0,'p_uses','parser.py',95),
+  ('use -> USE used useif','use',3,'p_use','parser.py',106),
+  ('useif -> IF infix','useif',2,'p_useif','parser.py',124),
+  ('useif -> empty','useif',1,'p_useif','parser.py',125),
+  ('used -> used_id STRING','used',2,'p_used','parser.py',132),
+  ('used -> used_id use_ffi','used',2,'p_used','parser.py',133),
+  ('used_id -> id =','used_id',2,'p_used_id','parser.py',140),
+  ('used_id -> empty','used_id',1,'p_used_id','parser.py',141),
+  ('use_ffi -> @ id_or_string typeargs params maybe_partial','use_ffi',5,'p_use_ffi','parser.py',148),
+  ('typeargs -> LSQUARE typearglist ]','typeargs',3,'p_typeargs','parser.py',155),
+  ('maybe_typeargs -> typeargs','maybe_typeargs',1,'p_maybe_typeargs','parser.py',162),
+  ('maybe_typeargs -> empty','maybe_typeargs',1,'p_maybe_typeargs','parser.py',163),
+  ('typearglist -> typearg','typearglist',1,'p_typearglist','parser.py',170),
+  ('typearglist -> typearglist , typearg','typearglist',3,'p_typearglist','parser.py',171),
+  ('id_or_string -> id','id_or_string',1,'p_id_or_string','parser.py',182),
+  ('id_or_string -> string','id_or_string',1,'p_id_or_string','parser.py',183),
+  ('class_defs -> class_defs class_def','class_defs',2,'p_class_defs','parser.py',190),
+  ('class_defs -> <empty>','class_defs',0,'p_class_defs','parser.py',191),
+  ('cap -> CAP','cap',1,'p_cap','parser.py',202),
+  ('cap -> empty','cap',1,'p_cap','parser.py',203),
+  ('typeparams -> LSQUARE typeparams_list ]','typeparams',3,'p_typeparams','parser.py',210),
+  ('typeparams_list -> typeparam','typeparams_list',1,'p_typeparams_list','parser.py',217),
+  ('typeparams_list -> typeparams_list , typeparam','typeparams_list',3,'p_typeparams_list','parser.py',218),
+  ('typeparam -> id maybe_typed','typeparam',2,'p_typeparam','parser.py',229),
+  ('typeparam -> id maybe_typed = typearg','typeparam',4,'p_typeparam','parser.py',230),
+  ('typearg -> type','typearg',1,'p_typearg','parser.py',240),
+  ('typearg -> literal','typearg',1,'p_typearg','parser.py',241),
+  ('typearg -> # postfix','typearg',2,'p_typearg','parser.py',242),
+  ('true -> TRUE','true',1,'p_true','parser.py',252),
+  ('false -> FALSE','false',1,'p_false','parser.py',259),
+  ('int -> INT','int',1,'p_int','parser.py',266),
+  ('float -> FLOAT','float',1,'p_float','parser.py',273),
+  ('string -> STRING','string',1,'p_string','parser.py',280),
+  ('literal -> true','literal',1,'p_literal','parser.py',287),
+  ('literal -> false','literal',1,'p_literal','parser.py',288),
+  ('literal -> int','literal',1,'p_literal','parser.py',289),
+  ('literal -> float','literal',1,'p_literal','parser.py',290),
+  ('literal -> string','literal',1,'p_literal','parser.py',291),
+  ('type -> atomtype','type',1,'p_type','parser.py',298),
+  ('type -> atomtype SMALL_ARROW type','type',3,'p_type','parser.py',299),
+  ('atomtype -> THIS','atomtype',1,'p_atomtype','parser.py',309),
+  ('atomtype -> CAP','atomtype',1,'p_atomtype','parser.py',310),
+  ('atomtype -> combined_types','atomtype',1,'p_atomtype','parser.py',311),
+  ('atomtype -> nominal','atomtype',1,'p_atomtype','parser.py',312),
+  ('atomtype -> lambdatype','atomtype',1,'p_atomtype','parser.py',313),
+  ('atomtype -> barelambdatype','atomtype',1,'p_atomtype','parser.py',314),
+  ('barelambdatype -> @ lambdatype','barelambdatype',2,'p_barelambdatype','parser.py',321),
+  ('lambdatype -> { cap maybe_id maybe_typeparams anylparen type_list ) maybe_typed maybe_partial } typecap','lambdatype',11,'p_lambdatype','parser.py',335),
+  ('type_list -> type','type_list',1,'p_type_list','parser.py',350),
+  ('type_list -> type , type_list','type_list',3,'p_type_list','parser.py',351),
+  ('type_list -> <empty>','type_list',0,'p_type_list','parser.py',352),
+  ('nominal -> namespaced typecap','nominal',2,'p_nominal','parser.py',364),
+  ('typecap -> CAP cap_modifier','typecap',2,'p_typecap','parser.py',377),
+  ('typecap -> GENCAP cap_modifier','typecap',2,'p_typecap','parser.py',378),
+  ('typecap -> empty cap_modifier','typecap',2,'p_typecap','parser.py',379),
+  ('typecap -> CAP','typecap',1,'p_typecap','parser.py',380),
+  ('typecap -> GENCAP','typecap',1,'p_typecap','parser.py',381),
+  ('typecap -> empty','typecap',1,'p_typecap','parser.py',382),
+  ('cap_modifier -> ^','cap_modifier',1,'p_cap_modifier','parser.py',392),
+  ('cap_modifier -> !','cap_modifier',1,'p_cap_modifier','parser.py',393),
+  ('namespaced -> id . typeargs_id','namespaced',3,'p_namespaced','parser.py',400),
+  ('namespaced -> typeargs_id','namespaced',1,'p_namespaced','parser.py',401),
+  ('typeargs_id -> id typeargs','typeargs_id',2,'p_typeargs_id','parser.py',411),
+  ('typeargs_id -> id','typeargs_id',1,'p_typeargs_id','parser.py',412),
+  ('combined_types -> LPAREN infixtype tupletype )','combined_types',4,'p_combined_types','parser.py',422),
+  ('combined_types -> LPAREN infixtype )','combined_types',3,'p_combined_types','parser.py',423),
+  ('tupletype -> tupletype , infixtype','tupletype',3,'p_tupletype','parser.py',433),
+  ('tupletype -> , infixtype','tupletype',2,'p_tupletype','parser.py',434),
+  ('infixtype -> type','infixtype',1,'p_infixtype','parser.py',445),
+  ('infixtype -> intersectiontype','infixtype',1,'p_infixtype','parser.py',446),
+  ('infixtype -> uniontype','infixtype',1,'p_infixtype','parser.py',447),
+  ('intersectiontype -> type & infixtype','intersectiontype',3,'p_intersectiontype','parser.py',454),
+  ('uniontype -> type | infixtype','uniontype',3,'p_uniontype','parser.py',461),
+  ('parametrised_id -> id typeparams','parametrised_id',2,'p_parametrised_id','parser.py',468),
+  ('parametrised_id -> id','parametrised_id',1,'p_parametrised_id','parser.py',469),
+  ('provides -> IS type','provides',2,'p_provides','parser.py',479),
+  ('provides -> <empty>','provides',0,'p_provides','parser.py',480),
+  ('class_decl -> CLASS_DECL annotations cap parametrised_id provides','class_decl',5,'p_class_decl','parser.py',487),
+  ('docstring -> string','docstring',1,'p_docstring','parser.py',494),
+  ('docstring -> empty','docstring',1,'p_docstring','parser.py',495),
+  ('class_def -> class_decl docstring members','class_def',3,'p_class_def','parser.py',513),
+  ('class_def -> class_decl docstring','class_def',2,'p_class_def','parser.py',514),
+  ('annotations -> BACKSLASH id_list BACKSLASH','annotations',3,'p_annotations','parser.py',528),
+  ('annotations -> <empty>','annotations',0,'p_annotations','parser.py',529),
+  ('id_list -> id','id_list',1,'p_id_list','parser.py',539),
+  ('id_list -> id_list , id','id_list',3,'p_id_list','parser.py',540),
+  ('members -> fields methods','members',2,'p_members','parser.py',551),
+  ('members -> methods','members',1,'p_members','parser.py',552),
+  ('fields -> fields field','fields',2,'p_fields','parser.py',562),
+  ('fields -> field','fields',1,'p_fields','parser.py',563),
+  ('field -> varkw id : type = infix','field',6,'p_field','parser.py',581),
+  ('field -> varkw id : type','field',4,'p_field','parser.py',582),
+  ('varkw -> LET','varkw',1,'p_varkw','parser.py',593),
+  ('varkw -> VAR','varkw',1,'p_varkw','parser.py',594),
+  ('varkw -> EMBED','varkw',1,'p_varkw','parser.py',595),
+  ('infix -> term','infix',1,'p_infix','parser.py',602),
+  ('infix -> infix binop_op term','infix',3,'p_infix','parser.py',603),
+  ('infix -> infix binop_op ? term','infix',4,'p_infix','parser.py',604),
+  ('infix -> infix = infix','infix',3,'p_infix','parser.py',605),
+  ('infix -> infix AS type','infix',3,'p_infix','parser.py',606),
+  ('infix -> infix IS term','infix',3,'p_infix','parser.py',607),
+  ('infix -> infix ISNT term','infix',3,'p_infix','parser.py',608),
+  ('nextinfix -> nextterm','nextinfix',1,'p_nextinfix','parser.py',627),
+  ('nextinfix -> nextinfix binop_op term','nextinfix',3,'p_nextinfix','parser.py',628),
+  ('nextinfix -> nextinfix binop_op ? term','nextinfix',4,'p_nextinfix','parser.py',629),
+  ('nextinfix -> nextinfix = infix','nextinfix',3,'p_nextinfix','parser.py',630),
+  ('nextinfix -> nextinfix AS type','nextinfix',3,'p_nextinfix','parser.py',631),
+  ('nextinfix -> nextinfix IS term','nextinfix',3,'p_nextinfix','parser.py',632),
+  ('nextinfix -> nextinfix ISNT term','nextinfix',3,'p_nextinfix','parser.py',633),
+  ('maybe_typed -> : type','maybe_typed',2,'p_mabe_typed','parser.py',640),
+  ('maybe_typed -> <empty>','maybe_typed',0,'p_mabe_typed','parser.py',641),
+  ('vardecl -> varkw id maybe_typed','vardecl',3,'p_vardecl','parser.py',654),
+  ('pattern -> vardecl','pattern',1,'p_pattern','parser.py',661),
+  ('pattern -> parampattern','pattern',1,'p_pattern','parser.py',662),
+  ('nextpattern -> vardecl','nextpattern',1,'p_nextpattern','parser.py',669),
+  ('nextpattern -> nextparampattern','nextpattern',1,'p_nextpattern','parser.py',670),
+  ('term -> if','term',1,'p_term','parser.py',677),
+  ('term -> ifdef','term',1,'p_term','parser.py',678),
+  ('term -> iftype','term',1,'p_term','parser.py',679),
+  ('term -> match','term',1,'p_term','parser.py',680),
+  ('term -> while','term',1,'p_term','parser.py',681),
+  ('term -> repeat','term',1,'p_term','parser.py',682),
+  ('term -> for','term',1,'p_term','parser.py',683),
+  ('term -> with','term',1,'p_term','parser.py',684),
+  ('term -> try','term',1,'p_term','parser.py',685),
+  ('term -> recover','term',1,'p_term','parser.py',686),
+  ('term -> consume','term',1,'p_term','parser.py',687),
+  ('term -> pattern','term',1,'p_term','parser.py',688),
+  ('nextterm -> if','nextterm',1,'p_nextterm','parser.py',696),
+  ('nextterm -> ifdef','nextterm',1,'p_nextterm','parser.py',697),
+  ('nextterm -> iftype','nextterm',1,'p_nextterm','parser.py',698),
+  ('nextterm -> match','nextterm',1,'p_nextterm','parser.py',699),
+  ('nextterm -> while','nextterm',1,'p_nextterm','parser.py',700),
+  ('nextterm -> repeat','nextterm',1,'p_nextterm','parser.py',701),
+  ('nextterm -> for','nextterm',1,'p_nextterm','parser.py',702),
+  ('nextterm -> with','nextterm',1,'p_nextterm','parser.py',703),
+  ('nextterm -> try','nextterm',1,'p_nextterm','parser.py',704),
+  ('nextterm -> recover','nextterm',1,'p_nextterm','parser.py',705),
+  ('nextterm -> consume','nextterm',1,'p_nextterm','parser.py',706),
+  ('nextterm -> nextpattern','nextterm',1,'p_nextterm','parser.py',707),
+  ('if -> IF annotatedrawseq THEN rawseq if_else END','if',6,'p_if','parser.py',715),
+  ('if_else -> elseif','if_else',1,'p_if_else','parser.py',727),
+  ('if_else -> else','if_else',1,'p_if_else','parser.py',728),
+  ('elseif -> ELSEIF annotatedrawseq THEN rawseq if_else','elseif',5,'p_elseif','parser.py',735),
+  ('ifdef -> IFDEF annotations infix THEN rawseq ifdef_else END','ifdef',7,'p_ifdef','parser.py',747),
+  ('ifdef_else -> else','ifdef_else',1,'p_ifdef_else','parser.py',760),
+  ('ifdef_else -> elseifdef','ifdef_else',1,'p_ifdef_else','parser.py',761),
+  ('elseifdef -> ELSEIF annotations infix THEN rawseq ifdef_else','elseifdef',6,'p_elseifdef','parser.py',768),
+  ('type_assertion -> type IS_SUBTYPE type','type_assertion',3,'p_type_assertion','parser.py',780),
+  ('iftype -> IFTYPE annotations type_assertion THEN rawseq iftype_else END','iftype',7,'p_iftype','parser.py',790),
+  ('iftype_else -> else','iftype_else',1,'p_iftype_else','parser.py',803),
+  ('iftype_else -> elseiftype','iftype_else',1,'p_iftype_else','parser.py',804),
+  ('elseiftype -> ELSEIF annotations type_assertion THEN rawseq iftype_else','elseiftype',6,'p_elseiftype','parser.py',811),
+  ('match -> MATCH annotations rawseq caseexpr_list else END','match',6,'p_match','parser.py',824),
+  ('caseexpr_list -> caseexpr_list caseexpr','caseexpr_list',2,'p_caseexpr_list','parser.py',837),
+  ('caseexpr_list -> <empty>','caseexpr_list',0,'p_caseexpr_list','parser.py',838),
+  ('maybe_pattern -> pattern','maybe_pattern',1,'p_maybe_pattern','parser.py',849),
+  ('maybe_pattern -> <empty>','maybe_pattern',0,'p_maybe_pattern','parser.py',850),
+  ('match_action -> BIG_ARROW rawseq','match_action',2,'p_match_action','parser.py',857),
+  ('match_action -> <empty>','match_action',0,'p_match_action','parser.py',858),
+  ('caseexpr -> | annotations maybe_pattern guard match_action','caseexpr',5,'p_caseexpr','parser.py',865),
+  ('while -> WHILE annotatedrawseq DO rawseq else END','while',6,'p_while','parser.py',877),
+  ('repeat -> REPEAT rawseq UNTIL annotatedrawseq else END','repeat',6,'p_repeat','parser.py',889),
+  ('then -> THEN annotatedrawseq','then',2,'p_then','parser.py',901),
+  ('then -> <empty>','then',0,'p_then','parser.py',902),
+  ('for -> FOR annotations idseq IN rawseq DO rawseq else END','for',9,'p_for','parser.py',909),
+  ('idseq -> id','idseq',1,'p_idseq','parser.py',937),
+  ('idseq -> LPAREN idseq_list )','idseq',3,'p_idseq','parser.py',938),
+  ('idseq_list -> idseq','idseq_list',1,'p_idseq_list','parser.py',946),
+  ('idseq_list -> idseq_list , idseq','idseq_list',3,'p_idseq_list','parser.py',947),
+  ('with -> WITH annotations withelem_list DO rawseq else END','with',7,'p_with','parser.py',958),
+  ('withelem_list -> withelem','withelem_list',1,'p_withelem_list','parser.py',971),
+  ('withelem_list -> withelem_list , withelem','withelem_list',3,'p_withelem_list','parser.py',972),
+  ('withelem -> idseq = rawseq','withelem',3,'p_withelem','parser.py',983),
+  ('else_then -> else then','else_then',2,'p_else_then','parser.py',994),
+  ('try -> TRY annotations rawseq else_then END','try',5,'p_try','parser.py',1001),
+  ('recover -> RECOVER annotations cap rawseq END','recover',5,'p_recover','parser.py',1015),
+  ('else -> ELSE annotatedrawseq','else',2,'p_else','parser.py',1025),
+  ('else -> <empty>','else',0,'p_else','parser.py',1026),
+  ('consume -> CONSUME cap term','consume',3,'p_consume','parser.py',1033),
+  ('binop_op -> AND','binop_op',1,'p_binop_op','parser.py',1040),
+  ('binop_op -> OR','binop_op',1,'p_binop_op','parser.py',1041),
+  ('binop_op -> XOR','binop_op',1,'p_binop_op','parser.py',1042),
+  ('binop_op -> PLUS','binop_op',1,'p_binop_op','parser.py',1043),
+  ('binop_op -> MINUS','binop_op',1,'p_binop_op','parser.py',1044),
+  ('binop_op -> *','binop_op',1,'p_binop_op','parser.py',1045),
+  ('binop_op -> /','binop_op',1,'p_binop_op','parser.py',1046),
+  ('binop_op -> %','binop_op',1,'p_binop_op','parser.py',1047),
+  ('binop_op -> PLUS ~','binop_op',2,'p_binop_op','parser.py',1048),
+  ('binop_op -> MINUS_TILDE','binop_op',1,'p_binop_op','parser.py',1049),
+  ('binop_op -> * ~','binop_op',2,'p_binop_op','parser.py',1050),
+  ('binop_op -> / ~','binop_op',2,'p_binop_op','parser.py',1051),
+  ('binop_op -> % ~','binop_op',2,'p_binop_op','parser.py',1052),
+  ('binop_op -> < <','binop_op',2,'p_binop_op','parser.py',1053),
+  ('binop_op -> > >','binop_op',2,'p_binop_op','parser.py',1054),
+  ('binop_op -> < < ~','binop_op',3,'p_binop_op','parser.py',1055),
+  ('binop_op -> > > ~','binop_op',3,'p_binop_op','parser.py',1056),
+  ('binop_op -> = =','binop_op',2,'p_binop_op','parser.py',1057),
+  ('binop_op -> ! =','binop_op',2,'p_binop_op','parser.py',1058),
+  ('binop_op -> <','binop_op',1,'p_binop_op','parser.py',1059),
+  ('binop_op -> < =','binop_op',2,'p_binop_op','parser.py',1060),
+  ('binop_op -> > =','binop_op',2,'p_binop_op','parser.py',1061),
+  ('binop_op -> >','binop_op',1,'p_binop_op','parser.py',1062),
+  ('binop_op -> = = ~','binop_op',3,'p_binop_op','parser.py',1063),
+  ('binop_op -> ! = ~','binop_op',3,'p_binop_op','parser.py',1064),
+  ('binop_op -> < ~','binop_op',2,'p_binop_op','parser.py',1065),
+  ('binop_op -> < = ~','binop_op',3,'p_binop_op','parser.py',1066),
+  ('binop_op -> > = ~','binop_op',3,'p_binop_op','parser.py',1067),
+  ('binop_op -> > ~','binop_op',2,'p_binop_op','parser.py',1068),
+  ('methods -> methods method','methods',2,'p_methods','parser.py',1080),
+  ('methods -> <empty>','methods',0,'p_methods','parser.py',1081),
+  ('meth_cap -> @','meth_cap',1,'p_meth_cap','parser.py',1092),
+  ('meth_cap -> CAP','meth_cap',1,'p_meth_cap','parser.py',1093),
+  ('meth_cap -> <empty>','meth_cap',0,'p_meth_cap','parser.py',1094),
+  ('meth_decl -> METH_DECL annotations','meth_decl',2,'p_meth_decl','parser.py',1111),
+  ('method -> meth_decl meth_cap parametrised_id params meth_type maybe_partial docstring guard body','method',9,'p_method','parser.py',1118),
+  ('body -> BIG_ARROW rawseq','body',2,'p_body','parser.py',1133),
+  ('body -> <empty>','body',0,'p_body','parser.py',1134),
+  ('guard -> IF rawseq','guard',2,'p_guard','parser.py',1141),
+  ('guard -> <empty>','guard',0,'p_guard','parser.py',1142),
+  ('maybe_partial -> ?','maybe_partial',1,'p_maybe_partial','parser.py',1149),
+  ('maybe_partial -> empty','maybe_partial',1,'p_maybe_partial','parser.py',1150),
+  ('meth_type -> : type','meth_type',2,'p_meth_type','parser.py',1157),
+  ('meth_type -> <empty>','meth_type',0,'p_meth_type','parser.py',1158),
+  ('params -> anylparen param_list )','params',3,'p_params','parser.py',1165),
+  ('params -> anylparen )','params',2,'p_params','parser.py',1166),
+  ('param -> param_1','param',1,'p_param','parser.py',1173),
+  ('param -> param_1 = infix','param',3,'p_param','parser.py',1174),
+  ('param -> . . .','param',3,'p_param','parser.py',1175),
+  ('param_1 -> parampattern','param_1',1,'p_param_1','parser.py',1189),
+  ('param_1 -> parampattern : type','param_1',3,'p_param_1','parser.py',1190),
+  ('parampattern -> parampatternprefix parampattern','parampattern',2,'p_parampattern','parser.py',1198),
+  ('parampattern -> postfix','parampattern',1,'p_parampattern','parser.py',1199),
+  ('nextparampattern -> nextparampatternprefix parampattern','nextparampattern',2,'p_nextparampattern','parser.py',1206),
+  ('nextparampattern -> nextpostfix','nextparampattern',1,'p_nextparampattern','parser.py',1207),
+  ('parampatternprefix -> NOT','parampatternprefix',1,'p_parampatternprefix','parser.py',1223),
+  ('parampatternprefix -> ADDRESSOF','parampatternprefix',1,'p_parampatternprefix','parser.py',1224),
+  ('parampatternprefix -> MINUS','parampatternprefix',1,'p_parampatternprefix','parser.py',1225),
+  ('parampatternprefix -> MINUS_NEW','parampatternprefix',1,'p_parampatternprefix','parser.py',1226),
+  ('parampatternprefix -> MINUS_TILDE','parampatternprefix',1,'p_parampatternprefix','parser.py',1227),
+  ('parampatternprefix -> MINUS_TILDE_NEW','parampatternprefix',1,'p_parampatternprefix','parser.py',1228),
+  ('parampatternprefix -> DIGESTOF','parampatternprefix',1,'p_parampatternprefix','parser.py',1229),
+  ('nextparampatternprefix -> NOT','nextparampatternprefix',1,'p_nextparampatternprefix','parser.py',1236),
+  ('nextparampatternprefix -> ADDRESSOF','nextparampatternprefix',1,'p_nextparampatternprefix','parser.py',1237),
+  ('nextparampatternprefix -> MINUS_NEW','nextparampatternprefix',1,'p_nextparampatternprefix','parser.py',1238),
+  ('nextparampatternprefix -> MINUS_TILDE_NEW','nextparampatternprefix',1,'p_nextparampatternprefix','parser.py',1239),
+  ('nextparampatternprefix -> DIGESTOF','nextparampatternprefix',1,'p_nextparampatternprefix','parser.py',1240),
+  ('postfix -> atom atomsuffix_list','postfix',2,'p_postfix','parser.py',1253),
+  ('nextpostfix -> nextatom atomsuffix_list','nextpostfix',2,'p_nextpostfix','parser.py',1271),
+  ('atomsuffix_list -> atomsuffix_list atomsuffix','atomsuffix_list',2,'p_atomsuffix_list','parser.py',1278),
+  ('atomsuffix_list -> <empty>','atomsuffix_list',0,'p_atomsuffix_list','parser.py',1279),
+  ('atomsuffix -> dot','atomsuffix',1,'p_atomsuffix','parser.py',1290),
+  ('atomsuffix -> tilde','atomsuffix',1,'p_atomsuffix','parser.py',1291),
+  ('atomsuffix -> chain','atomsuffix',1,'p_atomsuffix','parser.py',1292),
+  ('atomsuffix -> atom_typeargs','atomsuffix',1,'p_atomsuffix','parser.py',1293),
+  ('atomsuffix -> call','atomsuffix',1,'p_atomsuffix','parser.py',1294),
+  ('atom_typeargs -> typeargs','atom_typeargs',1,'p_atom_typeargs','parser.py',1301),
+  ('dot -> . id','dot',2,'p_dot','parser.py',1308),
+  ('tilde -> ~ id','tilde',2,'p_tilde','parser.py',1315),
+  ('chain -> . > id','chain',3,'p_chain','parser.py',1322),
+  ('call -> LPAREN positional named ) maybe_partial','call',5,'p_call','parser.py',1329),
+  ('positional -> rawseq','positional',1,'p_positional','parser.py',1337),
+  ('positional -> rawseq , positional','positional',3,'p_positional','parser.py',1338),
+  ('positional -> <empty>','positional',0,'p_positional','parser.py',1339),
+  ('named -> WHERE namedarglist','named',2,'p_named','parser.py',1351),
+  ('named -> <empty>','named',0,'p_named','parser.py',1352),
+  ('namedarglist -> namedarg','namedarglist',1,'p_namedarglist','parser.py',1359),
+  ('namedarglist -> namedarglist , namedarg','namedarglist',3,'p_namedarglist','parser.py',1360),
+  ('namedarg -> id = rawseq','namedarg',3,'p_namedarg','parser.py',1371),
+  ('this -> THIS','this',1,'p_this','parser.py',1378),
+  ('object -> OBJECT annotations cap provides members END','object',6,'p_object','parser.py',1385),
+  ('atom -> id','atom',1,'p_atom','parser.py',1395),
+  ('atom -> this','atom',1,'p_atom','parser.py',1396),
+  ('atom -> literal','atom',1,'p_atom','parser.py',1397),
+  ('atom -> tuple','atom',1,'p_atom','parser.py',1398),
+  ('atom -> array','atom',1,'p_atom','parser.py',1399),
+  ('atom -> object','atom',1,'p_atom','parser.py',1400),
+  ('atom -> lambda','atom',1,'p_atom','parser.py',1401),
+  ('atom -> barelambda','atom',1,'p_atom','parser.py',1402),
+  ('atom -> fficall','atom',1,'p_atom','parser.py',1403),
+  ('nextatom -> id','nextatom',1,'p_nextatom','parser.py',1410),
+  ('nextatom -> this','nextatom',1,'p_nextatom','parser.py',1411),
+  ('nextatom -> literal','nextatom',1,'p_nextatom','parser.py',1412),
+  ('nextatom -> nexttuple','nextatom',1,'p_nextatom','parser.py',1413),
+  ('nextatom -> nextarray','nextatom',1,'p_nextatom','parser.py',1414),
+  ('nextatom -> object','nextatom',1,'p_nextatom','parser.py',1415),
+  ('nextatom -> lambda','nextatom',1,'p_nextatom','parser.py',1416),
+  ('nextatom -> barelambda','nextatom',1,'p_nextatom','parser.py',1417),
+  ('nextatom -> fficall','nextatom',1,'p_nextatom','parser.py',1418),
+  ('barelambda -> @ lambda','barelambda',2,'p_barelambda','parser.py',1425),
+  ('lambda -> { annotations cap maybe_id maybe_typeparams params maybe_lambdacaptures maybe_typed maybe_partial BIG_ARROW rawseq } cap','lambda',13,'p_lambda','parser.py',1441),
+  ('maybe_lambdacaptures -> lambdacaptures','maybe_lambdacaptures',1,'p_maybe_lambdacaptures','parser.py',1457),
+  ('maybe_lambdacaptures -> empty','maybe_lambdacaptures',1,'p_maybe_lambdacaptures','parser.py',1458),
+  ('lambdacaptures -> anylparen lambdacapture_list )','lambdacaptures',3,'p_lambdacaptures','parser.py',1465),
+  ('lambdacapture_list -> lambdacapture','lambdacapture_list',1,'p_lambdacapture_list','parser.py',1472),
+  ('lambdacapture_list -> lambdacapture_list , lambdacapture','lambdacapture_list',3,'p_lambdacapture_list','parser.py',1473),
+  ('lambdacapture -> this','lambdacapture',1,'p_lambdacapture','parser.py',1484),
+  ('lambdacapture -> id maybe_typed','lambdacapture',2,'p_lambdacapture','parser.py',1485),
+  ('lambdacapture -> id maybe_typed = infix','lambdacapture',4,'p_lambdacapture','parser.py',1486),
+  ('maybe_typeparams -> typeparams','maybe_typeparams',1,'p_maybe_typeparams','parser.py',1497),
+  ('maybe_typeparams -> empty','maybe_typeparams',1,'p_maybe_typeparams','parser.py',1498),
+  ('maybe_id -> id','maybe_id',1,'p_maybe_id','parser.py',1505),
+  ('maybe_id -> empty','maybe_id',1,'p_maybe_id','parser.py',1506),
+  ('maybe_rawseq -> rawseq','maybe_rawseq',1,'p_maybe_rawseq','parser.py',1513),
+  ('maybe_rawseq -> empty','maybe_rawseq',1,'p_maybe_rawseq','parser.py',1514),
+  ('array -> anysquare arraytype maybe_rawseq ]','array',4,'p_array','parser.py',1521),
+  ('nextarray -> LSQUARE_NEW arraytype rawseq ]','nextarray',4,'p_nextarray','parser.py',1528),
+  ('arraytype -> AS type :','arraytype',3,'p_arraytype','parser.py',1535),
+  ('arraytype -> empty','arraytype',1,'p_arraytype','parser.py',1536),
+  ('fficall -> @ id_or_string maybe_typeargs anylparen positional named ) maybe_partial','fficall',8,'p_fficall','parser.py',1543),
+  ('tuple -> anylparen rawseq tupletail )','tuple',4,'p_tuple','parser.py',1554),
+  ('nexttuple -> LPAREN_NEW rawseq tupletail )','nexttuple',4,'p_nexttuple','parser.py',1561),
+  ('tupletail -> tupletail , rawseq','tupletail',3,'p_tupletail','parser.py',1568),
+  ('tupletail -> empty','tupletail',1,'p_tupletail','parser.py',1569),
+  ('param_list -> param','param_list',1,'p_param_list','parser.py',1580),
+  ('param_list -> param_list , param','param_list',3,'p_param_list','parser.py',1581),
+  ('rawseq -> exprseq','rawseq',1,'p_rawseq','parser.py',1592),
+  ('rawseq -> jump','rawseq',1,'p_rawseq','parser.py',1593),
+  ('annotatedrawseq -> annotations rawseq','annotatedrawseq',2,'p_annotatedrawseq','parser.py',1603),
+  ('exprseq -> infixseq','exprseq',1,'p_exprseq','parser.py',1610),
+  ('exprseq -> infixseq ; jump','exprseq',3,'p_exprseq','parser.py',1611),
+  ('exprseq -> infixseq jump','exprseq',2,'p_exprseq','parser.py',1612),
+  ('infixseq -> infix','infixseq',1,'p_infixseq','parser.py',1621),
+  ('infixseq -> infixseq ; infix','infixseq',3,'p_infixseq','parser.py',1622),
+  ('infixseq -> infixseq nextinfix','infixseq',2,'p_infixseq','parser.py',1623),
+  ('jump -> jump_statement empty','jump',2,'p_jump','parser.py',1634),
+  ('jump -> jump_statement rawseq','jump',2,'p_jump','parser.py',1635),
+  ('jump_statement -> return','jump_statement',1,'p_jump_statement','parser.py',1642),
+  ('jump_statement -> break','jump_statement',1,'p_jump_statement','parser.py',1643),
+  ('jump_statement -> continue','jump_statement',1,'p_jump_statement','parser.py',1644),
+  ('jump_statement -> pony_error','jump_statement',1,'p_jump_statement','parser.py',1645),
+  ('jump_statement -> compile_intrinsic','jump_statement',1,'p_jump_statement','parser.py',1646),
+  ('jump_statement -> compile_error','jump_statement',1,'p_jump_statement','parser.py',1647),
+  ('return -> RETURN','return',1,'p_return','parser.py',1654),
+  ('break -> BREAK','break',1,'p_break','parser.py',1661),
+  ('continue -> CONTINUE','continue',1,'p_continue','parser.py',1668),
+  ('pony_error -> ERROR','pony_error',1,'p_pony_error','parser.py',1675),
+  ('compile_intrinsic -> COMPILE_INTRINSIC','compile_intrinsic',1,'p_compile_intrinsic','parser.py',1682),
+  ('compile_error -> COMPILE_ERROR','compile_error',1,'p_compile_error','parser.py',1689),
+]
+_signature = '362da57d51c69e68f523b67aafae0d9ea44298d5'
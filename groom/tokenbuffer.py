@@ -0,0 +1,94 @@
+"""
+compact token storage
+
+A TokenBuffer keeps the tokens of a source in parallel arrays (type id,
+start offset, length and line number) instead of one object per token.
+Values and columns are computed from the source when they are asked for.
+"""
+from array import array
+
+from groom.lexer import BufferToken, TRIVIA, Trivia, iter_spans
+from groom.lexer import type_ids, type_names
+
+
+class TokenBuffer(object):
+    def __init__(self, source):
+        self.source = source
+        self.types = array("B")
+        self.starts = array("I")
+        self.lengths = array("I")
+        self.linenos = array("I")
+        self.trivia = None
+        self._tokens = None
+
+    @classmethod
+    def lex(cls, source, skip=TRIVIA, diagnostics=None, keep_trivia=False):
+        """
+        lex str or bytes-like ``source`` into a new buffer, errors are
+        collected in ``diagnostics`` if given (see groom.lexer.lex_raw).
+        With ``keep_trivia`` the skipped tokens are recorded in the
+        ``trivia`` table of the buffer.
+        """
+        buffer = cls(source)
+        if keep_trivia:
+            buffer.trivia = Trivia(source)
+        append = buffer.append
+        spans = iter_spans(source, skip, diagnostics=diagnostics,
+                           trivia=buffer.trivia)
+        for type_, lineno, start, end in spans:
+            append(type_, lineno, start, end)
+        return buffer
+
+    def append(self, type_, lineno, start, end):
+        self.types.append(type_ids[type_])
+        self.starts.append(start)
+        self.lengths.append(end - start)
+        self.linenos.append(lineno)
+
+    @property
+    def lexdata(self):
+        return self.source
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start = self.starts[index]
+        return BufferToken(type_names[self.types[index]], self.linenos[index],
+                           start, start + self.lengths[index], self)
+
+    def __iter__(self):
+        for type_id, start, length, lineno in zip(
+                self.types, self.starts, self.lengths, self.linenos):
+            yield BufferToken(type_names[type_id], lineno, start,
+                              start + length, self)
+
+    def iter_tokens(self, skip=TRIVIA, trivia=None):
+        """
+        yield the tokens, dropping the token types in ``skip`` or recording
+        them in ``trivia``
+        """
+        skipped = {type_ids[type_] for type_ in skip}
+        for type_id, start, length, lineno in zip(
+                self.types, self.starts, self.lengths, self.linenos):
+            if type_id not in skipped:
+                yield BufferToken(type_names[type_id], lineno, start,
+                                  start + length, self)
+            elif trivia is not None:
+                trivia.append(type_names[type_id], start, start + length)
+
+    def token(self):
+        """the next token, to read a buffer like a raw lexer"""
+        if self._tokens is None:
+            self._tokens = iter(self)
+        return next(self._tokens, None)
+
+    def type(self, index):
+        return type_names[self.types[index]]
+
+    def value(self, index):
+        start = self.starts[index]
+        value = self.source[start:start + self.lengths[index]]
+        return value if isinstance(value, str) else bytes(value).decode()
@@ -0,0 +1,161 @@
+"""
+on-disk token cache
+
+A TokenCache stores the tokens of the sources it lexes (trivia included) in
+files named after a hash of the source and of the lexer version, so jobs run
+one after the other over the same tree lex each file once.
+
+A cache file holds a header, then the type ids, lengths and line numbers
+arrays of a TokenBuffer. Tokens are contiguous, the start offsets are
+rebuilt from the lengths. The least recently used files are removed when
+the cache grows over its size limit.
+"""
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from itertools import accumulate
+
+from groom.lexer import lexer_version
+from groom.tokenbuffer import TokenBuffer
+
+MAGIC = b"GRMT"
+FORMAT = 1
+_header = struct.Struct("<4sBI")
+MAX_SIZE = 64 * 1024 * 1024
+
+
+class TokenCache(object):
+    def __init__(self, path, max_size=MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self.version = lexer_version().encode()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(path, exist_ok=True)
+        self._size = sum(size for name, size, mtime in self._entries())
+
+    def _entries(self):
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".tok"):
+                stat = entry.stat()
+                yield entry.path, stat.st_size, stat.st_mtime
+
+    def key(self, source):
+        """the cache key of str or bytes-like ``source``"""
+        digest = hashlib.sha1(self.version)
+        if isinstance(source, str):
+            digest.update(b"s")
+            digest.update(source.encode("utf-8", "surrogatepass"))
+        else:
+            digest.update(b"b")
+            digest.update(source)
+        return digest.hexdigest()
+
+    def _filename(self, key):
+        return os.path.join(self.path, key + ".tok")
+
+    def lex(self, source, diagnostics=None):
+        """
+        the TokenBuffer of ``source``, read from the cache if possible.
+        Errors are collected in ``diagnostics`` if given, the tokens of
+        sources with errors are not stored.
+        """
+        filename = self._filename(self.key(source))
+        buffer = self._load(filename, source)
+        if buffer is not None:
+            self.hits += 1
+            return buffer
+        self.misses += 1
+        errors = [] if diagnostics is not None else None
+        buffer = TokenBuffer.lex(source, (), errors)
+        if errors:
+            diagnostics.extend(errors)
+        else:
+            self._store(filename, buffer)
+        return buffer
+
+    def _load(self, filename, source):
+        try:
+            with open(filename, "rb") as cached:
+                data = cached.read()
+        except OSError:
+            return None
+        buffer = loads(data, source)
+        if buffer is None:
+            self._remove(filename)
+        else:
+            # the modification time tells the last use, for the eviction
+            os.utime(filename)
+        return buffer
+
+    def _store(self, filename, buffer):
+        data = dumps(buffer)
+        fd, tmp = tempfile.mkstemp(".tmp", dir=self.path)
+        with os.fdopen(fd, "wb") as cached:
+            cached.write(data)
+        os.replace(tmp, filename)
+        self._size += len(data)
+        if self._size > self.max_size:
+            self.evict()
+
+    def _remove(self, filename):
+        try:
+            size = os.path.getsize(filename)
+            os.remove(filename)
+        except OSError:
+            return
+        self._size -= size
+
+    def evict(self):
+        """remove the least recently used files down to the size limit"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._size = sum(size for name, size, mtime in entries)
+        for name, size, mtime in entries:
+            if self._size <= self.max_size:
+                break
+            self._remove(name)
+
+    def clear(self):
+        for name, size, mtime in list(self._entries()):
+            self._remove(name)
+
+
+def dumps(buffer):
+    """the cache file content of TokenBuffer ``buffer``"""
+    arrays = [buffer.types, buffer.lengths, buffer.linenos]
+    if sys.byteorder == "big":
+        arrays = [array_[:] for array_ in arrays]
+        for array_ in arrays:
+            array_.byteswap()
+    return _header.pack(MAGIC, FORMAT, len(buffer)) + b"".join(
+        array_.tobytes() for array_ in arrays)
+
+
+def loads(data, source):
+    """
+    the TokenBuffer of ``source`` stored in ``data``, None if ``data`` is not
+    a valid cache file
+    """
+    if len(data) < _header.size:
+        return None
+    magic, format_, count = _header.unpack_from(data)
+    if magic != MAGIC or format_ != FORMAT:
+        return None
+    buffer = TokenBuffer(source)
+    pos = _header.size
+    for array_ in (buffer.types, buffer.lengths, buffer.linenos):
+        end = pos + count * array_.itemsize
+        if end > len(data):
+            return None
+        array_.frombytes(data[pos:end])
+        pos = end
+        if sys.byteorder == "big":
+            array_.byteswap()
+    if pos != len(data):
+        return None
+    if count:
+        buffer.starts.append(0)
+        buffer.starts.extend(accumulate(buffer.lengths[:-1]))
+    return buffer
@@ -0,0 +1,48 @@
+"""
+helpers of the benchmarks
+
+The benchmarks measure wall-clock times, which depend on the machine and
+its load: they only run when GROOM_BENCH is set (``make bench``). The
+functions compared by a benchmark are run in turn, so that they all see the
+same load, with the garbage collector disabled, as a collection would also
+walk the data of the other tests. The best time of the runs is kept, like
+timeit does.
+"""
+import gc
+import os
+import time
+import tracemalloc
+from unittest import skipIf
+
+bench = skipIf(not os.environ.get("GROOM_BENCH"),
+               "set GROOM_BENCH to run the benchmarks")
+
+
+def best_times(*funcs, runs=5):
+    """the best time of each of ``funcs``, called in turn ``runs`` times"""
+    timings = [float("inf")] * len(funcs)
+    gc.disable()
+    try:
+        for i in range(runs):
+            for index, func in enumerate(funcs):
+                start = time.perf_counter()
+                func()
+                timings[index] = min(timings[index],
+                                     time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return timings
+
+
+def traced_memory(func):
+    """
+    the result of ``func()``, the memory it allocated and still holds and
+    the peak of that memory, in bytes
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size, peak
@@ -0,0 +1,141 @@
+"""
+inputs that could make the lexer crawl
+
+Every input is lexed at two sizes by both drivers, the lexing time must stay
+within a linear envelope: proportional to the size, with a cost per
+character bounded by that of ordinary sources. The time spent in each rule
+is printed with ``-s``.
+"""
+import time
+from collections import defaultdict
+
+from groom.lexer import _get_master, _match, _resync, _rules, iter_spans
+from groom.lexer import _known_unterminated, _unterminated_from
+from groom.lexer import lex_raw, scanners
+
+from tests.bench import bench, best_times
+from tests.test_lexer import pony_module
+
+inputs = {
+    "underscores": lambda n: "_" * n,
+    "underscore ids": lambda n: "_a_ " * (n // 4),
+    "quotes": lambda n: '"' * n,
+    "nested quotes": lambda n: '"""' + '"' * (n // 2) + '\\"' * (n // 4),
+    "quadruple quotes": lambda n: '""""\n' * (n // 5),
+    "escaped quotes": lambda n: '"' + '\\"' * (n // 2),
+    "hex": lambda n: "0x" + "f_" * (n // 2),
+    "decimal float": lambda n: "1" * n + ".5",
+    "exponents": lambda n: "1_" * (n // 2) + "e",
+    "spaces paren": lambda n: " " * n + "(",
+    "newline spaces paren": lambda n: "\n" + " " * n + "(",
+    "newline spaces square": lambda n: "\n" + " " * n + "[",
+    "newline spaces minus tilde": lambda n: "\n" + "\t " * (n // 2) + "-~",
+    "newline spaces id": lambda n: "\n" + " " * n + "x",
+    "newline minus": lambda n: "\n-" * (n // 2),
+    "unterminated string": lambda n: '"' + "a" * n,
+    "unterminated triple string": lambda n: '"""' + '""\n' * (n // 3),
+    "unterminated strings": lambda n: "'\"' \"" + "\\\\" * (n // 2),
+    "unterminated string lines": lambda n: '"' + '\n\\"' * (n // 3),
+    "unterminated comment": lambda n: "/*" * (n // 2),
+    "comment closes": lambda n: "*/" * (n // 2),
+    "illegal": lambda n: "$" * n,
+    "illegal spaced": lambda n: "$ " * (n // 2),
+    "char quotes": lambda n: "'" * n,
+    "line comment": lambda n: "//" * (n // 2),
+}
+
+SIZE = 4000
+SCALE = 8
+# times the cost per character of ordinary sources
+ENVELOPE = 20
+
+
+def lex_spans(data):
+    return list(iter_spans(data, (), diagnostics=[]))
+
+
+def lex_ply(data):
+    return list(lex_raw(data, diagnostics=[]))
+
+
+def rule_timings(data):
+    """
+    the time spent in each t_* rule lexing str ``data``: the time of the
+    matches the master regex tries where tokens start, and of the scanners
+    of strings and comments (not called after an unterminated string, as
+    when lexing). Errors are timed as ``t_error``.
+    """
+    master = _get_master(False)
+    rules = _rules()
+    tried = defaultdict(list)
+    errors = []
+    unterminated = None
+    pos = 0
+    while pos < len(data):
+        char = data[pos]
+        regex, types = master.get(char) or master[None]
+        m = None if regex is None else regex.match(data, pos)
+        for name, rule, first in rules:
+            if first is None or char in first:
+                tried[name].append(pos)
+            if m is not None and name == m.lastgroup:
+                break
+        type_, end = _match(master, data, pos, unterminated)
+        if type_ is None or end < 0:
+            errors.append((pos, type_))
+            end = _resync(data, pos, type_)
+            if type_ == "STRING" and unterminated is None:
+                unterminated = _unterminated_from(data, pos)
+        pos = end
+    timings = {}
+    for name, rule, first in rules:
+        match = rule.match
+        scanner = scanners.get(name[2:])
+        start = time.perf_counter()
+        for pos in tried[name]:
+            if (match(data, pos) is not None and scanner is not None and
+                    not _known_unterminated(name[2:], pos, unterminated)):
+                scanner(data, pos)
+        timings[name] = time.perf_counter() - start
+    start = time.perf_counter()
+    for pos, type_ in errors:
+        _resync(data, pos, type_)
+    timings["t_error"] = time.perf_counter() - start
+    return timings
+
+
+def test_rule_timings():
+    timings = rule_timings(pony_module)
+    assert(set(timings) == set(name for name, rule, first in _rules()) |
+           {"t_error"})
+    assert(timings["t_ID"] > 0 and timings["t_error"] >= 0)
+
+
+def test_decimal_floats():
+    data = inputs["decimal float"](100)
+    assert([t[0] for t in lex_spans(data)] == ["FLOAT"])
+
+
+@bench
+def test_linear_envelope():
+    source = pony_module * 20
+    failures = []
+    for lex in (lex_spans, lex_ply):
+        per_char = best_times(lambda: lex(source), runs=3)[0] / len(source)
+        for name, make in inputs.items():
+            small, large = make(SIZE), make(SIZE * SCALE)
+            small_time, large_time = best_times(lambda: lex(small),
+                                                lambda: lex(large), runs=3)
+            # small inputs are timed with the overhead of a lexer run
+            budget = max(SCALE * small_time, per_char * len(large)) * 2
+            budget = min(budget, ENVELOPE * per_char * len(large))
+            if large_time > budget:
+                failures.append("{} {}: {:.4f}s for {} chars".format(
+                    lex.__name__, name, large_time, len(large)))
+    for name, make in inputs.items():
+        timings = rule_timings(make(SIZE * SCALE))
+        print("{}: {}".format(name, ", ".join(
+            "{} {:.2f}ms".format(rule[2:], timing * 1e3)
+            for rule, timing in sorted(timings.items(),
+                                       key=lambda item: -item[1])[:3])))
+    assert(failures == [])
@@ -0,0 +1,154 @@
+import os
+import random
+
+from groom.clones import CloneIndex, find_clones, fingerprints, main
+
+from tests.bench import bench, best_times
+
+function = """
+  fun {name}(x: U32, y: U32): U32 =>
+    var total: U32 = {a}
+    for i in Range[U32](0, x) do
+      if (i % {b}) == 0 then
+        total = total + (i * y)
+      else
+        total = total - {a}
+      end
+    end
+    try
+      let values = Array[U32].create({b})
+      values.push(total)
+      values({a})?
+    else
+      total
+    end
+"""
+
+unrelated = """
+actor Main
+  new create(env: Env) =>
+    env.out.print("hello")
+    let a = [as U8: 1; 2; 3]
+    match a.size()
+    | 0 => env.out.print("empty")
+    | let n: USize => env.out.print(n.string())
+    end
+"""
+
+
+def test_fingerprints():
+    types = [random.Random(1).randrange(100) for i in range(300)]
+    prints = fingerprints(types, 10, 5)
+    positions = [pos for h, pos in prints]
+    assert(positions == sorted(set(positions)))
+    # every window of 5 k-grams holds a fingerprint
+    assert(all(b - a <= 5 for a, b in zip(positions, positions[1:])))
+    shifted = fingerprints([7] * 13 + types, 10, 5)
+    assert(set(h for h, pos in prints) - set(h for h, pos in shifted)
+           <= set(h for h, pos in prints[:2]))
+    assert(fingerprints(types[:5], 10, 5) == [])
+
+
+def test_clones():
+    index = CloneIndex()
+    index.add("a.pony", "primitive A" + function.format(name="f", a=1, b=2))
+    index.add("b.pony", unrelated + "primitive B\n  fun g() => None\n" +
+              function.format(name="renamed", a=42, b=7))
+    index.add("c.pony", "primitive C\n  fun h(): U32 => 3 * 4")
+    clone, = index.clones()
+    assert((clone.first.name, clone.second.name) == ("a.pony", "b.pony"))
+    # the functions, and the identifiers before them ("A" and "None")
+    assert((clone.first.lineno, clone.first.end_lineno) == (1, 17))
+    assert((clone.second.lineno, clone.second.end_lineno) == (11, 28))
+    assert(clone.first.end == len(index.buffers[0]))
+
+
+def test_clones_at_other_offsets():
+    # the tokens before the clone of a.pony match the end of b.pony
+    index = CloneIndex()
+    index.add("a.pony", unrelated + "primitive A" +
+              function.format(name="f", a=1, b=2))
+    index.add("b.pony", "primitive B" + function.format(name="g", a=3, b=4) +
+              unrelated)
+    clones = index.clones()
+    assert([(clone.first.start, clone.second.start) for clone in clones]
+           == [(67, 0), (0, 89)])
+    for clone in clones:
+        assert(clone.first.end - clone.first.start == clone.length)
+        assert(clone.second.end - clone.second.start == clone.length)
+
+
+def test_cli(tmpdir, capsys):
+    for name, source in (("a.pony", function.format(name="f", a=1, b=2)),
+                         ("b.pony", function.format(name="g", a=3, b=4))):
+        with open(os.path.join(str(tmpdir), name), "w") as src:
+            src.write("primitive P" + source)
+    assert(main([str(tmpdir)]) == 1)
+    out = capsys.readouterr().out.splitlines()
+    assert(len(out) == 1 and "a.pony" in out[0] and "b.pony" in out[0])
+    assert(find_clones([str(tmpdir)], min_tokens=1000) == [])
+
+
+def expression(rng, depth):
+    choice = rng.randrange(8 if depth else 4)
+    if choice == 0:
+        return str(rng.randrange(1000))
+    if choice == 1:
+        return rng.choice(("x", "y", "self.size", "env.root"))
+    if choice == 2:
+        return '"{}"'.format(rng.randrange(1000))
+    if choice == 3:
+        return "{}.{}".format(rng.randrange(100), rng.randrange(100))
+    if choice < 6:
+        return "({} {} {})".format(
+            expression(rng, depth - 1), rng.choice("+-*/<>") if choice == 4
+            else rng.choice(("==", "and", "or", "!=", "<=")),
+            expression(rng, depth - 1))
+    args = ", ".join(expression(rng, depth - 1)
+                     for i in range(rng.randrange(4)))
+    return "{}.{}({})".format(expression(rng, depth - 1),
+                              rng.choice(("apply", "push", "string")), args)
+
+
+def statement(rng):
+    template = rng.choice((
+        "    x = {}\n", "    env.out.print({})\n",
+        "    if {} then return {} end\n", "    let v: U32 = {}\n",
+        "    while {} do x = {} end\n", "    try y({})? else {} end\n",
+        "    match {}\n    | {} => None\n    end\n"))
+    return template.format(*[expression(rng, rng.randrange(4))
+                             for i in range(template.count("{}"))])
+
+
+def corpus(rng, tokens):
+    count = 0
+    files = []
+    while count < tokens:
+        body = "".join(statement(rng) for i in range(rng.randrange(5, 50)))
+        if files and rng.random() < 0.1:
+            # paste the end of the previous file
+            body += files[-1][-800:].split("\n", 1)[-1]
+        source = "primitive P\n  fun f(x: U32) =>\n" + body
+        files.append(source)
+        count += len(source) // 3
+    return files
+
+
+@bench
+def test_bench_clones():
+    index = CloneIndex()
+    files = corpus(random.Random(3), int(os.environ.get(
+        "GROOM_CLONE_TOKENS", 100000 if os.environ.get("SHORT_TESTS") else
+        1000000)))
+
+    def find():
+        for i, source in enumerate(files):
+            index.add(str(i), source)
+        clones.extend(index.clones())
+
+    clones = []
+    elapsed, = best_times(find, runs=1)
+    tokens = sum(len(buffer) for buffer in index.buffers)
+    print("{} tokens, {} clones in {:.2f}s".format(
+        tokens, len(clones), elapsed))
+    assert(clones)
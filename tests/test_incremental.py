@@ -0,0 +1,104 @@
+import random
+
+from ply.lex import LexError
+import pytest
+
+from groom.incremental import IncrementalLexer
+from groom.lexer import iter_spans
+
+from tests.bench import bench, best_times
+from tests.test_lexer import as_tuples, pony_module, stdlib_sources
+
+
+def check_edit(lexer, offset, removed, inserted):
+    data = lexer.lexdata
+    data = data[:offset] + inserted + data[offset + removed:]
+    old = list(lexer.spans())
+    try:
+        expected = list(iter_spans(data, ()))
+    except LexError:
+        with pytest.raises(LexError):
+            lexer.edit(offset, removed, inserted)
+        assert(list(lexer.spans()) == old)
+        return
+    index, old_count, new_count = lexer.edit(offset, removed, inserted)
+    assert(lexer.lexdata == data)
+    assert(list(lexer.spans()) == expected)
+    assert(len(lexer) == len(expected))
+    assert(old[:index] == expected[:index])
+    assert(len(old) - old_count == len(expected) - new_count)
+
+
+def test_edit():
+    lexer = IncrementalLexer(pony_module)
+    check_edit(lexer, 0, 0, "use \"foo\"\n")
+    check_edit(lexer, len(lexer.lexdata), 0, "\nclass Bar\n")
+    check_edit(lexer, 10, 5, "")
+    check_edit(lexer, 30, 0, "/* open")
+    check_edit(lexer, 30, 0, "/* a\n comment */")
+    check_edit(lexer, 0, len(lexer.lexdata), "")
+    check_edit(lexer, 0, 0, "actor Main")
+
+
+def test_edit_char_newline():
+    # a char literal can hold a raw newline
+    lexer = IncrementalLexer("x = '\n'\ny\n" * 3)
+    check_edit(lexer, 2, 0, "z")
+    check_edit(lexer, 0, 0, "'\n' ")
+    check_edit(lexer, 12, 0, "\n")
+    data = lexer.lexdata
+    for type_, lineno, start, end in lexer.spans():
+        assert(lineno == data.count("\n", 0, start) + 1)
+
+
+def test_edit_resync():
+    lexer = IncrementalLexer(pony_module)
+    index, old_count, new_count = lexer.edit(20, 0, "\n")
+    assert(old_count <= 4 and new_count <= 5)
+    assert(as_tuples(lexer) == as_tuples(
+        IncrementalLexer(lexer.lexdata)))
+
+
+def test_random_edits():
+    rng = random.Random(42)
+    lexer = IncrementalLexer(pony_module)
+    for i in range(500):
+        offset = rng.randrange(len(lexer.lexdata) + 1)
+        removed = rng.choice((0, 0, 1, 3))
+        inserted = rng.choice(("", "a", " ", "\n", "(", "-", "1", '"', "/*",
+                               "*/", '"""', "x.y", "\n  ("))
+        check_edit(lexer, offset, removed, inserted)
+
+
+def time_edits(data, count=100):
+    """the time of a single character edit of ``data``, and of relexing it"""
+    lexer = IncrementalLexer(data)
+    offsets = [offset for offset in (len(data) * i // count
+                                     for i in range(count))
+               if data[offset].isspace()]
+
+    def edit():
+        for offset in offsets:
+            lexer.edit(offset, 0, " ")
+            lexer.edit(offset, 1, "")
+
+    edits, full = best_times(edit, lambda: list(iter_spans(data, ())),
+                             runs=3)
+    return edits / (2 * len(offsets)), full
+
+
+@bench
+def test_bench_single_char_edit():
+    data = pony_module * 200
+    edit, full = time_edits(data)
+    print("edit {:.6f}s, full relex {:.6f}s".format(edit, full))
+    assert(edit * 20 < full)
+
+
+@bench
+def test_bench_stdlib_edits():
+    data = max(stdlib_sources(), key=len)
+    edit, full = time_edits(data)
+    print("{} chars: edit {:.6f}s, full relex {:.6f}s".format(
+        len(data), edit, full))
+    assert(edit < full)
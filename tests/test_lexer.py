@@ -1,9 +1,25 @@
+import io
 import os
+import random
+import re
+import subprocess
+import sys
 from unittest import skipIf
 
-from groom.lexer import lex_raw
+from ply.lex import LexError
+import pytest
+
+from groom import lexer as lexer_module, lextab
+from groom.lexer import Lexer, iter_tokens, lex_raw, lex_stream
+from groom.lexer import rules_signature, type_ids, type_names, SymbolTable
+from groom.lexer import ENGINES, NEWLINE_TYPES, TRIVIA
+from groom.lexer import BufferLexer, LineIndex, PonyLexError, Trivia
+from groom.lexer import restore_source
+from groom.tokenbuffer import TokenBuffer
 from groom.utils import find_pony_stdlib_path
 
+from tests.bench import bench, best_times
+
 
 HERE = os.path.dirname(os.path.realpath(__file__))
 
@@ -26,6 +42,32 @@ class Token(object):
             self.type, self.value, self.lineno, self.pos)
 
 
+# self time of `import groom.lexer`, in microseconds
+IMPORT_BUDGET = 10000
+
+
+def test_lextab_up_to_date():
+    # run `python -m groom.lexer` after changing the lexer rules
+    assert(lextab._signature == rules_signature())
+
+
+def test_import_is_lazy():
+    code = "import groom.lexer; assert groom.lexer._raw_lexer is None"
+    # the first run may have to write the bytecode
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    for _ in range(2):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=os.path.dirname(HERE), env=env, check=True,
+            stderr=subprocess.PIPE, universal_newlines=True)
+    for line in result.stderr.splitlines():
+        if line.endswith("| groom.lexer"):
+            self_time = int(line.split("|")[0].split(":")[1])
+    print("import groom.lexer: {}us".format(self_time))
+    assert(self_time < IMPORT_BUDGET)
+
+
 def check_token(data, expected_type):
     lexer = lex_raw(data)
     t = lexer.token()
@@ -46,42 +88,86 @@ def test_int():
 
 def test_float():
     check_token("1.23", "FLOAT")
+    check_token("123.45", "FLOAT")
+    check_token("1_2e-3", "FLOAT")
 
 
 def test_lparen():
     check_token("(", "LPAREN")
 
 
-def test_lparen_new():
-    check_token("""
-    (""", 'LPAREN_NEW')
-
-
 def test_lsquare():
     check_token("[", "LSQUARE")
 
 
-def test_lsquare_new():
-    check_token("""
-    [""", 'LSQUARE_NEW')
-
-
 def test_minus():
     check_token("-", "MINUS")
 
 
-def test_minus_new():
-    check_token("""
-    -""", 'MINUS_NEW')
-
-
 def test_minus_tilde():
     check_token("-~", "MINUS_TILDE")
 
 
-def test_minus_tilde_new():
-    check_token("""
-    -~""", 'MINUS_TILDE_NEW')
+def newline_flags(tokens):
+    return [(t.type, t.newline) for t in tokens if t.type in NEWLINE_TYPES]
+
+
+def test_newline_flag():
+    data = 'x (\n  [-\n -~ /* c */ -\n/* c */\n\t(\r\n- x\n y("x")'
+    expected = [("LPAREN", False), ("LSQUARE", True), ("MINUS", False),
+                ("MINUS_TILDE", True), ("MINUS", False), ("LPAREN", True),
+                ("MINUS", True), ("LPAREN", False)]
+    assert(newline_flags(lex_raw(data)) == expected)
+    assert(newline_flags(lex_raw(data, engine="native")) == expected)
+    assert(newline_flags(lex_raw(data.encode())) == expected)
+    assert(newline_flags(TokenBuffer.lex(data)) == expected)
+    for chunk_size in (1, 4096):
+        stream = lex_stream(io.StringIO(data), chunk_size)
+        assert(newline_flags(stream) == expected)
+    assert(newline_flags(lex_raw("(")) == [("LPAREN", False)])
+
+
+def test_string():
+    check_token('"hello \\"world\\" \\\\"', 'STRING')
+    check_token('""', 'STRING')
+    check_token('""" a "quoted" ""word"" """', 'STRING')
+    check_token('"""ends with quotes""""', 'STRING')
+
+
+def test_nested_comment():
+    check_token("/* a /* nested */ comment */", "NESTEDCOMMENT")
+    check_token("/* a /* twice /* nested */ */ comment */", "NESTEDCOMMENT")
+
+
+def test_unterminated():
+    for data in ('"abc', '"""abc""', 'x = "abc\\"', "/* a /* b */"):
+        with pytest.raises(LexError):
+            [t for t in lex_raw(data)]
+
+
+def lex_unterminated(data):
+    try:
+        [t for t in lex_raw(data)]
+    except LexError:
+        pass
+
+
+@bench
+def test_bench_pathological_literals():
+    size = 100 * 1024
+    inputs = {
+        "docstring": '"""' + 'doc "string" ""\\n\n' * (size // 16) + '"""',
+        "escapes": '"' + '\\"' * (size // 2) + '"',
+        "unclosed string": '"' + "a\\\"" * (size // 3),
+        "unclosed docstring": '"""' + 'a""' * (size // 3),
+        "unclosed comment": "/*" + " * / *" * (size // 6),
+        "nested comments": "/*" * (size // 4) + "*/" * (size // 4),
+        "unclosed nested comments": "/*" * (size // 2),
+    }
+    for name, data in inputs.items():
+        elapsed, = best_times(lambda: lex_unterminated(data), runs=3)
+        print("{}: {:.4f}s".format(name, elapsed))
+        assert(elapsed < 0.5)
 
 
 pony_module = r'''
@@ -120,6 +206,367 @@ def test_module():
     [t for t in lexer]
 
 
+def as_tuples(tokens):
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in tokens]
+
+
+def test_lexer_skips_trivia():
+    expected = [t for t in lex_raw(pony_module) if t.type not in TRIVIA]
+    lexer = Lexer()
+    lexer.input(pony_module)
+    assert(as_tuples(lexer) == as_tuples(expected))
+    assert(lexer.token() is None)
+
+
+def test_lexer_long_trivia_run():
+    data = "// comment\n" * 10000 + "actor"
+    lexer = Lexer()
+    lexer.input(data)
+    t = lexer.token()
+    assert((t.type, t.value, t.lineno) == ("CLASS_DECL", "actor", 10001))
+    assert(lexer.token() is None)
+
+
+def test_lex_bytes():
+    expected = as_tuples(lex_raw(pony_module))
+    data = pony_module.encode()
+    for buffer in (data, bytearray(data), memoryview(data)):
+        assert(as_tuples(lex_raw(buffer)) == expected)
+
+
+def test_lex_bytes_offsets():
+    tokens = list(lex_raw('"h\u00e9llo" x'.encode()))
+    assert(as_tuples(tokens) == [
+        ("STRING", '"h\u00e9llo"', 1, 0), ("WS", " ", 1, 8), ("ID", "x", 1, 9)])
+
+
+def test_lex_bytes_unicode():
+    # the bytes regexes match the UTF-8 encoding of what the str ones match
+    assert(re.findall(r"\s", "".join(map(chr, range(sys.maxunicode + 1))))
+           == list(lexer_module._unicode_spaces))
+    data = ("let x\u00a0=\u3000'\u00e9' // \u00e9\n\u2003(\"\u00e9\", "
+            "'\U0001f600')\n\u00a0-1 + \u00e9 + x\x1c- y")
+    diagnostics, encoded_diagnostics = [], []
+    tokens = [(t.type, t.value, t.lineno, getattr(t, "newline", None))
+              for t in lex_raw(data, diagnostics=diagnostics)]
+    encoded_tokens = [
+        (t.type, t.value, t.lineno,
+         t.newline if t.type in NEWLINE_TYPES else None)
+        for t in lex_raw(data.encode(), diagnostics=encoded_diagnostics)]
+    assert(encoded_tokens == tokens)
+    assert(("WS", "\u00a0", 1, None) in tokens)
+    assert(("INT", "'\u00e9'", 1, None) in tokens)
+    assert(("INT", "'\U0001f600'", 2, None) in tokens)
+    assert(("MINUS", "-", 3, True) in tokens)
+    assert([str(e) for e in encoded_diagnostics] ==
+           ["Error at line 3, column 8: '\u00e9'"])
+    assert(str(diagnostics[0]) == "Error at line 3, column 7: '\u00e9'")
+
+
+def test_lex_mapped_file(tmp_path):
+    path = tmp_path / "module.pony"
+    path.write_text(pony_module)
+    lexer = Lexer()
+    lexer.input(pony_module)
+    expected = as_tuples(lexer)
+    with open(str(path), "rb") as src:
+        lexer.input(src)
+        assert(as_tuples(lexer) == expected)
+
+
+stream_samples = [
+    pony_module,
+    '"""' + 'doc ""string""\n' * 50 + '"""\n  -~x',
+    "/* /* a */ \n" * 30 + "*/" * 30 + "\n   \n  (a)\n\n -1",
+    "let x: U32 = 123_456 + 0xFF_FF - 'a' - 1.5e-3\n  [1]",
+]
+
+
+def test_lex_stream():
+    for data in stream_samples:
+        expected = as_tuples(lex_raw(data))
+        for chunk_size in (1, 2, 3, 7, 64, 4096):
+            assert(as_tuples(lex_stream(io.StringIO(data), chunk_size))
+                   == expected)
+            assert(as_tuples(lex_stream(io.BytesIO(data.encode()),
+                                        chunk_size)) == expected)
+
+
+def test_lex_stream_unterminated():
+    for data in ('x "abc', '"""abc""', "/* a /* b */"):
+        with pytest.raises(LexError):
+            [t for t in lex_stream(io.StringIO(data), 2)]
+
+
+def test_line_index():
+    index = LineIndex("ab\ncd\n\ne")
+    assert(list(index.starts) == [0, 3, 6, 7])
+    assert([index.position(i) for i in (0, 2, 3, 6, 7, 8)] ==
+           [(1, 1), (1, 3), (2, 1), (3, 1), (4, 1), (4, 2)])
+    assert(list(LineIndex(b"ab\ncd").starts) == [0, 3])
+
+
+def positions(tokens):
+    return [(t.value, t.lineno, t.column) for t in tokens]
+
+
+def test_columns():
+    data = 'actor Main\n  new create() =>\n    """\n  doc\n  """ x\n'
+    lexer = Lexer()
+    lexer.input(data)
+    expected = positions(lexer)
+    assert(expected[:4] == [("actor", 1, 1), ("Main", 1, 7), ("new", 2, 3),
+                            ("create", 2, 7)])
+    assert(expected[-2:] == [('"""\n  doc\n  """', 3, 5), ("x", 5, 7)])
+    assert(positions(iter_tokens(BufferLexer(data.encode()))) == expected)
+    assert(positions(TokenBuffer.lex(data)) == expected)
+    assert(positions(iter_tokens(lex_raw(data, engine="native"))) == expected)
+    # the raw PLY lexer, whitespace included
+    assert(positions(t for t in lex_raw(data) if t.type not in TRIVIA) ==
+           expected)
+    for chunk_size in (1, 3, 4096):
+        stream = lex_stream(io.StringIO(data), chunk_size)
+        assert(positions(iter_tokens(stream)) == expected)
+
+
+def test_error_position():
+    data = 'x = 1\n  y = "abc\\"\n'
+    for tokens in (lambda: lex_raw(data), lambda: lex_raw(data.encode()),
+                   lambda: lex_raw(data, engine="native"),
+                   lambda: lex_stream(io.StringIO(data), 2)):
+        with pytest.raises(PonyLexError) as error:
+            list(tokens())
+        assert((error.value.lineno, error.value.column) == (2, 7))
+        assert(str(error.value).startswith("Error at line 2, column 7:"))
+    with pytest.raises(PonyLexError) as error:
+        list(lex_raw("x\n y $"))
+    assert((error.value.lineno, error.value.column) == (2, 4))
+
+
+recovery_source = 'actor Main $ x\n  let t = $$ "ok"\n  x = "abc\n  y'
+
+
+def recovered(lex):
+    diagnostics = []
+    tokens = [(t.type, t.value, t.lineno) for t in iter_tokens(
+        lex(diagnostics))]
+    return tokens, [(e.lineno, e.column, e.lexpos) for e in diagnostics]
+
+
+def test_recovery():
+    for data, errors, error_tokens in (
+            (recovery_source, [(1, 12, 11), (2, 11, 25), (3, 7, 39)],
+             [("LEXERROR", "$", 1), ("LEXERROR", "$$", 2), ("LEXERROR", '"abc', 3)]),
+            ("x /* a /* b */\ny", [(1, 3, 2)],
+             [("LEXERROR", "/* a /* b */\ny", 1)])):
+        expected = recovered(lambda d: lex_raw(data, diagnostics=d))
+        assert(expected[1] == errors)
+        assert([t for t in expected[0] if t[0] == "LEXERROR"] == error_tokens)
+        assert(recovered(lambda d: lex_raw(data.encode(), diagnostics=d))
+               == expected)
+        assert(recovered(lambda d: lex_stream(io.StringIO(data), 3,
+                                              diagnostics=d)) == expected)
+        assert(recovered(lambda d: TokenBuffer.lex(data, (), d)) == expected)
+        assert(recovered(lambda d: lex_raw(data, diagnostics=d,
+                                           engine="native")) == expected)
+    diagnostics = []
+    lexer = Lexer(diagnostics=diagnostics)
+    lexer.input(recovery_source)
+    assert([(t.type, t.value) for t in lexer][-5:] == [
+        ("STRING", '"ok"'), ("ID", "x"), ("=", "="), ("LEXERROR", '"abc'),
+        ("ID", "y")])
+    assert(str(diagnostics[2]) ==
+           "Error at line 3, column 7: unterminated STRING")
+    with pytest.raises(PonyLexError):
+        list(lex_raw(recovery_source))
+
+
+def test_recovery_without_lextab(monkeypatch):
+    def tokens(d):
+        lexer = lex_raw(recovery_source, diagnostics=d)
+        return [(t.type, t.value, t.lineno) for t in iter(lexer.token, None)]
+    expected = tokens([])
+    # groom.lextab out of date: the lexer is built from the rules
+    monkeypatch.setattr(lexer_module, "rules_signature", lambda: None)
+    monkeypatch.setattr(lexer_module, "_raw_lexer", None)
+    assert(not lexer_module.get_raw_lexer().lexoptimize)
+    assert(tokens([]) == expected)
+    assert(("LEXERROR", '"abc', 3) in expected)
+
+
+def test_recovery_scans_once(monkeypatch):
+    # no quote after the first one is unescaped: each string is unterminated
+    data = 'x = "a\n' + '/* c */ \\"\n' * 50
+    scan = lexer_module.scanners["STRING"]
+    scans = []
+    monkeypatch.setitem(lexer_module.scanners, "STRING",
+                        lambda data, pos: scans.append(pos) or scan(data, pos))
+    for lex in (lambda d: lex_raw(data, diagnostics=d),
+                lambda d: lex_raw(data.encode(), diagnostics=d),
+                lambda d: TokenBuffer.lex(data, (), d),
+                lambda d: lex_raw(data, diagnostics=d, engine="native"),
+                # scanned again once the end of the stream is read
+                lambda d: lex_stream(io.StringIO(data), diagnostics=d)):
+        del scans[:]
+        tokens, errors = recovered(lex)
+        # the comments are scanned
+        assert(len(errors) == 51)
+        assert(tokens[-1] == ("LEXERROR", '"', 51))
+        assert(len(scans) <= 2)
+
+
+def test_trivia():
+    lexer = Lexer(keep_trivia=True)
+    lexer.input(pony_module)
+    tokens = list(lexer)
+    trivia = lexer.trivia
+    assert(all(type_ in TRIVIA for start, length, type_ in trivia))
+    assert(restore_source(tokens, trivia) == pony_module)
+    assert(len(tokens) + len(trivia) == len(list(lex_raw(pony_module))))
+    for lex in (lambda: BufferLexer(pony_module.encode()),
+                lambda: TokenBuffer.lex(pony_module, ())):
+        other = Trivia(pony_module)
+        assert(as_tuples(iter_tokens(lex(), TRIVIA, other))
+               == as_tuples(tokens))
+        assert(list(other) == list(trivia))
+    other = Trivia()
+    stream = lex_stream(io.StringIO(pony_module), 5)
+    assert(as_tuples(iter_tokens(stream, TRIVIA, other)) == as_tuples(tokens))
+    assert(list(other) == list(trivia))
+    buffer = TokenBuffer.lex(pony_module.encode(), keep_trivia=True)
+    assert(restore_source(buffer, buffer.trivia) == pony_module)
+
+
+def test_trivia_comments():
+    data = "// a\n/* b */\nactor Main // c\n  /* d */ // e\n  new create()"
+    lexer = Lexer(keep_trivia=True)
+    lexer.input(data)
+    tokens = list(lexer)
+    trivia = lexer.trivia
+    assert([text for offset, text in trivia.comments()] ==
+           ["// a", "/* b */", "// c", "/* d */", "// e"])
+    new = [t for t in tokens if t.type == "METH_DECL"][0]
+    assert("".join(trivia.text(i) for i in trivia.leading(new.lexpos)) ==
+           " // c\n  /* d */ // e\n  ")
+    assert(trivia.leading(0) == [])
+
+
+class RepeatedSource(io.TextIOBase):
+    "a text stream repeating ``text`` ``count`` times, produced on demand"
+    def __init__(self, text, count):
+        self.text = text
+        self.count = count
+        self.pending = ""
+
+    def read(self, size=-1):
+        while self.count and len(self.pending) < size:
+            self.pending += self.text
+            self.count -= 1
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+
+def test_lex_stream_bounded_memory():
+    chunk_size = 4096
+    lexer = lex_stream(RepeatedSource(pony_module, 200), chunk_size)
+    count = 0
+    buffered = 0
+    for t in iter_tokens(lexer):
+        count += 1
+        buffered = max(buffered, len(lexer.lexdata))
+    assert(count == 200 * len(list(iter_tokens(lex_raw(pony_module)))))
+    assert(buffered < 3 * chunk_size)
+
+
+def test_interned_identifiers():
+    symbols = SymbolTable()
+    first, second = [[t for t in lex_raw(data, symbols) if t.type == "ID"]
+                     for data in ("foo" + " bar", "fo" + "o")]
+    assert(first[0].value is second[0].value)
+    assert(symbols["foo"] == ("ID", "foo"))
+    assert(symbols["actor"] == ("CLASS_DECL", "actor"))
+    stream = list(lex_stream(io.StringIO("fo" + "o"), 2, symbols))
+    assert(stream[0].value is first[0].value)
+    native = list(lex_raw("fo" + "o", symbols, engine="native"))
+    assert(native[0].value is first[0].value)
+    encoded = list(lex_raw(b"foo", symbols))
+    assert(encoded[0].value is first[0].value)
+    # without a table, each lexer has its own
+    for lex in (lex_raw, lambda data: lex_raw(data, engine="native"),
+                lambda data: lex_stream(io.StringIO(data))):
+        lexers = [lex("unique" + "_word"), lex("unique_word")]
+        for lexer in lexers:
+            list(lexer)
+        assert(lexers[0].symbols is not lexers[1].symbols)
+        assert("unique_word" in lexers[0].symbols)
+    lexer = Lexer()
+    lexer.input("x")
+    list(lexer)
+    assert(lexer._lexer.symbols is lexer.symbols)
+    lexer.input("y")
+    list(lexer)
+    assert(lexer._lexer.symbols is lexer.symbols)
+    assert("x" not in lexer.symbols)
+    lexer = Lexer(symbols=symbols)
+    for data in ("x", "y"):
+        lexer.input(data)
+        list(lexer)
+        assert(lexer.symbols is symbols)
+    assert("x" in symbols)
+
+
+def test_type_ids():
+    lexer = Lexer(int_types=True)
+    lexer.input(pony_module)
+    expected = as_tuples(iter_tokens(lex_raw(pony_module)))
+    assert([(type_names[t[0]],) + t[1:] for t in as_tuples(lexer)]
+           == expected)
+
+
+def test_type_ids_are_unique():
+    assert(len(type_ids) == len(type_names))
+
+
+def test_type_ids_are_stable():
+    code = "import groom.lexer; print(groom.lexer.type_names)"
+    outputs = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outputs.add(subprocess.check_output(
+            [sys.executable, "-c", code], cwd=os.path.dirname(HERE), env=env))
+    assert(len(outputs) == 1)
+
+
+def stdlib_sources():
+    path = find_pony_stdlib_path()
+    for root, dirs, files in os.walk(path):
+        for ponysrc in [f for f in files if f.endswith(".pony")]:
+            with open(os.path.join(root, ponysrc)) as src:
+                yield src.read()
+
+
+@bench
+def test_bench_trivia_skipping():
+    sources = list(stdlib_sources())
+
+    def token_loop(data):
+        lexer = lex_raw(data)
+        return [t for t in iter(lexer.token, None) if t.type not in TRIVIA]
+
+    def lexer_iter(data):
+        lexer = Lexer()
+        lexer.input(data)
+        return list(lexer)
+
+    count = sum(len(token_loop(data)) for data in sources)
+    timings = best_times(*(lambda lex=lex: [lex(data) for data in sources]
+                           for lex in (token_loop, lexer_iter)), runs=3)
+    print("tokens/s: token loop {:.0f}, lexer iter {:.0f}".format(
+        *(count / timing for timing in timings)))
+    for data in sources:
+        assert(as_tuples(token_loop(data)) == as_tuples(lexer_iter(data)))
+
+
 @skipIf(os.environ.get("SHORT_TESTS", 0), "perform short tests")
 def test_lex_stdlib():
     path = find_pony_stdlib_path()
@@ -128,3 +575,65 @@ def test_lex_stdlib():
             with open(os.path.join(root, ponysrc)) as src:
                 print(os.path.join(root, ponysrc))
                 [t for t in lex_raw(src)]
+
+
+def test_first_char_dispatch():
+    from groom.lexer import _get_master, _match
+    rng = random.Random(2)
+    chars = "\t\n ()[]{}\"'-~<>=+*/.,:;#@!?^&|$%_`\\aAzZeEx019"
+    for binary in (False, True):
+        master = _get_master(binary)
+        full = {None: master[None]}
+        for i in range(3000):
+            size = rng.randrange(1, 8)
+            data = "".join(rng.choice(chars) for i in range(size))
+            data = data.encode() if binary else data + "é"
+            assert(_match(master, data, 0) == _match(full, data, 0))
+
+
+def engine_tokens(data, engine, diagnostics=None):
+    return [(t.type, t.value, t.lineno, t.lexpos, t.column)
+            for t in iter_tokens(lex_raw(data, diagnostics=diagnostics,
+                                         engine=engine), ())]
+
+
+def test_native_engine():
+    for data in (pony_module, recovery_source, "", "x /* a /* b */\ny"):
+        errors = {}
+        assert(engine_tokens(data, "native", errors.setdefault("native", []))
+               == engine_tokens(data, "ply", errors.setdefault("ply", [])))
+        assert([str(e) for e in errors["native"]] ==
+               [str(e) for e in errors["ply"]])
+    lexer = Lexer(engine="native")
+    lexer.input(pony_module)
+    expected = Lexer()
+    expected.input(pony_module)
+    assert(as_tuples(lexer) == as_tuples(expected))
+    with pytest.raises(ValueError):
+        lex_raw(pony_module, engine="yacc")
+
+
+def test_engine_from_environment():
+    code = ("import groom.lexer as l; "
+            "assert type(l.lex_raw('x')) is l.NativeLexer; "
+            "assert l._raw_lexer is None")
+    env = dict(os.environ, GROOM_LEXER_ENGINE="native")
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(HERE),
+                   env=env, check=True)
+
+
+@skipIf(os.environ.get("SHORT_TESTS", 0), "perform short tests")
+def test_native_engine_stdlib():
+    for data in stdlib_sources():
+        assert(engine_tokens(data, "native") == engine_tokens(data, "ply"))
+
+
+@bench
+def test_bench_native_engine():
+    data = pony_module * 100
+    timings = dict(zip(ENGINES, best_times(
+        *(lambda engine=engine: list(lex_raw(data, engine=engine))
+          for engine in ENGINES))))
+    print(", ".join("{} {:.4f}s".format(engine, timing)
+                    for engine, timing in timings.items()))
+    assert(timings["native"] < timings["ply"])
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+
+from groom.lexer import Lexer
+from groom.lextree import lex_tree, main
+from groom.tokenbuffer import TokenBuffer
+
+from tests.bench import bench, best_times
+from tests.test_lexer import as_tuples, pony_module
+
+
+def make_tree(root, count):
+    for i in range(count):
+        package = os.path.join(str(root), "package{}".format(i % 7))
+        os.makedirs(package, exist_ok=True)
+        with open(os.path.join(package, "f{}.pony".format(i)), "w") as src:
+            src.write(pony_module * (i % 3 + 1))
+    with open(os.path.join(str(root), "bad.pony"), "w") as src:
+        src.write('actor Main\n  let s = "unterminated\n')
+    with open(os.path.join(str(root), "notes.txt"), "w") as src:
+        src.write('"')
+
+
+def count_tokens(data):
+    lexer = Lexer()
+    lexer.input(data)
+    return sum(1 for t in lexer)
+
+
+def test_lex_tree(tmpdir):
+    make_tree(tmpdir, 20)
+    results = lex_tree(str(tmpdir), 1)
+    assert(len(results) == 21)
+    assert([r.path for r in results] == sorted(r.path for r in results))
+    bad, = [r for r in results if r.error is not None]
+    assert(bad.path.endswith("bad.pony") and bad.count is None)
+    assert("line 2" in bad.error)
+    for result in results:
+        if result is not bad:
+            with open(result.path) as src:
+                assert(result.count == count_tokens(src.read()))
+    assert(lex_tree(str(tmpdir), 3) == results)
+
+
+def test_lex_tree_buffers(tmpdir):
+    make_tree(tmpdir, 5)
+    for result in lex_tree(str(tmpdir), 2, buffers=True):
+        if result.error is None:
+            with open(result.path, "rb") as src:
+                expected = as_tuples(TokenBuffer.lex(src.read()))
+            assert(as_tuples(result.buffer) == expected)
+            assert(len(result.buffer) == result.count)
+
+
+def test_cli(tmpdir, capsys):
+    make_tree(tmpdir, 3)
+    assert(main([str(tmpdir), "-j", "1", "-q"]) == 1)
+    out = capsys.readouterr().out.splitlines()
+    assert(len(out) == 2 and "bad.pony" in out[0])
+    assert(out[1].startswith("4 files, "))
+    os.remove(os.path.join(str(tmpdir), "bad.pony"))
+    process = subprocess.run([sys.executable, "-m", "groom.lextree",
+                              str(tmpdir)], stdout=subprocess.PIPE)
+    assert(process.returncode == 0)
+    assert(len(process.stdout.splitlines()) == 4)
+
+
+def test_lex_tree_recover(tmpdir):
+    make_tree(tmpdir, 3)
+    with open(os.path.join(str(tmpdir), "bad.pony"), "a") as src:
+        src.write("  let y = $\n")
+    for workers in (1, 2):
+        results = lex_tree(str(tmpdir), workers, recover=True)
+        assert(all(r.error is None for r in results))
+        bad, = [r for r in results if r.diagnostics]
+        assert([(e.lineno, e.column) for e in bad.diagnostics] ==
+               [(2, 11), (3, 11)])
+    assert(main([str(tmpdir), "-j", "1", "-q", "-k"]) == 1)
+
+
+@bench
+def test_bench_lex_tree(tmpdir):
+    make_tree(tmpdir, 2000)
+    counts = sorted({1, 2, os.cpu_count() or 1})
+    timings = best_times(*(lambda workers=workers: lex_tree(str(tmpdir),
+                                                           workers)
+                           for workers in counts), runs=3)
+    for workers, timing in zip(counts, timings):
+        print("{} processes: {:.2f}s".format(workers, timing))
+    assert(len(lex_tree(str(tmpdir))) == 2001)
@@ -0,0 +1,98 @@
+import os
+from unittest import skipIf
+
+from groom.ast.nodes import MethodNode
+from groom.lexer import Lexer, iter_spans
+from groom.outline import Class, Method, main, outline
+from groom.parser import Parser
+
+from tests.bench import bench, best_times
+from tests.test_lexer import pony_module, stdlib_sources
+
+source = r'''use "lib" if windows
+
+actor \packed\ Main[A: Seq[B] val]
+  """
+  docstring
+  """
+  let x: U32 = if y then 1 else 2 end
+
+  new create(env: Env) =>
+    let o = object
+      fun apply() => None
+    end
+    match x
+    | let n: (U8 | U16) if n > 0 => while x do o() end
+    | 0 => None
+    end
+
+  fun @bare() => None
+  be ref go[T]() =>
+    None
+
+// not in the outline
+type Alias is (A | B)
+interface I
+  fun f(): U32
+  fun g()
+'''
+
+
+def test_outline():
+    assert(outline(source) == [
+        Class("actor", "Main", None, "[A: Seq[B] val]", 3, 20, [
+            Method("new", "create", None, None, 9, 16),
+            Method("fun", "bare", "@", None, 18, 18),
+            Method("be", "go", "ref", "[T]", 19, 20)]),
+        Class("type", "Alias", None, None, 23, 23, []),
+        Class("interface", "I", None, None, 24, 26, [
+            Method("fun", "f", None, None, 25, 25),
+            Method("fun", "g", None, None, 26, 26)])])
+    assert(outline(source.encode()) == outline(source))
+    assert(outline("") == [])
+
+
+def names(tree):
+    return [(cls.node_type, cls.id.id,
+             [(m.node_type, m.id.id) for m in cls.members
+              if isinstance(m, MethodNode)])
+            for cls in tree.class_defs]
+
+
+def outline_names(data):
+    return [(cls.kind, cls.name, [(m.kind, m.name) for m in cls.methods])
+            for cls in outline(data)]
+
+
+def test_outline_matches_parser():
+    parser = Parser()
+    for data in (source.replace("fun @bare", "fun bare"), pony_module):
+        assert(outline_names(data) ==
+               names(parser.parse(data, lexer=Lexer())))
+
+
+@skipIf(os.environ.get("SHORT_TESTS", 0), "perform short tests")
+def test_outline_stdlib():
+    parser = Parser()
+    for data in stdlib_sources():
+        assert(outline_names(data) ==
+               names(parser.parse(data, lexer=Lexer())))
+
+
+def test_cli(tmpdir, capsys):
+    path = os.path.join(str(tmpdir), "a.pony")
+    with open(path, "w") as src:
+        src.write(source)
+    assert(main([path]) == 0)
+    out = capsys.readouterr().out.splitlines()
+    assert(out[1:3] == ["  actor Main 3-20", "    new create 9-16"])
+
+
+@bench
+def test_bench_outline():
+    data = pony_module * 300
+    outlining, lexing = best_times(lambda: outline(data),
+                                   lambda: list(iter_spans(data)))
+    print("outline {:.4f}s, lexing {:.4f}s".format(outlining, lexing))
+    # the lexing takes most of it
+    assert(outlining < 2 * lexing)
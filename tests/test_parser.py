@@ -1,12 +1,23 @@
 import os
+import subprocess
+import sys
 from pprint import pprint
 from unittest import skipIf
 
-from groom.lexer import Lexer
-from groom.parser import Parser
+import ply.yacc as yacc
+import pytest
+
+from groom import parser as parser_module, parsetab
+from groom.lexer import BufferLexer, Lexer, SymbolTable, lex_raw, reserved
+from groom.lexer import iter_tokens
+from groom.parser import Parser, grammar_signature
+from groom.tokenbuffer import TokenBuffer
+from groom.tokencache import TokenCache
 from groom.ast import nodes
 from groom.utils import find_pony_stdlib_path
 
+from tests.bench import bench, best_times, traced_memory
+
 
 parsers_cache = {}
 
@@ -749,6 +760,40 @@ def test_binary_partial_op():
     parse_code(data, expected, verbose=VERBOSE, start='infix')
 
 
+def test_operator_chain():
+    data = """
+        a - 1 as U8 is b = c -? d
+    """
+    ref = lambda name: {'id': {'id': name, 'node_type': 'id'},
+                        'node_type': 'reference'}
+    expected = {
+        'first': {'first': {'node_type': 'as',
+                            'term': {'first': ref('a'),
+                                     'is_partial': False,
+                                     'node_type': '-',
+                                     'operator': '-',
+                                     'second': {'node_type': 'int',
+                                                'value': '1'}},
+                            'type': {'cap': None,
+                                     'cap_modifier': None,
+                                     'id': {'id': 'U8', 'node_type': 'id'},
+                                     'node_type': 'nominal',
+                                     'package': None,
+                                     'typeargs': []}},
+                  'is_partial': False,
+                  'node_type': 'is',
+                  'operator': 'is',
+                  'second': ref('b')},
+        'node_type': '=',
+        'second': {'first': ref('c'),
+                   'is_partial': True,
+                   'node_type': '-',
+                   'operator': '-',
+                   'second': ref('d')}
+    }
+    parse_code(data, expected, verbose=VERBOSE, start='infix')
+
+
 def test_try():
     data = """
         try 1 +? 2 end
@@ -1326,6 +1371,225 @@ def test_parse_file():
         parse_code(src.read(), verbose=True)
 
 
+def test_parse_type_ids():
+    data = """
+        primitive Foo
+          fun apply(x: U8): String =>
+            if x > 2 then "big" else (x - 1).string() end
+    """
+    parser = parsers_cache.setdefault((), Parser())
+    expected = parser.parse(data, lexer=Lexer()).as_dict()
+    result = parser.parse(data, lexer=Lexer(int_types=True)).as_dict()
+    assert(result == expected)
+
+
+def test_parse_bytes():
+    data = """
+        primitive Foo
+          fun apply(x: U8): String =>
+            "h\u00e9llo " + x.string()
+    """
+    parser = parsers_cache.setdefault((), Parser())
+    expected = parser.parse(data, lexer=Lexer()).as_dict()
+    result = parser.parse(data.encode(), lexer=Lexer()).as_dict()
+    assert(result == expected)
+
+
+# the peak RSS of the parse alone: reset once the parse tables are loaded
+PEAK_RSS = """
+import sys
+from groom.lexer import Lexer
+from groom.parser import Parser
+
+def status(field):
+    with open("/proc/self/status") as status:
+        return [int(l.split()[1]) for l in status if l.startswith(field)][0]
+
+parser = Parser()
+parser.parse("actor Main", lexer=Lexer())
+with open("/proc/self/clear_refs", "w") as clear_refs:
+    clear_refs.write("5")
+rss = status("VmRSS:")
+with open(sys.argv[1], sys.argv[2]) as src:
+    parser.parse(src, lexer=Lexer())
+print(status("VmHWM:") - rss)
+"""
+
+
+def parsing_peak_rss(path, mode):
+    """peak RSS growth in kB of a process parsing the file at ``path``"""
+    result = subprocess.run(
+        [sys.executable, "-c", PEAK_RSS, str(path), mode], check=True,
+        cwd=os.path.dirname(os.path.dirname(parser_module.__file__)),
+        stdout=subprocess.PIPE, universal_newlines=True)
+    return int(result.stdout)
+
+
+@bench
+@skipIf(not os.path.exists("/proc/self/clear_refs"), "linux only")
+def test_bench_mapped_file_memory(tmp_path):
+    # mostly comments, so that the source outweighs its tree, and large
+    # enough for the allocations of the text to get their own pages
+    comment = "// " + "x" * 76 + "\n"
+    path = tmp_path / "big.pony"
+    path.write_text("".join(
+        comment * 5000 + "actor Main{}\n  let x: U32 = {}\n".format(i, i)
+        for i in range(100)))
+    size = path.stat().st_size // 1024
+    text_peak = parsing_peak_rss(path, "r")
+    mapped_peak = parsing_peak_rss(path, "rb")
+    print("{}kB source, peak RSS growth: text {}kB, mmap {}kB".format(
+        size, text_peak, mapped_peak))
+    # the text is read then decoded, the mapped pages are read in place
+    assert(mapped_peak + size // 2 < text_peak)
+
+
+def test_parse_token_buffer(tmpdir):
+    data = """
+        actor Main
+          new create(env: Env) =>
+            /* comment */ env.out.print("h\u00e9llo " + (1 - 2).string())
+    """
+    parser = parsers_cache.setdefault((), Parser())
+    expected = parser.parse(data, lexer=Lexer()).as_dict()
+    cache = TokenCache(str(tmpdir))
+    for tokens in (TokenBuffer.lex(data), TokenBuffer.lex(data.encode()),
+                   BufferLexer(data.encode()), cache.lex(data),
+                   cache.lex(data), lex_raw(data),
+                   lex_raw(data, engine="native")):
+        assert(parser.parse(tokens).as_dict() == expected)
+    lexer = Lexer()
+    lexer.input(data)
+    tokens = list(iter_tokens(lex_raw(data)))
+    for lexed in (lexer, tokens, tokens, (t for t in TokenBuffer.lex(data))):
+        assert(parser.parse(lexed).as_dict() == expected)
+    lexer.input(data)
+    tree = parser.parse(tokenfunc=lexer.token)
+    assert(tree.as_dict() == expected)
+    with pytest.raises(TypeError):
+        parser.parse(data, tokenfunc=lexer.token)
+
+
+def test_parse_newlines():
+    data = """
+        actor Main
+          new create(env: Env) =>
+            foo
+            (1, 2)
+            bar(3)
+            x
+            -1
+            y - 1
+            z
+            -~3
+            let w =
+              [1; 2]
+            w
+            [as U8: 3]
+            if w then
+              (6, 7)
+            end
+            return
+              -5
+    """
+    parser = parsers_cache.setdefault((), Parser())
+    result = parser.parse(data, lexer=Lexer()).as_dict()
+    body = result["class_defs"][0]["members"][0]["body"]["seq"]
+    assert([e["node_type"] for e in body] == [
+        "reference", "tuple", "call", "reference", "neg", "-", "reference",
+        "neg_unsafe", "=", "reference", "array", "if", "return"])
+    for tokens in (TokenBuffer.lex(data), BufferLexer(data.encode()),
+                   Lexer(engine="native")):
+        if isinstance(tokens, Lexer):
+            assert(parser.parse(data, lexer=tokens).as_dict() == result)
+        else:
+            assert(parser.parse(tokens).as_dict() == result)
+    # trailing whitespace does not hide the newline (the *_NEW rules only
+    # matched a newline right after the previous token)
+    trailing = data.replace("foo\n", "foo  \n").replace("x\n", "x\t\n")
+    trailing = trailing.replace("w\n", "w \n")
+    assert(trailing.count(" \n") == 2 and "\t\n" in trailing)
+    assert(parser.parse(trailing, lexer=Lexer()).as_dict() == result)
+    # after a partial operator or a recover capability, a minus starting a
+    # line is still a prefix
+    for expression, one_line in [("a +?\n  -1", "a +? -1"),
+                                 ("a *?\n  -~a", "a *? -~a"),
+                                 ("recover val\n  -a\n end",
+                                  "recover val -a end")]:
+        method = "primitive P\n  fun f() =>\n    {}\n"
+        result = parser.parse(method.format(expression), lexer=Lexer())
+        assert(result.class_defs)
+        assert(result.as_dict() == parser.parse(
+            method.format(one_line), lexer=Lexer()).as_dict())
+
+
+@bench
+def test_bench_parse_token_buffer():
+    data = """
+        actor Main
+          new create(env: Env) =>
+            let x: U32 = (1 + 2) * 3
+            env.out.print("x " + x.string())
+    """ * 200
+    parser = parsers_cache.setdefault((), Parser())
+    buffer = TokenBuffer.lex(data)
+    source, buffered = best_times(lambda: parser.parse(data, lexer=Lexer()),
+                                  lambda: parser.parse(buffer))
+    print("parse from source {:.4f}s, from a TokenBuffer {:.4f}s".format(
+        source, buffered))
+    assert(parser.parse(buffer).as_dict() ==
+           parser.parse(data, lexer=Lexer()).as_dict())
+    assert(buffered < source)
+
+
+class Uninterned(SymbolTable):
+    "classifies words like SymbolTable, but does not keep identifiers"
+    def __missing__(self, word):
+        return ("ID", word)
+
+
+def parse_stdlib(parser, symbols):
+    trees = []
+    for root, _, files in os.walk(find_pony_stdlib_path()):
+        for ponysrc in [f for f in files if f.endswith(".pony")]:
+            with open(os.path.join(root, ponysrc)) as src:
+                trees.append(parser.parse(src.read(),
+                                          lexer=Lexer(symbols=symbols)))
+    return trees
+
+
+@skipIf(os.environ.get("SHORT_TESTS", 0), "perform short tests")
+def test_bench_interning():
+    parser = parsers_cache.setdefault((), Parser())
+    symbols = SymbolTable()
+    # warm up the lexer and the parser, and fill the table: only the trees
+    # are measured
+    parse_stdlib(parser, symbols)
+    plain_trees, plain_size, _ = traced_memory(
+        lambda: parse_stdlib(parser, Uninterned()))
+    trees, size, _ = traced_memory(lambda: parse_stdlib(parser, symbols))
+    print("stdlib trees: interned {} bytes, not interned {} bytes".format(
+        size, plain_size))
+    assert([t.as_dict() for t in trees] ==
+           [t.as_dict() for t in plain_trees])
+    assert(size < plain_size)
+
+    words = [word for word in symbols] * 10
+
+    def classify_reserved():
+        for word in words:
+            reserved.get(word, "ID")
+
+    def classify_symbols():
+        for word in words:
+            symbols[word]
+
+    reserved_time, symbols_time = best_times(classify_reserved,
+                                             classify_symbols)
+    print("word classification: reserved.get {:.4f}s, "
+          "symbol table {:.4f}s".format(reserved_time, symbols_time))
+
+
 @skipIf(os.environ.get("SHORT_TESTS", 0), "perform short tests")
 def test_parse_stdlib():
     path = find_pony_stdlib_path()
@@ -1337,3 +1601,124 @@ def test_parse_stdlib():
                 data = src.read()
                 tree = parser.parse(data, lexer=Lexer(), debug=VERBOSE)
                 tree.as_dict()
+
+
+def test_parsetab_up_to_date():
+    # run `python -m groom.parser` after changing the grammar
+    assert(parsetab._signature == grammar_signature())
+
+
+def test_parse_tables_shared():
+    first, second = Parser(), Parser()
+    assert(first._parser is not second._parser)
+    assert(first._parser.action is second._parser.action)
+    assert(first._parser.action is parsetab._lr_action)
+    assert(Parser(start="term")._parser.action is first._parser.action)
+
+
+def test_parse_tables_not_written(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    package = os.path.dirname(parser_module.__file__)
+    files = sorted(os.listdir(package))
+    Parser(start="nextinfix")
+    assert(sorted(os.listdir(package)) == files)
+    assert(os.listdir(str(tmpdir)) == [])
+
+
+def test_parse_tables_lazy():
+    code = ("import sys, groom.parser; "
+            "assert 'groom.parsetab' not in sys.modules; "
+            "groom.parser.Parser(); "
+            "assert 'groom.parsetab' in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=os.path.dirname(os.path.dirname(parser_module.__file__)))
+
+
+@bench
+def test_bench_parse_tables():
+    read, built = best_times(
+        parser_module._read_parsetab,
+        # a start symbol defeats the tables of groom.parsetab
+        lambda: yacc.yacc(module=parser_module, start="module", debug=False,
+                          write_tables=False, errorlog=yacc.NullLogger()),
+        runs=3)
+    print("parse tables: read {:.4f}s, built {:.4f}s".format(read, built))
+    assert(read * 10 < built)
+
+
+def test_entry_points():
+    data = """
+        class Foo
+          let x: (U8 | None) = None
+          fun apply(y: U8): U8 =>
+            let z = y + 1
+            z * 2
+    """
+    parser = parsers_cache.setdefault((), Parser())
+    cls = parser.parse(data, lexer=Lexer()).class_defs[0]
+    assert(parser.parse_class(data, lexer=Lexer()).as_dict() ==
+           cls.as_dict())
+    field, method = cls.members
+    assert(parser.parse_type("(U8 | None)").as_dict() ==
+           field.type.as_dict())
+    body = """
+            let z = y + 1
+            z * 2
+    """
+    assert(parser.parse_expression(body).as_dict() == method.body.as_dict())
+    assert(parser.parse(TokenBuffer.lex(body), start="rawseq").as_dict() ==
+           method.body.as_dict())
+    assert(Parser(start="rawseq").parse(body).as_dict() ==
+           method.body.as_dict())
+    with pytest.raises(ValueError):
+        parser.parse(body, start="nextinfix")
+
+
+# sources with n methods, match cases, operators and expressions
+long_lists = {
+    "methods": lambda n: "class C\n" + "".join(
+        "  fun f{}(): U8 => {}\n".format(i, i) for i in range(n)),
+    "cases": lambda n: (
+        "primitive P\n  fun f(x: U32): U32 =>\n    match x\n" +
+        "".join("    | {} => {}\n".format(i, i) for i in range(n)) +
+        "    else 0\n    end\n"),
+    "operators": lambda n: (
+        "primitive P\n  fun f(x: U32): U32 =>\n    x" +
+        "".join(" + {}".format(i) for i in range(n)) + "\n"),
+    "expressions": lambda n: "primitive P\n  fun f(x: U32) =>\n" + "".join(
+        "    x.g({})\n".format(i) for i in range(n)),
+}
+
+
+class StackDepths(object):
+    "the tokens of a source, recording the depth of the parser stack"
+    def __init__(self, parser, source):
+        self.parser = parser
+        self.tokens = TokenBuffer.lex(source)
+        self.depths = []
+
+    def iter_tokens(self, *args):
+        for token in self.tokens.iter_tokens(*args):
+            self.depths.append(len(self.parser._parser.statestack))
+            yield token
+
+
+def test_long_lists():
+    parser = Parser()
+    for name, source in long_lists.items():
+        short, long = (StackDepths(parser, source(n)) for n in (10, 1000))
+        assert(parser.parse(short).as_dict() ==
+               parser.parse(source(10), lexer=Lexer()).as_dict())
+        parser.parse(long)
+        # the lists grow on the left, not on the stack
+        assert(max(long.depths) == max(short.depths))
+
+
+@bench
+def test_bench_long_lists():
+    parser = parsers_cache.setdefault((), Parser())
+    for name, source in long_lists.items():
+        for n in (2000, 8000):
+            tokens = TokenBuffer.lex(source(n))
+            elapsed, = best_times(lambda: parser.parse(tokens), runs=3)
+            print("{} {}: {:.4f}s".format(n, name, elapsed))
@@ -0,0 +1,36 @@
+from groom.lexer import Lexer
+from groom.tokenbuffer import TokenBuffer
+
+from tests.bench import traced_memory
+from tests.test_lexer import as_tuples, pony_module
+
+
+def lexer_tokens(data):
+    lexer = Lexer()
+    lexer.input(data)
+    return list(lexer)
+
+
+def test_buffer():
+    buffer = TokenBuffer.lex(pony_module)
+    expected = as_tuples(lexer_tokens(pony_module))
+    assert(len(buffer) == len(expected))
+    assert(as_tuples(buffer) == expected)
+    assert(as_tuples(buffer[i] for i in range(len(buffer))) == expected)
+    assert(as_tuples(buffer[-3:]) == expected[-3:])
+    assert((buffer.type(-1), buffer.value(-1)) == expected[-1][:2])
+
+
+def test_buffer_bytes():
+    buffer = TokenBuffer.lex(pony_module.encode())
+    assert(as_tuples(buffer) == as_tuples(lexer_tokens(pony_module)))
+
+
+def test_bench_buffer_memory():
+    data = pony_module * 100
+    tokens, tokens_size, _ = traced_memory(lambda: lexer_tokens(data))
+    buffer, buffer_size, _ = traced_memory(lambda: TokenBuffer.lex(data))
+    print("bytes per token: LexToken {:.1f}, TokenBuffer {:.1f}".format(
+        tokens_size / len(tokens), buffer_size / len(buffer)))
+    assert(len(tokens) == len(buffer))
+    assert(buffer_size * 10 < tokens_size)
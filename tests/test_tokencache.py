@@ -0,0 +1,107 @@
+import os
+
+from groom.lexer import Lexer, lex_raw, reserved
+from groom.tokencache import TokenCache
+
+from tests.bench import bench, best_times
+from tests.test_lexer import as_tuples, pony_module
+
+
+def cache_files(cache):
+    return sorted(name for name in os.listdir(cache.path)
+                  if name.endswith(".tok"))
+
+
+def test_replay(tmpdir):
+    cache = TokenCache(str(tmpdir))
+    expected = as_tuples(lex_raw(pony_module))
+    for source in (pony_module, pony_module.encode()):
+        assert(as_tuples(lex_raw(source, cache=cache)) == expected)
+        assert(as_tuples(lex_raw(source, cache=cache)) == expected)
+    assert((cache.hits, cache.misses) == (2, 2))
+    assert(len(cache_files(cache)) == 2)
+    assert(as_tuples(TokenCache(str(tmpdir)).lex(pony_module)) == expected)
+
+
+def test_lexer_cache(tmpdir):
+    cache = TokenCache(str(tmpdir))
+    lexer = Lexer()
+    lexer.input(pony_module)
+    expected = as_tuples(lexer)
+    for i in range(2):
+        lexer = Lexer(cache=cache)
+        lexer.input(pony_module)
+        assert(as_tuples(lexer) == expected)
+    assert(cache.hits == 1)
+    empty = Lexer(cache=cache)
+    empty.input("")
+    assert(list(empty) == [])
+    empty.input("")
+    assert(list(empty) == [])
+
+
+def test_reserved_words_change_version(tmpdir, monkeypatch):
+    TokenCache(str(tmpdir)).lex(pony_module)
+    # a new keyword of an existing type
+    monkeypatch.setitem(reserved, "daemon", "CLASS_DECL")
+    cache = TokenCache(str(tmpdir))
+    cache.lex(pony_module)
+    assert((cache.hits, cache.misses) == (0, 1))
+
+
+def test_invalid_file(tmpdir):
+    cache = TokenCache(str(tmpdir))
+    cache.lex(pony_module)
+    name, = cache_files(cache)
+    with open(os.path.join(cache.path, name), "r+b") as cached:
+        cached.truncate(20)
+    expected = as_tuples(lex_raw(pony_module))
+    assert(as_tuples(cache.lex(pony_module)) == expected)
+    assert(cache.misses == 2)
+    assert(as_tuples(cache.lex(pony_module)) == expected)
+    assert(cache.hits == 1)
+
+
+def test_eviction(tmpdir):
+    cache = TokenCache(str(tmpdir))
+    sources = ["actor {}".format(name) for name in "ABCDE"]
+    for source in sources:
+        cache.lex(source)
+    for i, source in enumerate(sources):
+        os.utime(os.path.join(cache.path, cache.key(source) + ".tok"),
+                 (i, 100 if i == 0 else i))
+    size = os.path.getsize(os.path.join(cache.path, cache_files(cache)[0]))
+    cache.max_size = 3 * size
+    cache.evict()
+    assert(cache_files(cache) == sorted(
+        cache.key(source) + ".tok" for source in sources[:1] + sources[3:]))
+    cache.lex(sources[0])
+    cache.lex(sources[1])
+    assert((cache.hits, cache.misses) == (1, 6))
+    assert(len(cache_files(cache)) == 3)
+
+
+def test_errors_not_cached(tmpdir):
+    cache = TokenCache(str(tmpdir))
+    for i in range(2):
+        diagnostics = []
+        lexer = Lexer(cache=cache, diagnostics=diagnostics)
+        lexer.input("actor $ Main")
+        assert([t.type for t in lexer] == ["CLASS_DECL", "LEXERROR", "ID"])
+        assert(len(diagnostics) == 1)
+    assert((cache.hits, cache.misses) == (0, 2))
+    assert(cache_files(cache) == [])
+
+
+@bench
+def test_bench_replay(tmpdir):
+    cache = TokenCache(str(tmpdir))
+    data = pony_module * 200
+    cache.lex(data)
+    lexing, replay = best_times(lambda: list(lex_raw(data)),
+                                lambda: list(lex_raw(data, cache=cache)),
+                                runs=3)
+    print("lexing {:.4f}s, replay {:.4f}s".format(lexing, replay))
+    assert(len(list(lex_raw(data))) ==
+           len(list(lex_raw(data, cache=cache))))
+    assert(replay < lexing)